@@ -25,22 +25,37 @@
 """Loan Calculator"""
 
 from loan_calculator.loan import Loan
+from loan_calculator.floating import DailyRateSeries, FloatingRateLoan
+from loan_calculator.inflation import IndexedLoan, PriceIndexSeries
 from loan_calculator.utils import display_summary
 from loan_calculator.grossup.iof import IofGrossup
 from loan_calculator.projection import Projection
+from loan_calculator.quote import Quote
+from loan_calculator.prepayment import Prepayment, ReamortizationType
 from loan_calculator.schedule.base import AmortizationScheduleType
 from loan_calculator.grossup.base import GrossupType
 from loan_calculator.interest_rate import (
-    convert_to_daily_interest_rate, InterestRateType, YearSizeType
+    convert_to_daily_interest_rate,
+    convert_to_daily_interest_rates,
+    InterestRateType,
+    YearSizeType,
 )
 
 __all__ = [
     'Loan',
+    'FloatingRateLoan',
+    'DailyRateSeries',
+    'IndexedLoan',
+    'PriceIndexSeries',
     'IofGrossup',
     'Projection',
+    'Quote',
+    'Prepayment',
+    'ReamortizationType',
     'AmortizationScheduleType',
     'GrossupType',
     'convert_to_daily_interest_rate',
+    'convert_to_daily_interest_rates',
     'InterestRateType',
     'display_summary',
     'YearSizeType',
@@ -0,0 +1,243 @@
+"""Vectorized amortization schedules for portfolios of loans.
+
+The schedules in :mod:`loan_calculator.schedule` are evaluated one loan at a
+time. This module implements the very same closed formulas over
+struct-of-arrays inputs, so that a whole portfolio is evaluated in a single
+NumPy pass.
+
+The results agree with the scalar schedule classes up to floating point
+rounding, i.e., with a relative tolerance of :math:`10^{-9}` (see
+`BATCH_RELATIVE_TOLERANCE`).
+
+This module depends on NumPy, which is an optional dependency of this
+library and can be installed with ``pip install loan_calculator[numpy]``.
+"""
+
+import numpy as np
+
+from loan_calculator.schedule.base import AmortizationScheduleType
+
+
+BATCH_RELATIVE_TOLERANCE = 1e-9
+
+SCHEDULE_TYPE_CODE_MAP = {
+    AmortizationScheduleType.progressive_price_schedule: 0,
+    AmortizationScheduleType.regressive_price_schedule: 1,
+    AmortizationScheduleType.constant_amortization_schedule: 2,
+}
+
+
+def _schedule_type_code(schedule_type):
+
+    # booleans are integers, but not schedule type codes
+    if (
+        isinstance(schedule_type, (int, np.integer)) and
+        not isinstance(schedule_type, bool)
+    ):
+        if schedule_type not in SCHEDULE_TYPE_CODE_MAP.values():
+            raise ValueError('Unknown schedule type code')
+        return int(schedule_type)
+
+    schedule_type = AmortizationScheduleType(schedule_type)
+
+    if schedule_type not in SCHEDULE_TYPE_CODE_MAP:
+        raise ValueError('Schedule type is not supported in batches')
+
+    return SCHEDULE_TYPE_CODE_MAP[schedule_type]
+
+
+def _pad_return_days(return_days, num_instalments):
+    """Build a padded return days matrix and the number of instalments."""
+
+    if num_instalments is not None:
+        return (
+            np.asarray(return_days, dtype=np.int64),
+            np.asarray(num_instalments, dtype=np.int64),
+        )
+
+    if isinstance(return_days, np.ndarray) and return_days.ndim == 2:
+        return (
+            return_days.astype(np.int64),
+            np.full(return_days.shape[0], return_days.shape[1], np.int64)
+        )
+
+    num_instalments = np.array([len(r) for r in return_days], np.int64)
+
+    padded = np.zeros(
+        (len(num_instalments), num_instalments.max(initial=0)), np.int64
+    )
+    for i, r_days in enumerate(return_days):
+        padded[i, :len(r_days)] = r_days
+
+    return padded, num_instalments
+
+
+class BatchSchedule(object):
+    """Amortization schedules for a batch of loans.
+
+    The `i`-th loan of the batch is described by the `i`-th entry of each
+    parameter. Its schedule is the one of the scalar class associated with
+    its schedule type, e.g., `ProgressivePriceSchedule` for
+    `AmortizationScheduleType.progressive_price_schedule`.
+
+    The output columns are two dimensional arrays with a row for each loan.
+    Rows of loans with less instalments than the widest loan in the batch are
+    padded with zeros, so that totals can be taken directly along the rows.
+
+    Parameters
+    ----------
+    principals: array_like, required
+        Loans' principals, with shape `(N,)`.
+    daily_interest_rates: array_like, required
+        Loans' daily interest rates, with shape `(N,)`.
+    return_days: array_like or list of lists, required
+        Either a `(N, K)` matrix of increasing return days (padded after the
+        last instalment of each loan) or a ragged list with the return days
+        of each loan.
+    schedule_types: array_like, required
+        Schedule type of each loan, either as `AmortizationScheduleType`
+        members (or their values) or as codes from `SCHEDULE_TYPE_CODE_MAP`.
+    num_instalments: array_like, optional
+        Number of instalments of each loan, with shape `(N,)`. Only needed
+        when `return_days` is a padded matrix with rows of different lengths.
+        (default None)
+
+    Raises
+    ------
+    ValueError
+        If the return days of some loan are not increasing, some loan does
+        not have any instalment, some number of instalments exceeds the width
+        of the return days matrix or some schedule type is unknown.
+    """
+
+    def __init__(
+        self,
+        principals,
+        daily_interest_rates,
+        return_days,
+        schedule_types,
+        num_instalments=None,
+    ):
+        """Initialize batch schedule."""
+
+        self.principals = np.asarray(principals, dtype=np.float64)
+        self.daily_interest_rates = np.asarray(
+            daily_interest_rates, dtype=np.float64
+        )
+        self.return_days, self.num_instalments = _pad_return_days(
+            return_days, num_instalments
+        )
+        self.schedule_types = np.array(
+            [_schedule_type_code(t) for t in schedule_types], np.int64
+        )
+
+        if np.any(self.num_instalments < 1):
+            raise ValueError('Every loan must have at least one instalment.')
+
+        if np.any(self.num_instalments > self.return_days.shape[1]):
+            raise ValueError(
+                'Number of instalments exceeds the return days given.'
+            )
+
+        # entry (i, j) is True iff j is an instalment of the i-th loan
+        self.mask = (
+            np.arange(self.return_days.shape[1])
+            < self.num_instalments[:, None]
+        )
+        self.return_days = np.where(self.mask, self.return_days, 0)
+
+        if np.any(np.diff(self.return_days, axis=1)[self.mask[:, 1:]] <= 0):
+            raise ValueError('Return days must be increasing.')
+
+        self._evaluate()
+
+    def _evaluate(self):
+
+        # variables are renamed to make the math more explicit
+        s = self.principals[:, None]
+        d = self.daily_interest_rates[:, None]
+        n = self.return_days
+        k = self.num_instalments[:, None]
+        mask = self.mask
+        rows = np.arange(n.shape[0])[:, None]
+
+        # (1 + d)^n_j and 1 / (1 + d)^n_j, vanishing outside the schedule
+        growth = np.where(mask, (1 + d) ** n, 0.0)
+        discount = np.where(mask, 1.0 / (1 + d) ** n, 0.0)
+
+        prefix = np.cumsum(discount, axis=1)
+        transport = prefix[rows[:, 0], self.num_instalments - 1][:, None]
+
+        pmt = s / transport
+
+        # j -> k - j + 1, used to reverse the progressive Price columns
+        reversed_index = np.where(mask, k - 1 - np.arange(n.shape[1]), 0)
+        reversed_discount = np.where(
+            mask, discount[rows, reversed_index], 0.0
+        )
+
+        is_progressive = (self.schedule_types == 0)[:, None]
+        is_regressive = (self.schedule_types == 1)[:, None]
+        is_constant = (self.schedule_types == 2)[:, None]
+
+        # Price schedules
+        price_balance = np.where(
+            mask, s * growth * (1 - prefix / transport), 0.0
+        )
+        price_amortizations = np.where(
+            is_progressive, pmt * reversed_discount, pmt * discount
+        )
+        price_interest = np.where(
+            mask,
+            np.where(
+                is_progressive,
+                pmt * (1.0 - reversed_discount),
+                pmt * (1.0 - discount)
+            ),
+            0.0
+        )
+        price_payments = np.where(mask, pmt, 0.0)
+
+        # constant amortization schedule
+        index = np.arange(1, n.shape[1] + 1)
+        constant_balance = np.where(mask, s * (1 - index / k), 0.0)
+        constant_amortizations = np.where(mask, s / k, 0.0)
+        previous_balance = np.hstack([s, constant_balance[:, :-1]])
+        previous_days = np.hstack([np.zeros_like(n[:, :1]), n[:, :-1]])
+        constant_interest = np.where(
+            mask,
+            previous_balance * ((1 + d) ** (n - previous_days) - 1),
+            0.0
+        )
+        constant_payments = constant_interest + constant_amortizations
+
+        is_price = is_progressive | is_regressive
+
+        self.balance = np.hstack([
+            np.broadcast_to(s, (n.shape[0], 1)),
+            np.where(is_constant, constant_balance, price_balance),
+        ])
+        self.amortizations = np.where(
+            is_price, price_amortizations, constant_amortizations
+        )
+        self.interest_payments = np.where(
+            is_price, price_interest, constant_interest
+        )
+        self.due_payments = np.where(
+            is_price, price_payments, constant_payments
+        )
+
+    def __len__(self):
+        return self.principals.shape[0]
+
+    @property
+    def total_paid(self):
+        return self.due_payments.sum(axis=1)
+
+    @property
+    def total_amortization(self):
+        return self.amortizations.sum(axis=1)
+
+    @property
+    def total_interest(self):
+        return self.interest_payments.sum(axis=1)
@@ -0,0 +1,320 @@
+"""Business day calendars and generation of return dates.
+
+A `BusinessCalendar` precomputes, once for its whole range of dates, which
+days are business days, the business day each date is rolled to and the
+cumulative count of business days. Every lookup is then a single indexing
+operation over these tables.
+"""
+
+from array import array
+from calendar import monthrange
+from datetime import date, timedelta
+from enum import Enum
+
+from loan_calculator.ordinals import EPOCH_ORDINAL, to_ordinal, to_ordinals
+
+
+class RollingConvention(Enum):
+
+    following = 'following'
+    modified_following = 'modified-following'
+    preceding = 'preceding'
+
+
+class Frequency(Enum):
+
+    monthly = 'monthly'
+    biweekly = 'biweekly'
+
+
+def _add_months(day, months):
+    """Add months to a date, clamping the day to the end of the month."""
+
+    month_index = day.year * 12 + day.month - 1 + months
+    year, month = divmod(month_index, 12)
+
+    return date(
+        year, month + 1, min(day.day, monthrange(year, month + 1)[1])
+    )
+
+
+class BusinessCalendar(object):
+    """Business day calendar backed by precomputed lookup tables.
+
+    For every day in the calendar's range, the following tables are built
+
+    *   `bitmap`, with 1 for business days and 0 for weekends and holidays,
+    *   `following` and `preceding`, with the ordinal of the first business
+        day on or after (respectively, on or before) each day, and
+    *   `cumulative`, with the number of business days from the start of the
+        calendar until each day (exclusive),
+
+    so that checking, rolling and counting business days cost :math:`O(1)`.
+    Dates are handled as ordinals (see `ordinals`) and methods accept dates,
+    ordinals or `numpy.datetime64` values.
+
+    Parameters
+    ----------
+    holidays : iterable, optional
+        Holidays observed by the calendar. (default ())
+    start_date : date, optional
+        First date covered by the calendar. (default date(1970, 1, 1))
+    end_date : date, optional
+        Last date covered by the calendar. (default date(2099, 12, 31))
+    weekend : tuple, optional
+        Week days (as in `date.weekday`) which are not business days.
+        (default (5, 6), i.e., saturday and sunday)
+    """
+
+    def __init__(
+        self,
+        holidays=(),
+        start_date=date(1970, 1, 1),
+        end_date=date(2099, 12, 31),
+        weekend=(5, 6),
+    ):
+        """Initialize calendar."""
+
+        self.first_ordinal = to_ordinal(start_date)
+        self.last_ordinal = to_ordinal(end_date)
+
+        size = self.last_ordinal - self.first_ordinal + 1
+
+        # date(1, 1, 1), the ordinal 1, was a monday
+        self.bitmap = bytearray(
+            0 if (self.first_ordinal + i - 1) % 7 in weekend else 1
+            for i in range(size)
+        )
+
+        for holiday in holidays:
+            index = to_ordinal(holiday) - self.first_ordinal
+            if 0 <= index < size:
+                self.bitmap[index] = 0
+
+        # days out of the calendar's range are rolled to the sentinels
+        # first_ordinal - 1 and last_ordinal + 1
+        self.following = array('l', [0]) * size
+        self.preceding = array('l', [0]) * size
+        self.cumulative = array('l', [0]) * (size + 1)
+
+        next_business_day = self.last_ordinal + 1
+        for i in range(size - 1, -1, -1):
+            if self.bitmap[i]:
+                next_business_day = self.first_ordinal + i
+            self.following[i] = next_business_day
+
+        previous_business_day = self.first_ordinal - 1
+        for i in range(size):
+            if self.bitmap[i]:
+                previous_business_day = self.first_ordinal + i
+            self.preceding[i] = previous_business_day
+            self.cumulative[i + 1] = self.cumulative[i] + self.bitmap[i]
+
+    def _index(self, day):
+
+        index = to_ordinal(day) - self.first_ordinal
+
+        if not 0 <= index <= self.last_ordinal - self.first_ordinal:
+            raise ValueError('Date out of the calendar range.')
+
+        return index
+
+    def _checked(self, ordinal):
+
+        if not self.first_ordinal <= ordinal <= self.last_ordinal:
+            raise ValueError('Date out of the calendar range.')
+
+        return ordinal
+
+    def is_business_day(self, day):
+        """Check whether the given day is a business day."""
+        return bool(self.bitmap[self._index(day)])
+
+    def roll(self, day, convention=RollingConvention.following.value):
+        """Roll the given day to a business day.
+
+        Parameters
+        ----------
+        day : date, required
+            Day to be rolled. It can also be an ordinal or a
+            `numpy.datetime64`.
+        convention : str, optional
+            Rolling convention. The modified following convention rolls to
+            the following business day unless it falls in another month, in
+            which case the preceding business day is taken.
+            (default RollingConvention.following.value)
+
+        Returns
+        -------
+        int
+            Ordinal of the rolled business day.
+        """
+
+        convention = RollingConvention(convention)
+        index = self._index(day)
+
+        if convention is RollingConvention.preceding:
+            return self._checked(self.preceding[index])
+
+        rolled = self._checked(self.following[index])
+
+        if convention is RollingConvention.modified_following:
+            original = date.fromordinal(self.first_ordinal + index)
+            if date.fromordinal(rolled).month != original.month:
+                rolled = self._checked(self.preceding[index])
+
+        return rolled
+
+    def next_business_day(self, day):
+        """Ordinal of the first business day strictly after the given day."""
+        return self._checked(self.following[self._index(to_ordinal(day) + 1)])
+
+    def business_days_between(self, start_date, end_date):
+        """Count business days from `start_date` until `end_date`.
+
+        The start date is included in the count, while the end date is not,
+        so that the count is additive over consecutive periods.
+        """
+
+        return (
+            self.cumulative[self._index(end_date)] -
+            self.cumulative[self._index(start_date)]
+        )
+
+    def return_dates(
+        self,
+        start_date,
+        num_instalments,
+        frequency=Frequency.monthly.value,
+        convention=RollingConvention.modified_following.value,
+    ):
+        """Generate rolled return dates for a single contract.
+
+        Monthly return dates keep the start date's day of the month (clamped
+        to the end of shorter months), while biweekly return dates are spaced
+        by 14 days. Each of them is then rolled to a business day.
+
+        Returns
+        -------
+        list
+            List of `date` objects.
+        """
+
+        frequency = Frequency(frequency)
+        start_date = date.fromordinal(to_ordinal(start_date))
+
+        if frequency is Frequency.monthly:
+            unrolled = [
+                _add_months(start_date, i)
+                for i in range(1, num_instalments + 1)
+            ]
+        else:
+            unrolled = [
+                start_date + timedelta(14 * i)
+                for i in range(1, num_instalments + 1)
+            ]
+
+        return [
+            date.fromordinal(self.roll(day, convention)) for day in unrolled
+        ]
+
+    def generate_return_ordinals(
+        self,
+        start_dates,
+        num_instalments,
+        frequency=Frequency.monthly.value,
+        convention=RollingConvention.modified_following.value,
+        offsets=False,
+    ):
+        """Generate rolled return dates for many contracts at once.
+
+        This is the vectorized counterpart of `return_dates`: the dates of
+        all contracts are generated and rolled with NumPy array operations
+        over the calendar's lookup tables, which are viewed without copies.
+        This method requires NumPy, which is an optional dependency.
+
+        Parameters
+        ----------
+        start_dates : array_like, required
+            Start dates of the contracts, as a `numpy.datetime64` array or as
+            a sequence of dates or ordinals, with shape `(N,)`.
+        num_instalments : int, required
+            Number of return dates of each contract.
+        frequency : str, optional
+            (default Frequency.monthly.value)
+        convention : str, optional
+            (default RollingConvention.modified_following.value)
+        offsets : bool, optional
+            Whether to return the number of days since each start date
+            instead of ordinals. (default False)
+
+        Returns
+        -------
+        numpy.ndarray
+            Integer array with shape `(N, num_instalments)`.
+        """
+
+        import numpy as np
+
+        frequency = Frequency(frequency)
+        convention = RollingConvention(convention)
+
+        starts = np.asarray(to_ordinals(start_dates), dtype=np.int64)
+        instalments = np.arange(1, num_instalments + 1)
+
+        if frequency is Frequency.monthly:
+            start_days = (starts - EPOCH_ORDINAL).astype('datetime64[D]')
+            start_months = start_days.astype('datetime64[M]')
+            day_of_month = (
+                start_days - start_months.astype('datetime64[D]')
+            ).astype(np.int64)
+
+            months = start_months[:, None] + instalments
+            month_sizes = (
+                (months + 1).astype('datetime64[D]') -
+                months.astype('datetime64[D]')
+            ).astype(np.int64)
+
+            unrolled = (
+                months.astype('datetime64[D]').astype(np.int64) +
+                np.minimum(day_of_month[:, None], month_sizes - 1) +
+                EPOCH_ORDINAL
+            )
+        else:
+            unrolled = starts[:, None] + 14 * instalments
+
+        indexes = unrolled - self.first_ordinal
+
+        if np.any(indexes < 0) or np.any(
+            indexes > self.last_ordinal - self.first_ordinal
+        ):
+            raise ValueError('Date out of the calendar range.')
+
+        # views over the lookup tables, whose items are C longs
+        following = np.frombuffer(self.following, dtype='l')
+        preceding = np.frombuffer(self.preceding, dtype='l')
+
+        if convention is RollingConvention.preceding:
+            rolled = preceding[indexes]
+        else:
+            rolled = following[indexes]
+
+            if convention is RollingConvention.modified_following:
+
+                def month_of(ordinals):
+                    return (ordinals - EPOCH_ORDINAL).astype(
+                        'datetime64[D]'
+                    ).astype('datetime64[M]')
+
+                rolled = np.where(
+                    month_of(rolled) != month_of(unrolled),
+                    preceding[indexes],
+                    rolled,
+                )
+
+        if np.any(rolled < self.first_ordinal) or np.any(
+            rolled > self.last_ordinal
+        ):
+            raise ValueError('Date out of the calendar range.')
+
+        return rolled - starts[:, None] if offsets else rolled
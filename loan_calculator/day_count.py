@@ -0,0 +1,117 @@
+"""Day count conventions.
+
+A day count convention defines how many days a period between two dates
+counts for capitalization purposes, and the size of the year used to convert
+annual interest rates to daily interest rates. The number of days since the
+capitalization start date until each return date is what `Loan` feeds into
+the amortization schedules, the grossup functions and `approximate_irr`.
+"""
+
+from datetime import date
+
+from loan_calculator.interest_rate import YearSizeType
+from loan_calculator.ordinals import to_ordinal
+
+
+class DayCountConvention(object):
+    """Base day count convention.
+
+    Specific conventions should subclass this class, set `year_size` and
+    implement the method `day_count`.
+    """
+
+    year_size = None
+
+    def day_count(self, start_date, end_date):
+        """Number of days from `start_date` until `end_date`.
+
+        Both dates can be given as dates, ordinals or `numpy.datetime64`
+        values (see `ordinals`).
+        """
+        raise NotImplementedError  # pragma: nocover
+
+    def day_counts(self, start_date, end_dates):
+        """Number of days from `start_date` until each of `end_dates`."""
+
+        start_ordinal = to_ordinal(start_date)
+
+        return [self.day_count(start_ordinal, e_date) for e_date in end_dates]
+
+
+class ActualDayCount(DayCountConvention):
+    """Actual number of calendar days, as in ACT/365 and ACT/360.
+
+    Parameters
+    ----------
+    year_size : int, optional
+        The reference year size for converting from annual to daily
+        interest rates. (default YearSizeType.commercial, i.e., ACT/365)
+    """
+
+    def __init__(self, year_size=YearSizeType.commercial):
+        """Initialize convention."""
+        self.year_size = year_size
+
+    def day_count(self, start_date, end_date):
+        return to_ordinal(end_date) - to_ordinal(start_date)
+
+    def day_counts(self, start_date, end_dates):
+
+        start_ordinal = to_ordinal(start_date)
+
+        return [to_ordinal(e_date) - start_ordinal for e_date in end_dates]
+
+
+class Thirty360DayCount(DayCountConvention):
+    """30/360 (bond basis) day count convention.
+
+    Every month counts as 30 days. If :math:`(y_1,m_1,d_1)` and
+    :math:`(y_2,m_2,d_2)` are the start and end dates, then the day count is
+
+    .. math::
+
+        360(y_2 - y_1) + 30(m_2 - m_1) + (D_2 - D_1),
+
+    where :math:`D_1=\\min(d_1,30)` and :math:`D_2=\\min(d_2,30)` if
+    :math:`D_1=30`, :math:`D_2=d_2` otherwise.
+    """
+
+    year_size = YearSizeType.banker
+
+    def day_count(self, start_date, end_date):
+
+        start = date.fromordinal(to_ordinal(start_date))
+        end = date.fromordinal(to_ordinal(end_date))
+
+        start_day = min(start.day, 30)
+        end_day = min(end.day, 30) if start_day == 30 else end.day
+
+        return (
+            360 * (end.year - start.year) +
+            30 * (end.month - start.month) +
+            end_day - start_day
+        )
+
+
+class BusinessDayCount(DayCountConvention):
+    """Business days day count convention, as in BUS/252.
+
+    The day count is the number of business days from the start date
+    (inclusive) until the end date (exclusive). It is a subtraction over the
+    calendar's precomputed cumulative business day counts.
+
+    Parameters
+    ----------
+    calendar : BusinessCalendar, required
+        Calendar defining the business days.
+    year_size : int, optional
+        Number of business days in a year. (default YearSizeType.business)
+    """
+
+    def __init__(self, calendar, year_size=YearSizeType.business):
+        """Initialize convention."""
+        self.calendar = calendar
+        self.year_size = year_size
+
+    def day_count(self, start_date, end_date):
+        return self.calendar.business_days_between(start_date, end_date)
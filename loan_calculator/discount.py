@@ -0,0 +1,286 @@
+from array import array
+from collections import namedtuple, OrderedDict
+from itertools import accumulate, chain, repeat
+from operator import mul
+from threading import Lock
+
+
+PowerTableInfo = namedtuple(
+    'PowerTableInfo',
+    ['hits', 'misses', 'evictions', 'maxsize', 'currsize', 'nbytes'],
+)
+
+# length of the runs of discount factors evaluated by repeated
+# multiplication, each one starting from an exact power
+POWER_TABLE_BLOCK = 512
+
+
+def _power_table_block(base, start, stop):
+    """Evaluate :math:`1/b^n` for :math:`start\\leq n<stop`.
+
+    The factors are evaluated by repeated multiplication by :math:`1/b`,
+    which is cheaper than exponentiation. Each run of `POWER_TABLE_BLOCK`
+    factors starts from an exact power, so that rounding errors do not
+    accumulate along long tables.
+    """
+
+    v = 1.0 / base
+    factors = array('d')
+
+    for n in range(start, stop, POWER_TABLE_BLOCK):
+        factors.fromlist(list(accumulate(
+            chain(
+                (1.0 / base ** n,),
+                repeat(v, min(POWER_TABLE_BLOCK, stop - n) - 1),
+            ),
+            mul,
+        )))
+
+    return factors
+
+
+class PowerTableCache(object):
+    """Bounded LRU cache of tables of discount factors by daily rate.
+
+    For each of the most recently used daily interest rates :math:`d`, the
+    cache keeps the table of discount factors :math:`1/(1+d)^n` for
+    :math:`n=0,1,\\ldots,N`, where the horizon :math:`N` is the largest
+    number of days requested so far for that rate. Tables are extended
+    lazily, so that each discount factor is evaluated only once while it is
+    cached, and every further lookup is an indexing operation. The tables
+    are stored as arrays of doubles and are evaluated by repeated
+    multiplication, see `POWER_TABLE_BLOCK`.
+
+    A table is only built on the second lookup of a rate, so that rates
+    which are used once, e.g., IRRs or rates quoted to many decimal places,
+    are evaluated directly and neither pay for a table nor evict the tables
+    of the recurrent rates.
+
+    Numbers of days which are not integers, are negative or exceed
+    `max_horizon` are evaluated directly, without being cached.
+
+    The cache is safe to be shared among threads. The lock is only held to
+    find and extend the tables: tables are never modified in place, but
+    replaced by extended or truncated copies, hence they are read without
+    it.
+
+    Parameters
+    ----------
+    maxsize: int, optional
+        Maximum number of rates kept. When it is exceeded, the table of the
+        least recently used rate is evicted. (default 64)
+    max_horizon: int, optional
+        Largest number of days kept in a table. (default 36600, i.e., about
+        a hundred years)
+    """
+
+    def __init__(self, maxsize=64, max_horizon=36600):
+        """Initialize cache."""
+
+        self.maxsize = maxsize
+        self.max_horizon = max_horizon
+
+        self._tables = OrderedDict()
+        # rates looked up once, whose tables are built on the next lookup
+        self._candidates = OrderedDict()
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _table(self, daily_interest_rate):
+        """Get the table for the given rate, if it is (to be) cached.
+
+        This method must be called with the lock held.
+        """
+
+        table = self._tables.get(daily_interest_rate)
+
+        if table is not None:
+            self.hits += 1
+            self._tables.move_to_end(daily_interest_rate)
+            return table
+
+        self.misses += 1
+
+        if not self._candidates.pop(daily_interest_rate, False):
+            self._candidates[daily_interest_rate] = True
+            while len(self._candidates) > self.maxsize:
+                self._candidates.popitem(last=False)
+            return None
+
+        table = self._tables[daily_interest_rate] = array('d', [1.0])
+        self._evict(self.maxsize)
+
+        return table
+
+    def _extend(self, daily_interest_rate, horizon):
+        """Extend the table for the given rate up to the horizon.
+
+        The extended table replaces the cached one, which is left untouched
+        for concurrent lookups.
+        """
+
+        with self._lock:
+
+            table = self._tables.get(daily_interest_rate)
+
+            if table is None:
+                # evicted meanwhile
+                return array('d')
+
+            stop = min(horizon, self.max_horizon) + 1
+
+            if stop > len(table):
+                table = table + _power_table_block(
+                    1 + daily_interest_rate, len(table), stop
+                )
+                self._tables[daily_interest_rate] = table
+
+            return table
+
+    def _evict(self, maxsize):
+
+        while len(self._tables) > maxsize:
+            self._tables.popitem(last=False)
+            self.evictions += 1
+
+    def discount_factors(self, daily_interest_rate, return_days):
+        """Look up the discount factor of each of the given return days.
+
+        Returns
+        -------
+        list
+            List with the discount factor of each return day.
+        """
+
+        d = daily_interest_rate
+
+        with self._lock:
+            table = self._table(d)
+
+        if table is not None:
+
+            try:
+                return [
+                    table[n] if n >= 0 else 1.0 / (1 + d) ** n
+                    for n in return_days
+                ]
+            except IndexError:
+                table = self._extend(d, int(max(return_days)))
+                size = len(table)
+                try:
+                    return [
+                        table[n] if 0 <= n < size else 1.0 / (1 + d) ** n
+                        for n in return_days
+                    ]
+                except TypeError:
+                    pass
+            except TypeError:
+                # days which are not integers
+                pass
+
+        return [1.0 / (1 + d) ** n for n in return_days]
+
+    def discount_factor(self, daily_interest_rate, return_day):
+        """Look up the discount factor of a single return day."""
+        return self.discount_factors(daily_interest_rate, [return_day])[0]
+
+    def memory_usage(self):
+        """Number of bytes held by the cached tables."""
+
+        with self._lock:
+            return sum(
+                table.itemsize * len(table) for table in self._tables.values()
+            )
+
+    def cache_info(self):
+        """Report the cache statistics, as in `functools.lru_cache`."""
+
+        nbytes = self.memory_usage()
+
+        with self._lock:
+            return PowerTableInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.maxsize,
+                len(self._tables),
+                nbytes,
+            )
+
+    def resize(self, maxsize=None, max_horizon=None):
+        """Change the cache bounds, evicting tables which no longer fit.
+
+        Tables longer than the new horizon are truncated.
+        """
+
+        with self._lock:
+
+            if maxsize is not None:
+                self.maxsize = maxsize
+                self._evict(maxsize)
+
+            if max_horizon is not None:
+                self.max_horizon = max_horizon
+                # truncated copies replace the tables, instead of shared
+                # tables being truncated in place
+                for rate, table in list(self._tables.items()):
+                    if len(table) > max_horizon + 1:
+                        self._tables[rate] = table[:max_horizon + 1]
+
+    def evict(self, daily_interest_rate):
+        """Evict the table of the given rate, if it is cached."""
+
+        with self._lock:
+            if self._tables.pop(daily_interest_rate, None) is not None:
+                self.evictions += 1
+
+    def clear(self):
+        """Evict all tables and reset the statistics."""
+
+        with self._lock:
+            self._tables.clear()
+            self._candidates.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+# process-wide cache shared by PMTs, schedules and grossup functions
+POWER_TABLE_CACHE = PowerTableCache()
+
+
+def calculate_discount_factors(daily_interest_rate, return_days):
+    """Calculate the discount factor for each of the given return days.
+
+    If :math:`d` is the daily interest rate and :math:`(n_1,\\ldots,n_k)` is
+    the vector with the number of days since the start reference date, then
+    the discount factors are given by
+
+    .. math::
+
+        v_j := \\frac{1}{(1+d)^{n_j}},
+        \\ \\mathrm{for\\ all}\\ j,1\\leq j\\leq k.
+
+    These factors are shared by the PMT, the amortization schedules and the
+    grossup functions, so that they are evaluated only once for each loan.
+    They are looked up in the process-wide `POWER_TABLE_CACHE`, hence loans
+    with the same daily interest rate share them as well.
+
+    Parameters
+    ----------
+    daily_interest_rate : float, required
+        The daily rate at which the principal grows over time.
+    return_days : list, required
+        List of integers representing the numbers of days since the start
+        reference date.
+
+    Returns
+    -------
+    list
+        List with the discount factor of each return day.
+    """
+
+    return POWER_TABLE_CACHE.discount_factors(
+        daily_interest_rate, return_days
+    )
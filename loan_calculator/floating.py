@@ -0,0 +1,255 @@
+"""Floating rate loans.
+
+The balance of a floating rate loan accrues with a series of daily rates,
+e.g., daily CDI fixings, plus a fixed spread. If :math:`r_1,r_2,\\ldots` are
+the daily rates, the accrual factor after :math:`n` days is the product
+
+.. math::
+
+    F(n) := \\prod_{t=1}^n(1+r_t),
+
+which takes the place of :math:`(1+d)^n` in every closed formula of the
+amortization schedules, whose discount factors become :math:`1/F(n_j)`.
+"""
+
+from array import array
+
+from loan_calculator.discount import POWER_TABLE_CACHE
+from loan_calculator.loan import Loan
+from loan_calculator.interest_rate import YearSizeType
+from loan_calculator.ordinals import to_ordinal
+from loan_calculator.schedule.base import AmortizationScheduleType
+
+
+class DailyRateSeries(object):
+    """Series of daily rates with prefix product accrual factors.
+
+    The accrual factors :math:`F(0)=1,F(1),\\ldots,F(N)` of the :math:`N`
+    known rates are accumulated in a single pass and kept in an array, so
+    that the accrual factor between any two days is a division of two
+    lookups. Days after the last known rate accrue with `projected_rate`,
+    i.e., :math:`F(n)=F(N)(1+r)^{n-N}` for :math:`n>N`, where
+    :math:`(1+r)^{n-N}` is looked up in the process-wide power table cache.
+
+    When new rates are known, `extend` only appends their factors to the
+    prefix products.
+
+    Parameters
+    ----------
+    start_date : date, required
+        Date of the first rate of the series. It can also be given as an
+        integer ordinal or as a `numpy.datetime64` (see `ordinals`).
+    daily_rates : iterable, optional
+        Known daily rates, in order. (default ())
+    percentage : float, optional
+        Percentage of the index accrued, e.g., 1.1 for 110% of the CDI, so
+        that each day accrues :math:`1+\\mathrm{percentage}\\cdot r_t`.
+        (default 1.0)
+    projected_rate : float, optional
+        Daily rate assumed for the days after the last known rate.
+        (default 0.0)
+    """
+
+    def __init__(
+        self, start_date, daily_rates=(), percentage=1.0, projected_rate=0.0
+    ):
+        """Initialize series."""
+
+        self.start_date = start_date
+        self.start_ordinal = to_ordinal(start_date)
+        self.percentage = percentage
+        self.projected_rate = projected_rate
+
+        self.accrual_factors = array('d', [1.0])
+        self.extend(daily_rates)
+
+    def __len__(self):
+        """Number of known daily rates."""
+        return len(self.accrual_factors) - 1
+
+    def extend(self, daily_rates):
+        """Append new daily rates, extending the prefix products."""
+
+        factors = self.accrual_factors
+        factor = factors[-1]
+
+        for rate in daily_rates:
+            factor *= 1 + self.percentage * rate
+            factors.append(factor)
+
+    def accrual_factor(self, day):
+        """Accrual factor :math:`F(n)` from the start of the series."""
+
+        if day < 0:
+            raise ValueError('Day precedes the start of the series.')
+
+        known_days = len(self.accrual_factors) - 1
+
+        if day <= known_days:
+            return self.accrual_factors[day]
+
+        projected_discount_factor = POWER_TABLE_CACHE.discount_factor(
+            self.projected_rate, day - known_days
+        )
+
+        return self.accrual_factors[known_days] / projected_discount_factor
+
+    def discount_factors(self, start_day, return_days):
+        """Discount factors :math:`F(m)/F(m+n_j)` of days after a start day.
+
+        Parameters
+        ----------
+        start_day : int, required
+            Day of the series from which the return days are counted.
+        return_days : list, required
+            Numbers of days since the start day.
+
+        Returns
+        -------
+        list
+            List with the discount factor of each return day.
+        """
+
+        start_factor = self.accrual_factor(start_day)
+
+        return [
+            start_factor / self.accrual_factor(start_day + n)
+            for n in return_days
+        ]
+
+
+class FloatingRateLoan(Loan):
+    """Loan accruing with a series of daily rates plus a spread.
+
+    This is a `Loan` whose discount factors are
+
+    .. math::
+
+        v_j = \\frac{F(m)}{F(m+n_j)}\\frac{1}{(1+d)^{n_j}},
+
+    where :math:`F` are the accrual factors of the rate series, :math:`m` is
+    the number of days from the start of the series until the capitalization
+    start date, :math:`d` is the daily spread and :math:`n_j` are the return
+    days. Each return day then costs two lookups in the series' prefix
+    products. Days are counted with the loan's day count convention, which
+    should match the series' (e.g., `BusinessDayCount` for CDI fixings, which
+    are published for business days only).
+
+    The schedule reflects the rates known when it was built. After new
+    rates are appended to the series, `reproject` builds it again from the
+    extended prefix products.
+
+    Grossups and prepayments discount and accrue through
+    `calculate_discount_factors`, hence with the rate series as well.
+
+    Parameters
+    ----------
+    principal : float, required
+        The loan's principal.
+    rate_series : DailyRateSeries, required
+        Series of daily rates the loan accrues with.
+    annual_spread : float, required
+        Annual spread over the series, converted to a daily rate with the
+        year size.
+    start_date : date, required
+        The loan's reference date.
+    return_dates : list, required
+        List of date objects with the expected return dates.
+    year_size : int, optional
+        (default 365)
+    grace_period : int, optional
+        (default 0)
+    amortization_schedule_type : str, optional
+        (default AmortizationScheduleType.progressive_price_schedule.value).
+    day_count_convention : DayCountConvention, optional
+        (default None, i.e., actual calendar days)
+
+    Raises
+    ------
+    ValueError
+        If the capitalization start date precedes the start of the series.
+    """
+
+    def __init__(
+        self,
+        principal,
+        rate_series,
+        annual_spread,
+        start_date,
+        return_dates,
+        year_size=YearSizeType.commercial,
+        grace_period=0,
+        amortization_schedule_type=(
+            AmortizationScheduleType.progressive_price_schedule.value
+        ),
+        day_count_convention=None,
+    ):
+        """Initialize floating rate loan."""
+
+        self.rate_series = rate_series
+
+        super(FloatingRateLoan, self).__init__(
+            principal,
+            annual_spread,
+            start_date,
+            return_dates,
+            year_size,
+            grace_period,
+            amortization_schedule_type,
+            None,
+            day_count_convention,
+        )
+
+    @property
+    def series_start_day(self):
+        """Day of the series at the capitalization start date."""
+        return self.day_count_convention.day_count(
+            self.rate_series.start_ordinal, self.capitalization_start_ordinal
+        )
+
+    def calculate_discount_factors(self, return_days, start_ordinal=None):
+
+        if start_ordinal is None:
+            start_day = self.series_start_day
+        else:
+            start_day = self.day_count_convention.day_count(
+                self.rate_series.start_ordinal, start_ordinal
+            )
+
+        spread_discount_factors = super(
+            FloatingRateLoan, self
+        ).calculate_discount_factors(return_days)
+
+        return [
+            u * v for u, v in zip(
+                self.rate_series.discount_factors(start_day, return_days),
+                spread_discount_factors,
+            )
+        ]
+
+    def reproject(self):
+        """Build the amortization schedule again from the current series."""
+
+        return_days = self.return_days
+
+        self.amortization_schedule = self.build_schedule(
+            self.principal,
+            self.daily_interest_rate,
+            return_days,
+            self.calculate_discount_factors(return_days),
+        )
+
+    def with_principal(self, principal):
+        """Build a floating rate loan with the same terms and series."""
+
+        return FloatingRateLoan(
+            principal,
+            self.rate_series,
+            self.annual_interest_rate,
+            self.start_date,
+            self.return_dates,
+            self.year_size,
+            self.grace_period,
+            self.amortization_schedule_type,
+            self.day_count_convention,
+        )
@@ -1,6 +1,7 @@
 from enum import Enum
 
-from loan_calculator.irr import approximate_irr
+from loan_calculator import irr as irr_solvers
+from loan_calculator.ordinals import to_ordinal
 
 
 class GrossupType(Enum):
@@ -20,7 +21,8 @@ class BaseGrossup(object):
         Loan to be grossed up.
     reference_date : date, required
         Reference used to the gross up evaluation. It is usually the date
-        of the associated taxable event.
+        of the associated taxable event. It can also be given as an integer
+        ordinal or as a `numpy.datetime64` (see `ordinals`).
     args
         Passed as args to grossup implementation.
     """
@@ -29,8 +31,10 @@ class BaseGrossup(object):
         """Initialize grossup."""
 
         self.reference_date = reference_date
+        self.reference_ordinal = to_ordinal(reference_date)
 
         self.base_loan = base_loan
+        self._irr_result = None
         self.grossed_up_loan = getattr(self, 'grossup', base_loan)(
             base_loan, reference_date, *args
         )
@@ -48,15 +52,44 @@ class BaseGrossup(object):
         """Principal of the grossed up loan."""
         return self.grossed_up_loan.principal
 
-    @property
-    def irr(self):
-        """Approximation for the IRR affecting the net principal."""
-        return approximate_irr(
+    def solve_irr(self, initial_point=None, irr_cache=None):
+        """Solve the IRR affecting the net principal.
+
+        Parameters
+        ----------
+        initial_point : float, optional
+            Initial approximation for the IRR. (default None, i.e., the base
+            loan's daily interest rate)
+        irr_cache : IrrCache, optional
+            Cache in which the solution is looked up. (default None, i.e.,
+            the process-wide `irr.IRR_CACHE` at the time of the call)
+
+        Returns
+        -------
+        IrrResult
+            The IRR with convergence diagnostics (see `irr.solve_irr`).
+        """
+
+        if initial_point is None:
+            initial_point = self.base_loan.daily_interest_rate
+
+        if irr_cache is None:
+            irr_cache = irr_solvers.IRR_CACHE
+
+        return irr_cache.solve_irr(
             self.base_principal,
             self.grossed_up_loan.due_payments,
-            [
-                (r_date - self.reference_date).days
-                for r_date in self.base_loan.return_dates
-            ],
-            self.base_loan.daily_interest_rate
+            self.base_loan.day_count_convention.day_counts(
+                self.reference_ordinal, self.base_loan.return_ordinals
+            ),
+            initial_point,
         )
+
+    @property
+    def irr(self):
+        """Approximation for the IRR affecting the net principal."""
+
+        if self._irr_result is None:
+            self._irr_result = self.solve_irr()
+
+        return self._irr_result.root
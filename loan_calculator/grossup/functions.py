@@ -6,6 +6,8 @@ is the one obtained after subtracting due taxes and service fees according
 to very specific mathematical rule.
 """
 
+from loan_calculator.discount import calculate_discount_factors
+
 
 def br_iof_regressive_price_grossup(
         net_principal,
@@ -13,7 +15,8 @@ def br_iof_regressive_price_grossup(
         daily_iof_fee,
         complementary_iof_fee,
         return_days,
-        service_fee
+        service_fee,
+        discount_factors=None,
 ):
     """Calculate the grossup of the given principal.
 
@@ -55,6 +58,10 @@ def br_iof_regressive_price_grossup(
     service_fee : float, optional
         Eventual service fee. It is assumed to be an aliquot
         applied on the principal
+    discount_factors : list, optional
+        Precomputed discount factors :math:`1/(1+d)^{n_j}` for the given
+        return days, as returned by `discount.calculate_discount_factors`.
+        They are evaluated if not given. (default None)
 
 
     Returns
@@ -70,14 +77,17 @@ def br_iof_regressive_price_grossup(
     s_fee = service_fee
     pmt_days = return_days
 
+    if discount_factors is None:
+        discount_factors = calculate_discount_factors(d, pmt_days)
+
     # TODO:think of a better name for this coefficient
     # transport coefficient
-    transport_coef = sum(1.0 / (1 + d) ** n for n in pmt_days)
+    transport_coef = sum(discount_factors)
 
     # iof coefficient
     iof_coef = sum(
-        float(min(n * d_iof, 0.015)) / (1 + d) ** n
-        for n in pmt_days
+        float(min(n * d_iof, 0.015)) * v
+        for n, v in zip(pmt_days, discount_factors)
     )
 
     return p / (1 - (iof_coef / transport_coef) - c_iof - s_fee)
@@ -89,7 +99,8 @@ def br_iof_progressive_price_grossup(
     daily_iof_fee,
     complementary_iof_fee,
     return_days,
-    service_fee
+    service_fee,
+    discount_factors=None,
 ):
     """Calculate the grossup of the principal for the given parameters.
 
@@ -135,6 +146,10 @@ def br_iof_progressive_price_grossup(
     service_fee : float, optional
         Eventual service fee. It is assumed to be an aliquot
         applied on the principal
+    discount_factors : list, optional
+        Precomputed discount factors :math:`1/(1+d)^{n_j}` for the given
+        return days, as returned by `discount.calculate_discount_factors`.
+        They are evaluated if not given. (default None)
 
     Returns
     -------
@@ -149,14 +164,17 @@ def br_iof_progressive_price_grossup(
     s_fee = service_fee
     pmt_days = return_days
 
+    if discount_factors is None:
+        discount_factors = calculate_discount_factors(d, pmt_days)
+
     # TODO:think of a better name for this coefficient
     # transport coefficient
-    transport_coef = sum(1.0 / (1 + d) ** n for n in pmt_days)
+    transport_coef = sum(discount_factors)
 
     # iof coefficient
     iof_coef = sum(
-        float(min(n * d_iof, 0.015)) / (1 + d) ** n
-        for n in pmt_days[::-1]
+        float(min(n * d_iof, 0.015)) * v
+        for n, v in zip(pmt_days[::-1], discount_factors[::-1])
     )
 
     return p / (1 - (iof_coef / transport_coef) - c_iof - s_fee)
@@ -168,7 +186,8 @@ def br_iof_constant_amortization_grossup(
         daily_iof_fee,
         complementary_iof_fee,
         return_days,
-        service_fee
+        service_fee,
+        discount_factors=None,
 ):
     """Calculate the grossup of the principal and given parameters.
 
@@ -207,9 +226,12 @@ def br_iof_constant_amortization_grossup(
     s_fee = service_fee
     pmt_days = return_days
 
+    if discount_factors is None:
+        discount_factors = calculate_discount_factors(d, pmt_days)
+
     # TODO:think of a better name for this coefficient
     # transport coefficient
-    transport_coef = sum(1.0 / (1 + d) ** n for n in pmt_days)
+    transport_coef = sum(discount_factors)
 
     # iof coefficient
     iof_coef = sum(
@@ -218,3 +240,71 @@ def br_iof_constant_amortization_grossup(
     )
 
     return p / (1 - (iof_coef / transport_coef) - c_iof - s_fee)
+
+
+def br_iof_unit_amortization_grossup(
+        net_principal,
+        unit_amortizations,
+        daily_iof_fee,
+        complementary_iof_fee,
+        return_days,
+        service_fee,
+):
+    """Calculate the grossup of the principal for any amortization schedule.
+
+    This implements a grossup for which
+
+    - the principal is amortized according to any schedule whose
+      amortizations are linear in the principal,
+    - the principal and the payments are taxed with IOF,
+    - a service fee is applied over the principal.
+
+    If :math:`a_1,\\ldots,a_k` are the amortizations of the schedule with
+    unit principal, then the amortizations of the grossed up principal
+    :math:`s` are :math:`sa_1,\\ldots,sa_k` and the grossup is given by
+
+    .. math::
+
+        \\mathrm{GROSSUP}(s, (a_1,\\ldots,a_k), I^*, I^{**}, (n_1,\\ldots,n_k),
+        g) = \\frac{s} {1 - \\alpha - I^{**} - g},
+
+    where
+
+    .. math::
+
+        \\alpha := \\sum_{j=1}^k a_j\\min(n_j\\ I^*, 0.015).
+
+    Parameters
+    ----------
+    net_principal : float, required
+        The principal to be "grossed up".
+    unit_amortizations : list, required
+        Amortizations of the schedule with unit principal.
+    daily_iof_fee : float, required
+        Daily tax due to brazilian tax IOF.
+    complementary_iof_fee : float, required
+        Complementary tax due to brazilian tax IOF.
+    return_days : list, required
+        List containing the number of days since the start reference date.
+    service_fee : float, optional
+        Eventual service fee. It is assumed to be an aliquot
+        applied on the principal
+
+    Returns
+    -------
+    The grossed up principal.
+    """
+
+    # variables are renamed to make the math more explicit
+    p = net_principal
+    d_iof = daily_iof_fee
+    c_iof = complementary_iof_fee
+    s_fee = service_fee
+
+    # iof coefficient
+    iof_coef = sum(
+        a * float(min(n * d_iof, 0.015))
+        for a, n in zip(unit_amortizations, return_days)
+    )
+
+    return p / (1 - iof_coef - c_iof - s_fee)
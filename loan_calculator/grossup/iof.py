@@ -1,9 +1,10 @@
-from loan_calculator.loan import Loan
+from loan_calculator.ordinals import to_ordinal
 from loan_calculator.grossup.base import BaseGrossup
 from loan_calculator.grossup.functions import (
     br_iof_regressive_price_grossup,
     br_iof_progressive_price_grossup,
-    br_iof_constant_amortization_grossup
+    br_iof_constant_amortization_grossup,
+    br_iof_unit_amortization_grossup,
 )
 from loan_calculator.schedule import (
     RegressivePriceSchedule,
@@ -12,6 +13,13 @@ from loan_calculator.schedule import (
 )
 
 
+IOF_GROSSUP_FUNCTION_MAP = {
+    RegressivePriceSchedule: br_iof_regressive_price_grossup,
+    ProgressivePriceSchedule: br_iof_progressive_price_grossup,
+    ConstantAmortizationSchedule: br_iof_constant_amortization_grossup,
+}
+
+
 class IofGrossup(BaseGrossup):
     """Implement grossup based on IOF tax and linear service fee.
 
@@ -51,6 +59,10 @@ class IofGrossup(BaseGrossup):
     service_fee_aliquot : float, optional
         Aliquot applied over the principal and is meant to model the
         service fee. (Default 0.0)
+
+    The reduced IOF tax is always incident over calendar days, while the
+    discount factors follow the loan's day count convention and accrual
+    rule (see `Loan.calculate_discount_factors`).
     """
 
     def __init__(
@@ -80,28 +92,55 @@ class IofGrossup(BaseGrossup):
         service_fee_aliquot,
     ):
 
-        dispatch_table = {
-            RegressivePriceSchedule: br_iof_regressive_price_grossup,
-            ProgressivePriceSchedule: br_iof_progressive_price_grossup,
-            ConstantAmortizationSchedule: br_iof_constant_amortization_grossup,
-        }
+        reference_ordinal = to_ordinal(reference_date)
+
+        iof_days = [
+            r_ordinal - reference_ordinal for r_ordinal in loan.return_ordinals
+        ]
+        return_days = loan.day_count_convention.day_counts(
+            reference_ordinal, loan.return_ordinals
+        )
+
+        # the loan's schedule already holds the discount factors whenever the
+        # reference date coincides with the capitalization start date
+        if return_days == loan.return_days:
+            discount_factors = loan.amortization_schedule.discount_factors
+        else:
+            discount_factors = loan.calculate_discount_factors(
+                return_days, reference_ordinal
+            )
+
+        # schedules built by subclasses of Loan (e.g., indexed schedules) are
+        # dispatched by their own class
+        grossup_function = IOF_GROSSUP_FUNCTION_MAP.get(
+            type(loan.amortization_schedule)
+        )
 
-        return Loan(
-            dispatch_table[loan.amortization_schedule_cls](
+        if grossup_function is None:
+            # generic path, for schedules whose amortizations are linear in
+            # the principal
+            grossed_up_principal = br_iof_unit_amortization_grossup(
+                loan.principal,
+                loan.build_schedule(
+                    1.0,
+                    loan.daily_interest_rate,
+                    return_days,
+                    discount_factors,
+                ).amortizations,
+                daily_iof_aliquot,
+                complementary_iof_aliquot,
+                iof_days,
+                service_fee_aliquot,
+            )
+        else:
+            grossed_up_principal = grossup_function(
                 loan.principal,
                 loan.daily_interest_rate,
                 daily_iof_aliquot,
                 complementary_iof_aliquot,
-                [
-                    (r_date - reference_date).days
-                    for r_date in loan.return_dates
-                ],
+                iof_days,
                 service_fee_aliquot,
-            ),
-            loan.annual_interest_rate,
-            loan.start_date,
-            loan.return_dates,
-            loan.year_size,
-            loan.grace_period,
-            loan.amortization_schedule_type
-        )
+                discount_factors,
+            )
+
+        return loan.with_principal(grossed_up_principal)
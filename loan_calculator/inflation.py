@@ -0,0 +1,321 @@
+"""Inflation indexed loans.
+
+The instalments of an inflation indexed loan (e.g., indexed by the IPCA)
+are those of a schedule in real terms multiplied by the ratio of a price
+index at each return date and at the start date. The index is published
+monthly and interpolated pro rata die between consecutive months.
+"""
+
+from calendar import monthrange
+from datetime import date
+
+from loan_calculator.interest_rate import YearSizeType
+from loan_calculator.loan import Loan
+from loan_calculator.ordinals import to_ordinal, to_ordinals
+from loan_calculator.prepayment import Prepayment, ReamortizationType
+from loan_calculator.schedule.base import AmortizationScheduleType
+from loan_calculator.schedule.indexed import INDEXED_SCHEDULE_CLASS_MAP
+
+
+class PriceIndexSeries(object):
+    """Monthly price index series with pro rata die interpolation.
+
+    If :math:`I_m` and :math:`I_{m+1}` are the index numbers of a month and
+    of the following one, the index at its :math:`\\delta`-th day is
+
+    .. math::
+
+        I(t) = I_m\\left(\\frac{I_{m+1}}{I_m}\\right)^{(\\delta-1)/D},
+
+    where :math:`D` is the number of days in the month. Months after the
+    last known index number are projected with a constant monthly rate.
+
+    Index numbers and index ratios are cached by date, so that loans sharing
+    their dates (as usual in a portfolio) share the lookups as well. The
+    caches are cleared whenever the series is extended.
+
+    Parameters
+    ----------
+    start_date : date, required
+        Any date in the month of the first index number.
+    index_numbers : iterable, required
+        Monthly index numbers, in order.
+    projected_rate : float, optional
+        Monthly rate used to project index numbers after the last known one.
+        (default None, i.e., dates after the last known month are not
+        supported)
+    """
+
+    def __init__(self, start_date, index_numbers, projected_rate=None):
+        """Initialize series."""
+
+        start_date = date.fromordinal(to_ordinal(start_date))
+
+        self.start_month = start_date.year * 12 + start_date.month - 1
+        self.index_numbers = []
+        self.projected_rate = projected_rate
+
+        self._indexes = {}
+        self._ratios = {}
+
+        self.hits = 0
+        self.misses = 0
+
+        self.extend(index_numbers)
+
+    def extend(self, index_numbers):
+        """Append new monthly index numbers, clearing the caches."""
+
+        self.index_numbers.extend(index_numbers)
+
+        self._indexes.clear()
+        self._ratios.clear()
+
+    def index_number(self, month):
+        """Index number of the given month, counted since the first one."""
+
+        known_months = len(self.index_numbers)
+
+        if 0 <= month < known_months:
+            return self.index_numbers[month]
+
+        if month < 0 or self.projected_rate is None:
+            raise ValueError('Index number is not available.')
+
+        return (
+            self.index_numbers[-1] *
+            (1 + self.projected_rate) ** (month - known_months + 1)
+        )
+
+    def index_at(self, day):
+        """Index interpolated pro rata die at the given date."""
+
+        ordinal = to_ordinal(day)
+
+        index = self._indexes.get(ordinal)
+
+        if index is None:
+
+            day = date.fromordinal(ordinal)
+            month = day.year * 12 + day.month - 1 - self.start_month
+
+            index = self.index_number(month)
+
+            if day.day > 1:
+                index *= (self.index_number(month + 1) / index) ** (
+                    float(day.day - 1) / monthrange(day.year, day.month)[1]
+                )
+
+            self._indexes[ordinal] = index
+
+        return index
+
+    def index_ratio(self, base_date, day):
+        """Ratio between the index at the given date and at the base date."""
+
+        key = (to_ordinal(base_date), to_ordinal(day))
+
+        ratio = self._ratios.get(key)
+
+        if ratio is None:
+            self.misses += 1
+            ratio = self._ratios[key] = (
+                self.index_at(key[1]) / self.index_at(key[0])
+            )
+        else:
+            self.hits += 1
+
+        return ratio
+
+    def index_ratios(self, base_date, dates):
+        """Index ratios of the given dates relative to the base date."""
+
+        base_ordinal = to_ordinal(base_date)
+
+        return [self.index_ratio(base_ordinal, day) for day in dates]
+
+
+class IndexedLoan(Loan):
+    """Loan whose schedule is indexed by a price index.
+
+    The loan's interest rate is the real interest rate and its schedule is
+    the indexed counterpart (see `schedule.indexed`) of the schedule given by
+    the amortization schedule type, with the index ratios of the return dates
+    relative to the start date. The schedule is built once, through
+    `build_schedule`, so that grossups also build indexed schedules and
+    grossed up loans are indexed loans as well (see `with_principal`).
+    Prepayments keep the term only (see `IndexedPrepayment`).
+
+    Parameters
+    ----------
+    principal : float, required
+        The loan's principal.
+    annual_interest_rate : float, required
+        The loan's annual real interest rate.
+    index_series : PriceIndexSeries, required
+        Price index series the loan is indexed by.
+    start_date : date, required
+        The loan's reference date, which is also the base date of the index
+        ratios.
+    return_dates : list, required
+        List of date objects with the expected return dates.
+    year_size : int, optional
+        (default 365)
+    grace_period : int, optional
+        (default 0)
+    amortization_schedule_type : str, optional
+        (default AmortizationScheduleType.progressive_price_schedule.value).
+    day_count_convention : DayCountConvention, optional
+        (default None, i.e., actual calendar days)
+    """
+
+    def __init__(
+        self,
+        principal,
+        annual_interest_rate,
+        index_series,
+        start_date,
+        return_dates,
+        year_size=YearSizeType.commercial,
+        grace_period=0,
+        amortization_schedule_type=(
+            AmortizationScheduleType.progressive_price_schedule.value
+        ),
+        day_count_convention=None,
+    ):
+        """Initialize indexed loan."""
+
+        # the index ratios are needed by `build_schedule`, which is called
+        # while the loan is initialized
+        self.index_series = index_series
+        self.index_ratios = index_series.index_ratios(
+            start_date, to_ordinals(return_dates)
+        )
+
+        super(IndexedLoan, self).__init__(
+            principal,
+            annual_interest_rate,
+            start_date,
+            return_dates,
+            year_size,
+            grace_period,
+            amortization_schedule_type,
+            None,
+            day_count_convention,
+        )
+
+    def build_schedule(
+        self,
+        principal,
+        daily_interest_rate,
+        return_days,
+        discount_factors=None,
+    ):
+        """Build an indexed schedule of the loan's type and index ratios."""
+
+        return INDEXED_SCHEDULE_CLASS_MAP[self.amortization_schedule_cls](
+            principal,
+            daily_interest_rate,
+            return_days,
+            self.index_ratios,
+            discount_factors,
+        )
+
+    def with_principal(self, principal):
+        """Build an indexed loan with the same terms and another principal."""
+
+        return IndexedLoan(
+            principal,
+            self.annual_interest_rate,
+            self.index_series,
+            self.start_date,
+            self.return_dates,
+            self.year_size,
+            self.grace_period,
+            self.amortization_schedule_type,
+            self.day_count_convention,
+        )
+
+    def prepay(
+        self,
+        prepayment_date,
+        amount,
+        reamortization_type=ReamortizationType.keep_term.value,
+    ):
+        """Prepay part of the loan and re-amortize its remaining balance.
+
+        See `Loan.prepay` and `IndexedPrepayment`.
+        """
+
+        return IndexedPrepayment(
+            self, prepayment_date, amount, reamortization_type
+        )
+
+
+class IndexedPrepayment(Prepayment):
+    """Partial prepayment of an indexed loan.
+
+    The outstanding balance is accrued with the real interest rate and
+    indexed from the last paid return date (or the start date) until the
+    prepayment date. The remaining balance is then re-amortized by an
+    indexed schedule, whose index ratios are relative to the prepayment
+    date. Only the term can be kept, since indexed schedules have no
+    constant PMT.
+
+    Raises
+    ------
+    ValueError
+        As `Prepayment`, and also if the PMT is to be kept.
+    """
+
+    def __init__(
+        self,
+        loan,
+        prepayment_date,
+        amount,
+        reamortization_type=ReamortizationType.keep_term.value,
+    ):
+        """Initialize indexed prepayment."""
+
+        if (
+            ReamortizationType(reamortization_type) is
+            ReamortizationType.keep_pmt
+        ):
+            raise ValueError('Indexed loans do not support keeping the PMT.')
+
+        super(IndexedPrepayment, self).__init__(
+            loan, prepayment_date, amount, reamortization_type
+        )
+
+    def accrue(self, balance, days):
+
+        last_paid_ordinal = (
+            self.loan.return_ordinals[self.num_paid_instalments - 1]
+            if self.num_paid_instalments else self.loan.start_ordinal
+        )
+
+        return super(IndexedPrepayment, self).accrue(
+            balance, days
+        ) * self.loan.index_series.index_ratio(
+            last_paid_ordinal, self.prepayment_ordinal
+        )
+
+    def build_remaining_schedule(
+        self, principal, return_days, discount_factors
+    ):
+
+        loan = self.loan
+
+        return INDEXED_SCHEDULE_CLASS_MAP[loan.amortization_schedule_cls](
+            principal,
+            loan.daily_interest_rate,
+            return_days,
+            loan.index_series.index_ratios(
+                self.prepayment_ordinal,
+                loan.return_ordinals[
+                    self.num_paid_instalments:
+                    self.num_paid_instalments + len(return_days)
+                ],
+            ),
+            discount_factors,
+        )
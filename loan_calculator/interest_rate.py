@@ -1,4 +1,7 @@
 from enum import Enum, IntEnum
+from functools import lru_cache
+from math import exp
+from numbers import Real
 
 
 class InterestRateType(Enum):
@@ -7,17 +10,90 @@ class InterestRateType(Enum):
     semiannual = 'semiannual'
     monthly = 'monthly'
     quarterly = 'quarterly'
+    continuous = 'continuous'
+    nominal = 'nominal'
+    business_annual = 'business-annual'
 
 
 class YearSizeType(IntEnum):
+    business = 252
     banker = 360
     commercial = 365
 
 
+# number of capitalization periods in a year of each effective rate type
+PERIODS_PER_YEAR_MAP = {
+    InterestRateType.annual: 1,
+    InterestRateType.semiannual: 2,
+    InterestRateType.quarterly: 4,
+    InterestRateType.monthly: 12,
+}
+
+INTEREST_RATE_CACHE_SIZE = 1024
+
+
+def _convert(
+    interest_rate_aliquot,
+    interest_rate_type,
+    year_size,
+    compounding_periods,
+    exp_function,
+):
+    """Convert scalars or NumPy arrays of aliquots to daily interest rates."""
+
+    a = interest_rate_aliquot
+
+    if interest_rate_type is InterestRateType.daily:
+        return a
+    elif interest_rate_type is InterestRateType.continuous:
+        # e^a = (1 + d)^365 => d = e^(a/365) - 1
+        return exp_function(a / year_size) - 1
+    elif interest_rate_type is InterestRateType.nominal:
+        # (1 + a/m)^m = (1 + d)^365 => d = (1 + a/m)^(m/365) - 1
+        return (
+            (1 + a / compounding_periods) **
+            (compounding_periods / year_size) - 1
+        )
+    elif interest_rate_type is InterestRateType.business_annual:
+        # 1 + a = (1 + d)^252 => d = (1 + a)^(1/252) - 1
+        return (1 + a) ** (1 / YearSizeType.business) - 1
+    else:
+        # (1 + a)^p = (1 + d)^365 => d = (1 + a)^(p/365) - 1
+        return (
+            (1 + a) **
+            (PERIODS_PER_YEAR_MAP[interest_rate_type] / year_size) - 1
+        )
+
+
+@lru_cache(maxsize=INTEREST_RATE_CACHE_SIZE)
+def _cached_convert(
+    interest_rate_aliquot,
+    interest_rate_type,
+    year_size,
+    compounding_periods,
+):
+    return _convert(
+        interest_rate_aliquot,
+        interest_rate_type,
+        year_size,
+        compounding_periods,
+        exp,
+    )
+
+
+def _interest_rate_type(interest_rate_type):
+
+    try:
+        return InterestRateType(interest_rate_type)
+    except ValueError:
+        raise TypeError('Unknown interest rate type')
+
+
 def convert_to_daily_interest_rate(
     interest_rate_aliquot,
     interest_rate_type=InterestRateType.daily,
-    year_size=YearSizeType.commercial
+    year_size=YearSizeType.commercial,
+    compounding_periods=12,
 ):
     """"Convert aliquots from a given rate to a daily interest rate.
 
@@ -27,16 +103,37 @@ def convert_to_daily_interest_rate(
     important to note that the proper conversion of rates depends on the
     size of a year in days.
 
+    The supported rate types are
+
+    *   effective rates (annual, semiannual, quarterly and monthly), for which
+        :math:`(1+a)^p=(1+d)^Y`, :math:`p` being the number of periods in a
+        year and :math:`Y` the year size,
+    *   continuously compounded annual rates, for which :math:`e^a=(1+d)^Y`,
+    *   nominal annual rates with periodic compounding, for which
+        :math:`(1+a/m)^m=(1+d)^Y`, :math:`m` being the number of compounding
+        periods in a year, and
+    *   annual rates over business days, for which :math:`1+a=(1+d)^{252}`,
+        i.e., the result is a rate per business day regardless of the year
+        size.
+
+    Conversions of scalar aliquots are memoized, so that repeated
+    conversions of the same aliquot (as when grossing up a loan) are
+    dictionary lookups.
+
     Parameters
     ----------
     interest_rate_aliquot: float, required
-        Aliquot to be converted to a daily interest rate aliquot.
+        Aliquot to be converted to a daily interest rate aliquot. It can also
+        be a NumPy array of aliquots, which is converted at once.
     interest_rate_type: InterestRateType, optional
         The type of rate in which the input aliquot is capitalized
         (default: InterestRateType.daily).
     year_size: YearSizeType, optional
         A year size is necessary since monthly, quarterly and semiannual
         rates are relative to an annum (default YearSizeType.commercial).
+    compounding_periods: int, optional
+        Number of compounding periods in a year of nominal rates
+        (default 12).
 
     Returns
     -------
@@ -49,19 +146,68 @@ def convert_to_daily_interest_rate(
         If the interest_rate_type is none one of the enumerated in
         InterestRateType.
     """
-    if interest_rate_type == InterestRateType.daily:
-        return interest_rate_aliquot
-    elif interest_rate_type == InterestRateType.annual:
-        # 1 + a = (1 + d)^365 => d = (1 + a)^(1/365) - 1
-        return (1 + interest_rate_aliquot) ** (1 / year_size) - 1
-    elif interest_rate_type == InterestRateType.semiannual:
-        # (1 + s)^2 = (1 + d)^365 => d = (1 + s)^(2/365) - 1
-        return (1 + interest_rate_aliquot) ** (2 / year_size) - 1
-    elif interest_rate_type == InterestRateType.monthly:
-        # (1 + m)^12 = (1 + d)^365 => d = (1 + m)^(12/365) - 1
-        return (1 + interest_rate_aliquot) ** (12 / year_size) - 1
-    elif interest_rate_type == InterestRateType.quarterly:
-        # (1 + q)^4 = (1 + d)^365 => d = (1 + q)^(4/365) - 1
-        return (1 + interest_rate_aliquot) ** (4 / year_size) - 1
-    else:
-        raise TypeError('Unknown interest rate type')
+
+    interest_rate_type = _interest_rate_type(interest_rate_type)
+
+    if isinstance(interest_rate_aliquot, Real):
+        return _cached_convert(
+            interest_rate_aliquot,
+            interest_rate_type,
+            year_size,
+            compounding_periods,
+        )
+
+    import numpy as np
+
+    return _convert(
+        np.asarray(interest_rate_aliquot, dtype=float),
+        interest_rate_type,
+        year_size,
+        compounding_periods,
+        np.exp,
+    )
+
+
+def convert_to_daily_interest_rates(
+    interest_rate_aliquots,
+    interest_rate_type=InterestRateType.daily,
+    year_size=YearSizeType.commercial,
+    compounding_periods=12,
+):
+    """Convert a column of aliquots to daily interest rates.
+
+    NumPy arrays are converted in a single vectorized pass, while other
+    sequences are converted item by item through the memoized scalar
+    conversion (see `convert_to_daily_interest_rate`).
+
+    Parameters
+    ----------
+    interest_rate_aliquots: list or numpy.ndarray, required
+        Aliquots to be converted to daily interest rate aliquots.
+    interest_rate_type: InterestRateType, optional
+        (default: InterestRateType.daily).
+    year_size: YearSizeType, optional
+        (default YearSizeType.commercial).
+    compounding_periods: int, optional
+        (default 12).
+
+    Returns
+    -------
+    list or numpy.ndarray
+        Daily interest rates, as a NumPy array if NumPy arrays were given.
+    """
+
+    if hasattr(interest_rate_aliquots, 'dtype'):
+        return convert_to_daily_interest_rate(
+            interest_rate_aliquots,
+            interest_rate_type,
+            year_size,
+            compounding_periods,
+        )
+
+    return [
+        convert_to_daily_interest_rate(
+            aliquot, interest_rate_type, year_size, compounding_periods
+        )
+        for aliquot in interest_rate_aliquots
+    ]
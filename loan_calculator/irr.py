@@ -1,3 +1,27 @@
+from array import array
+from collections import namedtuple, OrderedDict
+from enum import IntEnum
+from threading import Lock
+
+from loan_calculator.schedule.cache import CacheInfo
+
+
+class IrrStatus(IntEnum):
+
+    converged = 0
+    max_iterations = 1
+    failed = 2
+
+
+IrrResult = namedtuple(
+    'IrrResult', ['root', 'iterations', 'residual', 'status', 'evaluations']
+)
+
+BatchIrrResult = namedtuple(
+    'BatchIrrResult', ['irrs', 'iterations', 'statuses']
+)
+
+
 def newton_raphson_solver(
     target_function,
     target_function_derivative,
@@ -29,10 +53,22 @@ def newton_raphson_solver(
 
     The approximation stops if either :math:`e_n` > `maximum_relative_error`
     or :math:`n` > `max_iterations`.
+
+    If `target_function_derivative` is None, `target_function` is assumed to
+    evaluate both :math:`f(x)` and :math:`f^{\\prime}(x)` at once, returning
+    them as a pair (see `return_polynomial_value_and_derivative_factory`).
     """
 
-    def _iterating_function(x):
-        return x - target_function(x) / target_function_derivative(x)
+    if target_function_derivative is None:
+
+        def _iterating_function(x):
+            value, derivative = target_function(x)
+            return x - value / derivative
+
+    else:
+
+        def _iterating_function(x):
+            return x - target_function(x) / target_function_derivative(x)
 
     def _error_function(reference_point, new_point):
         return abs((new_point - reference_point) / reference_point)
@@ -62,8 +98,8 @@ def newton_raphson_solver(
 def return_polynomial_factory(net_principal, returns, return_days):
     """Factory for a callable with point evaluation of the return polynomial.
 
-    The return polynomial for a loan with net principal :math:`s_\circ`,
-    returns :math:`r_1,r_2,\ldots,r_k` to be paid :math:`n_1,n_2,\ldots,n_k`
+    The return polynomial for a loan with net principal :math:`s_\\circ`,
+    returns :math:`r_1,r_2,\\ldots,r_k` to be paid :math:`n_1,n_2,\\ldots,n_k`
     days after the loan is granted, respectively, is given by
 
     .. math::
@@ -112,8 +148,8 @@ def return_polynomial_derivative_factory(net_principal, returns, return_days):
     Factory for a callable implementing point evaluation of the derivative of
     the return polynomial for the given parameters.
 
-    The return polynomial for a loan with net principal :math:`s_\circ`,
-    returns :math:`r_1,r_2,\ldots,r_k` to be paid :math:`n_1,n_2,\ldots,n_k`
+    The return polynomial for a loan with net principal :math:`s_\\circ`,
+    returns :math:`r_1,r_2,\\ldots,r_k` to be paid :math:`n_1,n_2,\\ldots,n_k`
     days after the loan is granted, respectively, is given by
 
     .. math::
@@ -146,9 +182,9 @@ def return_polynomial_derivative_factory(net_principal, returns, return_days):
         parameters
     """
     derivative_coefficients_vec = [
-        net_principal * (return_days[-1] - return_days[-2])
+        net_principal * return_days[-1]
     ] + [
-        r * (return_days[-1] - r_day)
+        -1 * r * (return_days[-1] - r_day)
         # last term does not need to be evaluated
         for r, r_day in zip(returns[:-1], return_days[:-1])
     ]
@@ -157,7 +193,7 @@ def return_polynomial_derivative_factory(net_principal, returns, return_days):
 
         powers_vec = [
             (1 + irr_) ** (return_days[-1] - r_day - 1)
-            for r_day in return_days
+            for r_day in [0] + return_days[:-1]
         ]
 
         return sum(
@@ -168,6 +204,75 @@ def return_polynomial_derivative_factory(net_principal, returns, return_days):
     return return_polynomial_derivative
 
 
+def return_polynomial_value_and_derivative_factory(
+    net_principal, returns, return_days
+):
+    """Factory for a callable evaluating the return polynomial and derivative.
+
+    The callable evaluates the return polynomial :math:`f` (see
+    `return_polynomial_factory`) and its derivative :math:`f^\\prime` in a
+    single pass over the powers :math:`(1+c)^{-n_i}`, which are shared by
+    both. They are scaled by :math:`(1+c)^{-n_k}`, i.e., the callable returns
+
+    .. math::
+
+        \\frac{f(c)}{(1+c)^{n_k}} = s_\\circ - \\sum_{i=1}^k r_i(1+c)^{-n_i}
+        =: g(c)
+
+    and
+
+    .. math::
+
+        \\frac{f^\\prime(c)}{(1+c)^{n_k}} =
+        \\frac{n_k g(c) + \\sum_{i=1}^k n_i r_i(1+c)^{-n_i}}{1+c},
+
+    so that no power grows with the horizon :math:`n_k` and the evaluation
+    does not overflow for long horizons. Since both are scaled by the same
+    positive factor, their ratio, hence each Newton-Raphson step, is the same
+    as for the unscaled polynomial. The callable can be passed directly to
+    `newton_raphson_solver`, with `target_function_derivative` set to None.
+
+    Parameters
+    ----------
+    net_principal : float, required
+        The net principal of a grossed up loan.
+    returns : list of floats, required
+        Due payments that completely pay off the grossed up principal when
+        respectively applied for the given return days.
+    return_days : list of ints, required
+        List with the number of days since the taxable event (which is usually
+        a "loan granted" event) happened.
+
+    Returns
+    -------
+    Callable
+        Python callable returning the pair of scaled values of the return
+        polynomial and its derivative.
+    """
+
+    # variables are renamed to make the math more explicit
+    s = net_principal
+    n_k = return_days[-1]
+    cash_flows = list(zip(returns, return_days))
+
+    def return_polynomial_value_and_derivative(irr_):
+
+        x = 1 + irr_
+
+        present_value = weighted_present_value = 0.0
+
+        for r, n in cash_flows:
+            discounted = r * x ** -n
+            present_value += discounted
+            weighted_present_value += n * discounted
+
+        value = s - present_value
+
+        return value, (n_k * value + weighted_present_value) / x
+
+    return return_polynomial_value_and_derivative
+
+
 def approximate_irr(
     net_principal,
     returns,
@@ -203,10 +308,14 @@ def approximate_irr(
         f^\\prime (X) = n_k s_\\circ X^{n_k - 1}
         - \\sum_{i=1}^{k-1} (n_k - n_i) r_i X^{n_k - n_i - 1}.
 
-    The polynomial :math:`f` and its derivative derivative :math:`f^\\prime`
-    are implemented as Python callables and passed to the Newton-Raphson
-    search implementation with the daily interest rate as initial approximation
-    for the IRR.
+    The polynomial :math:`f` and its derivative :math:`f^\\prime` are
+    evaluated together, scaled to avoid overflows, by the callable built by
+    `return_polynomial_value_and_derivative_factory`. The IRR is then
+    bracketed and approximated by a Newton-Raphson search safeguarded by
+    bisection, with the daily interest rate as initial approximation (see
+    `solve_irr`, which also returns convergence diagnostics). Solutions are
+    looked up in the process-wide `IRR_CACHE`. If no bracket is found, the
+    plain Newton-Raphson search is run from the daily interest rate instead.
 
     Parameters
     ----------
@@ -225,12 +334,594 @@ def approximate_irr(
         start point for the approximation of the IRR.
     """
 
-    return_polynomial = return_polynomial_factory(
-        net_principal, returns, return_days)
+    result = IRR_CACHE.solve_irr(
+        net_principal, returns, return_days, daily_interest_rate
+    )
+
+    if result.status == IrrStatus.failed:
+        # no bracket was found, hence the plain Newton-Raphson search is the
+        # best effort left
+        return newton_raphson_solver(
+            return_polynomial_value_and_derivative_factory(
+                net_principal, returns, return_days
+            ),
+            None,
+            daily_interest_rate,
+        )
+
+    return result.root
 
-    return_polynomial_derivative = return_polynomial_derivative_factory(
-        net_principal, returns, return_days)
 
-    return newton_raphson_solver(
-        return_polynomial, return_polynomial_derivative, daily_interest_rate
+def safeguarded_newton_solver(
+    target_function,
+    lower_bound,
+    upper_bound,
+    initial_point=None,
+    maximum_relative_error=0.0000000001,
+    max_iterations=100,
+    known_values=None,
+):
+    """Newton-Raphson solver safeguarded by bisection over a bracket.
+
+    Let :math:`f` be a continuous function whose values at the bounds
+    :math:`a` and :math:`b` have opposite signs, so that :math:`f` has a root
+    in :math:`\\left[a,b\\right]`. The bracket is shrunk at every iteration,
+    the current point replacing the bound at which :math:`f` has the same
+    sign. The next point is then given by a Newton-Raphson step (see
+    `newton_raphson_solver`) as long as
+
+    *   the derivative does not vanish,
+    *   the step lands strictly inside the bracket, and
+    *   the step is at most half as long as the step before the previous
+        one,
+
+    and by the midpoint of the bracket otherwise. Therefore, the iterations
+    never leave the bracket and converge at least as fast as bisection,
+    while keeping the quadratic convergence of Newton-Raphson near simple
+    roots.
+
+    The approximation stops when the relative error :math:`e_n` (as defined
+    in `newton_raphson_solver`) is less than `maximum_relative_error`, when a
+    root is hit exactly or when the bracket cannot be split anymore.
+
+    Parameters
+    ----------
+    target_function : Callable, required
+        Callable evaluating both :math:`f(x)` and :math:`f^{\\prime}(x)` at
+        once, returning them as a pair (see
+        `return_polynomial_value_and_derivative_factory`).
+    lower_bound : float, required
+        Lower bound of the bracket.
+    upper_bound : float, required
+        Upper bound of the bracket.
+    initial_point : float, optional
+        Initial approximation of the root, which is replaced by the midpoint
+        of the bracket if it does not lie within it. (default None)
+    maximum_relative_error : float, optional
+        (default 0.0000000001)
+    max_iterations : int, optional
+        (default 100)
+    known_values : dict, optional
+        Pairs :math:`(f(x),f^{\\prime}(x))` already evaluated, by point
+        :math:`x`, e.g., while the bracket was searched (see `bracket_irr`).
+        These points are not evaluated again. (default None)
+
+    Returns
+    -------
+    IrrResult
+        Named tuple with the approximated `root`, the number of `iterations`,
+        the `residual` :math:`f` at the root, the `status` (as in
+        `IrrStatus`) and the number of `evaluations` of the target function
+        (not counting the known values). If the values of :math:`f` at the
+        bounds do not have opposite signs, the status is `IrrStatus.failed`
+        and the root is the initial point.
+    """
+
+    values = {} if known_values is None else known_values
+    num_evaluations = [0]
+
+    def evaluate(x):
+        if x not in values:
+            num_evaluations[0] += 1
+            values[x] = target_function(x)
+        return values[x]
+
+    def result(root, iterations, residual, status):
+        return IrrResult(
+            root, iterations, residual, status, num_evaluations[0]
+        )
+
+    lower_value, _ = evaluate(lower_bound)
+    upper_value, _ = evaluate(upper_bound)
+
+    if lower_value == 0:
+        return result(lower_bound, 0, lower_value, IrrStatus.converged)
+    if upper_value == 0:
+        return result(upper_bound, 0, upper_value, IrrStatus.converged)
+
+    if (lower_value < 0) == (upper_value < 0):
+        point = lower_bound if initial_point is None else initial_point
+        return result(point, 0, evaluate(point)[0], IrrStatus.failed)
+
+    # bounds at which the target function is negative and positive
+    if lower_value < 0:
+        negative_bound, positive_bound = lower_bound, upper_bound
+    else:
+        negative_bound, positive_bound = upper_bound, lower_bound
+
+    if (
+        initial_point is None or
+        not min(lower_bound, upper_bound) <= initial_point <=
+        max(lower_bound, upper_bound)
+    ):
+        initial_point = (lower_bound + upper_bound) / 2.0
+
+    point = initial_point
+    value, derivative = evaluate(point)
+
+    step = previous_step = abs(upper_bound - lower_bound)
+
+    for num_iterations in range(1, max_iterations + 1):
+
+        if value == 0:
+            return result(
+                point, num_iterations - 1, value, IrrStatus.converged
+            )
+
+        if value < 0:
+            negative_bound = point
+        else:
+            positive_bound = point
+
+        lower, upper = sorted((negative_bound, positive_bound))
+
+        newton_point = (
+            point - value / derivative if derivative else None
+        )
+
+        if (
+            newton_point is not None and
+            lower < newton_point < upper and
+            abs(2 * (newton_point - point)) <= previous_step
+        ):
+            new_point = newton_point
+        else:
+            new_point = lower + (upper - lower) / 2.0
+
+        previous_step, step = step, abs(new_point - point)
+
+        bracket_exhausted = not lower < new_point < upper
+        converged = point != 0 and (
+            abs((new_point - point) / point) < maximum_relative_error
+        )
+
+        point = new_point
+        value, derivative = evaluate(point)
+
+        if converged or bracket_exhausted:
+            return result(point, num_iterations, value, IrrStatus.converged)
+
+    return result(point, max_iterations, value, IrrStatus.max_iterations)
+
+
+def bracket_irr(
+    target_function, initial_point, max_expansions=64, increasing=True
+):
+    """Find a bracket for the IRR, i.e., bounds where the NPV changes sign.
+
+    If every return is nonnegative, the scaled return polynomial
+
+    .. math::
+
+        g(c) = s_\\circ - \\sum_{i=1}^k r_i(1+c)^{-n_i}
+
+    (see `return_polynomial_value_and_derivative_factory`) is increasing for
+    :math:`c>-1`, so that it has at most one root. The bracket is then
+    searched around the initial point: if :math:`g` is negative there, the
+    root is above it and the upper bound is moved up, otherwise the root is
+    below it and the lower bound is moved down (at most halfway towards
+    :math:`-1`). The bound is moved by the absolute value of the initial
+    point at first, this step being doubled at each move. Therefore, a good
+    initial point (e.g., the IRR of similar returns) costs only two
+    evaluations and is kept as one of the bounds.
+
+    If some returns are negative, :math:`g` may have several roots, and the
+    least positive one is looked for by scanning forward from :math:`0` for
+    the first sign change of :math:`g`, over points increasing by a factor
+    of :math:`5/4` from a sixteenth of the initial point. Roots closer to
+    each other than the spacing of these points may be missed.
+
+    Parameters
+    ----------
+    target_function : Callable, required
+        Callable evaluating :math:`g` and its derivative, as built by
+        `return_polynomial_value_and_derivative_factory`.
+    initial_point : float, required
+        Initial approximation of the IRR.
+    max_expansions : int, optional
+        Maximum number of times a bound is moved. The forward scan visits
+        four times as many points. (default 64)
+    increasing : bool, optional
+        Whether :math:`g` is known to be increasing, i.e., whether every
+        return is nonnegative. (default True)
+
+    Returns
+    -------
+    tuple
+        The lower and upper bounds (both None if no bracket was found) and
+        a dict with the pairs :math:`(g(c),g^{\\prime}(c))` evaluated, by
+        point :math:`c`, which can be passed to `safeguarded_newton_solver`
+        as known values.
+    """
+
+    values = {}
+
+    def g(c):
+        if c not in values:
+            values[c] = target_function(c)
+        return values[c][0]
+
+    try:
+        if not increasing:
+            value_at_zero = g(0.0)
+            if value_at_zero == 0:
+                return 0.0, 0.0, values
+            lower_bound = 0.0
+            upper_bound = abs(initial_point) / 16 or 0.000001
+            for _ in range(4 * max_expansions):
+                if (g(upper_bound) < 0) != (value_at_zero < 0):
+                    return lower_bound, upper_bound, values
+                lower_bound, upper_bound = upper_bound, 1.25 * upper_bound
+            return None, None, values
+
+        point = initial_point if initial_point > -1 else 0.0
+        step = abs(point) or 0.01
+
+        if g(point) <= 0:
+            lower_bound = point
+            for _ in range(max_expansions):
+                upper_bound = lower_bound + step
+                if g(upper_bound) >= 0:
+                    return lower_bound, upper_bound, values
+                lower_bound, step = upper_bound, 2 * step
+        else:
+            upper_bound = point
+            for _ in range(max_expansions):
+                lower_bound = max(upper_bound - step, (upper_bound - 1) / 2)
+                if g(lower_bound) <= 0:
+                    return lower_bound, upper_bound, values
+                upper_bound, step = lower_bound, 2 * step
+    except (OverflowError, ZeroDivisionError):
+        pass
+
+    return None, None, values
+
+
+def solve_irr(
+    net_principal,
+    returns,
+    return_days,
+    daily_interest_rate,
+    maximum_relative_error=0.0000000001,
+    max_iterations=100,
+):
+    """Solve the internal return rate of a series of returns.
+
+    The IRR (see `approximate_irr`) is bracketed by `bracket_irr` and then
+    approximated by `safeguarded_newton_solver`, starting from the daily
+    interest rate. Unlike a plain Newton-Raphson search, the iterations
+    cannot leave the bracket nor divide by a vanishing derivative, and the
+    returned diagnostics tell whether the approximation converged.
+
+    Parameters
+    ----------
+    net_principal: float, required
+        The principal used as reference to evaluate the irr.
+    returns: list, required
+        List of expected returns or due payments.
+    return_days: list, required
+        List of number of days since the loan was granted until each expected
+        return.
+    daily_interest_rate: float, required
+        Initial approximation for the IRR.
+    maximum_relative_error : float, optional
+        (default 0.0000000001)
+    max_iterations : int, optional
+        (default 100)
+
+    Returns
+    -------
+    IrrResult
+        Named tuple with the approximated `root`, the number of `iterations`,
+        the `residual` (i.e., the net present value :math:`g` at the root),
+        the `status` (as in `IrrStatus`) and the number of `evaluations` of
+        :math:`g`, including those spent searching the bracket. If no bracket
+        is found, the status is `IrrStatus.failed` and the root is the daily
+        interest rate.
+    """
+
+    target_function = return_polynomial_value_and_derivative_factory(
+        net_principal, returns, return_days
+    )
+
+    lower_bound, upper_bound, values = bracket_irr(
+        target_function,
+        daily_interest_rate,
+        increasing=all(r >= 0 for r in returns),
+    )
+
+    num_evaluations = len(values)
+
+    if lower_bound is None:
+        if daily_interest_rate in values:
+            residual, _ = values[daily_interest_rate]
+        else:
+            try:
+                residual, _ = target_function(daily_interest_rate)
+                num_evaluations += 1
+            except (OverflowError, ZeroDivisionError):
+                residual = float('nan')
+        return IrrResult(
+            daily_interest_rate, 0, residual, IrrStatus.failed, num_evaluations
+        )
+
+    result = safeguarded_newton_solver(
+        target_function,
+        lower_bound,
+        upper_bound,
+        daily_interest_rate,
+        maximum_relative_error,
+        max_iterations,
+        values,
     )
+
+    return result._replace(evaluations=num_evaluations + result.evaluations)
+
+
+class IrrCache(object):
+    """Bounded LRU cache of IRR solutions by cash flow fingerprint.
+
+    The IRR of a series of returns only depends on the net principal, the
+    returns, the return days and the tolerance of the approximation, so that
+    the solution for the most recently used of these fingerprints is kept
+    and reused. Repeated evaluations of the same grossup, as well as loans of
+    the same product taken by different borrowers, are then solved once.
+
+    Only converged solutions are cached, since the remaining ones depend on
+    the initial approximation. A cached solution is returned regardless of
+    the initial approximation given, with no iterations nor evaluations, as
+    nothing was solved. A cache with `maxsize` 0 always solves the IRR.
+
+    The fingerprints are kept as bytes, with 16 bytes per return, so that
+    they are compared in full and distinct cash flows never collide. Each
+    solution then costs about 6 KB for 360 returns, hence the default
+    `maxsize` bounds the cache to about 6 MB for such loans.
+
+    The cache is safe to be shared among threads.
+
+    Parameters
+    ----------
+    maxsize: int, optional
+        Maximum number of solutions kept. When it is exceeded, the least
+        recently used solution is evicted. (default 1024)
+    """
+
+    def __init__(self, maxsize=1024):
+        """Initialize cache."""
+
+        self.maxsize = maxsize
+
+        self._results = OrderedDict()
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def fingerprint(
+        net_principal, returns, return_days, maximum_relative_error
+    ):
+        """Fingerprint of a series of returns, packed as bytes of doubles."""
+
+        returns = list(returns)
+
+        return array(
+            'd',
+            [net_principal, maximum_relative_error, len(returns)] +
+            returns +
+            list(return_days),
+        ).tobytes()
+
+    def solve_irr(
+        self,
+        net_principal,
+        returns,
+        return_days,
+        daily_interest_rate,
+        maximum_relative_error=0.0000000001,
+        max_iterations=100,
+    ):
+        """Get the IRR solution for the given parameters.
+
+        The IRR is solved by `solve_irr` and cached on a miss.
+
+        Returns
+        -------
+        IrrResult
+            The IRR with convergence diagnostics.
+        """
+
+        key = self.fingerprint(
+            net_principal, returns, return_days, maximum_relative_error
+        )
+
+        with self._lock:
+
+            result = self._results.get(key)
+
+            if result is not None:
+                self.hits += 1
+                self._results.move_to_end(key)
+                return result._replace(iterations=0, evaluations=0)
+
+            self.misses += 1
+
+        result = solve_irr(
+            net_principal,
+            returns,
+            return_days,
+            daily_interest_rate,
+            maximum_relative_error,
+            max_iterations,
+        )
+
+        if result.status != IrrStatus.converged:
+            return result
+
+        with self._lock:
+
+            self._results[key] = result
+
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+                self.evictions += 1
+
+        return result
+
+    @property
+    def hit_rate(self):
+        """Fraction of the lookups which were hits."""
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return float(self.hits) / lookups if lookups else 0.0
+
+    def cache_info(self):
+        """Report the cache statistics, as in `functools.lru_cache`."""
+
+        with self._lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.maxsize,
+                len(self._results),
+            )
+
+    def clear(self):
+        """Evict all solutions and reset the statistics."""
+
+        with self._lock:
+            self._results.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+# process-wide cache shared by grossups, quotes and projections
+IRR_CACHE = IrrCache()
+
+
+def _pad_rows(rows, dtype):
+    """Build a zero padded matrix from a sequence of rows."""
+
+    import numpy as np
+
+    if isinstance(rows, np.ndarray) and rows.ndim == 2:
+        return rows.astype(dtype)
+
+    padded = np.zeros((len(rows), max([len(r) for r in rows] + [0])), dtype)
+    for i, row in enumerate(rows):
+        padded[i, :len(row)] = row
+
+    return padded
+
+
+def batch_approximate_irr(
+    net_principals,
+    returns,
+    return_days,
+    daily_interest_rates,
+    maximum_relative_error=0.0000000001,
+    max_iterations=100,
+):
+    """Approximate the internal return rates of many series of returns.
+
+    This is the vectorized counterpart of `approximate_irr`: Newton-Raphson
+    iterations run for all the series at once over NumPy arrays. Each series
+    keeps its own convergence state, and only the series which did not
+    converge yet are evaluated in each iteration.
+
+    The iterations are evaluated over the net present value
+
+    .. math::
+
+        g(c) = s_\\circ - \\sum_{i=1}^k \\frac{r_i}{(1+c)^{n_i}}
+        = \\frac{f(c)}{(1+c)^{n_k}},
+
+    which has the same roots as the return polynomial :math:`f` for
+    :math:`c>-1`, while no power grows with the horizon :math:`n_k`.
+
+    This function requires NumPy, which is an optional dependency.
+
+    Parameters
+    ----------
+    net_principals: array_like, required
+        Net principal of each series, with shape `(N,)`.
+    returns: array_like, required
+        Returns of each series, either as a sequence of sequences or as a zero
+        padded array with shape `(N, K)`.
+    return_days: array_like, required
+        Return days of each series, with the same shape as `returns`.
+    daily_interest_rates: array_like, required
+        Initial approximation of each IRR, with shape `(N,)`.
+    maximum_relative_error: float, optional
+        (default 0.0000000001)
+    max_iterations: int, optional
+        (default 100)
+
+    Returns
+    -------
+    BatchIrrResult
+        Named tuple with the arrays `irrs`, `iterations` and `statuses` (as
+        in `IrrStatus`), each with shape `(N,)`.
+    """
+
+    import numpy as np
+
+    s = np.asarray(net_principals, dtype=float)
+    r = _pad_rows(returns, float)
+    n = _pad_rows(return_days, float)
+
+    irrs = np.array(daily_interest_rates, dtype=float)
+    iterations = np.zeros(len(s), dtype=np.int64)
+    statuses = np.full(len(s), IrrStatus.max_iterations, dtype=np.int64)
+
+    active = np.arange(len(s))
+
+    for _ in range(max_iterations):
+
+        if not len(active):
+            break
+
+        c = irrs[active]
+        discounted = r[active] * (1 + c[:, None]) ** -n[active]
+
+        value = s[active] - discounted.sum(axis=1)
+        derivative = (n[active] * discounted).sum(axis=1) / (1 + c)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            new_c = c - value / derivative
+            relative_error = np.abs((new_c - c) / c)
+
+        iterations[active] += 1
+
+        failed = ~np.isfinite(new_c) | (new_c <= -1)
+        converged = ~failed & (relative_error < maximum_relative_error)
+
+        irrs[active] = np.where(failed, c, new_c)
+        statuses[active[failed]] = IrrStatus.failed
+        statuses[active[converged]] = IrrStatus.converged
+
+        active = active[~(failed | converged)]
+
+    return BatchIrrResult(irrs, iterations, statuses)
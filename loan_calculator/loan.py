@@ -1,7 +1,14 @@
 from datetime import timedelta
+from numbers import Integral
 
 from loan_calculator.schedule import SCHEDULE_TYPE_CLASS_MAP
-from loan_calculator.schedule.base import AmortizationScheduleType
+from loan_calculator.schedule.base import (
+    AmortizationScheduleType, SCHEDULE_COLUMNS
+)
+from loan_calculator.day_count import ActualDayCount
+from loan_calculator.discount import calculate_discount_factors
+from loan_calculator.ordinals import to_ordinal, to_ordinals
+from loan_calculator.prepayment import Prepayment, ReamortizationType
 from loan_calculator.interest_rate import (
     convert_to_daily_interest_rate, InterestRateType, YearSizeType)
 
@@ -17,10 +24,13 @@ class Loan(object):
         The loan's annual interest rate.
     start_date : date, required
         The loan's reference date. This date is usually the one when the
-        borrower signed the loan's contract.
+        borrower signed the loan's contract. It can also be given as an
+        integer ordinal or as a `numpy.datetime64` (see `ordinals`).
     return_dates : list, required
         List of date objects with the expected return dates. These dates
-        are usually contractually agreed.
+        are usually contractually agreed. They can also be given as integer
+        ordinals or as a `numpy.datetime64` array, in which case no `date`
+        object is ever created.
     year_size : int, optional
         The reference year size for converting from annual to daily
         interest rates. (default 365)
@@ -30,8 +40,28 @@ class Loan(object):
     amortization_schedule_type : str, optional
         A discriminator string indicating the amortization schedule to be
         adopted. The available schedules are progressive_price_schedule,
-        regressive_price_schedule, constant_amortization_schedule.
+        regressive_price_schedule, constant_amortization_schedule and
+        custom_amortization_schedule.
         (default AmortizationScheduleType.progressive_price_schedule.value).
+    schedule_cache : UnitScheduleCache, optional
+        Cache of unit principal schedules. If given, the amortization
+        schedule is scaled from a cached unit schedule instead of being
+        calculated from scratch. (default None)
+    day_count_convention : DayCountConvention, optional
+        Convention defining the number of days from the capitalization start
+        date until each return date and the year size, which then overrides
+        `year_size`. (default None, i.e., actual calendar days over a year
+        of `year_size` days)
+    amortization_weights : list, optional
+        Fraction of the principal amortized by each payment, for custom
+        amortization schedules (see `schedule.custom`). (default None, i.e.,
+        a bullet loan)
+
+    Raises
+    ------
+    ValueError
+        If the grace period exceeds a return date or if amortization weights
+        are given for a schedule other than a custom amortization schedule.
     """
 
     def __init__(
@@ -44,10 +74,20 @@ class Loan(object):
         grace_period=0,
         amortization_schedule_type=(
             AmortizationScheduleType.progressive_price_schedule.value
-        )
+        ),
+        schedule_cache=None,
+        day_count_convention=None,
+        amortization_weights=None,
     ):
         """Initialize loan."""
 
+        if day_count_convention is None:
+            day_count_convention = ActualDayCount(year_size)
+        else:
+            year_size = day_count_convention.year_size
+
+        self.day_count_convention = day_count_convention
+
         self.principal = principal
 
         self.annual_interest_rate = annual_interest_rate
@@ -59,10 +99,22 @@ class Loan(object):
         )
 
         self.start_date = start_date
-        self.capitalization_start_date = start_date + timedelta(grace_period)
-
         self.return_dates = return_dates
 
+        # ordinals are cached, so that day counts are integer subtractions
+        self.start_ordinal = to_ordinal(start_date)
+        self.return_ordinals = to_ordinals(return_dates)
+        self.capitalization_start_ordinal = (
+            self.start_ordinal + grace_period
+        )
+
+        if isinstance(start_date, Integral):
+            self.capitalization_start_date = self.capitalization_start_ordinal
+        else:
+            self.capitalization_start_date = (
+                start_date + timedelta(grace_period)
+            )
+
         self.year_size = year_size
         self.grace_period = grace_period
 
@@ -74,19 +126,105 @@ class Loan(object):
             self.amortization_schedule_type
         ]
 
-        if any(
-            self.capitalization_start_date >= r_date
-            for r_date in self.return_dates
+        if amortization_weights is not None and (
+            self.amortization_schedule_type is not
+            AmortizationScheduleType.custom_amortization_schedule
         ):
+            raise ValueError(
+                'Amortization weights are only supported by custom '
+                'amortization schedules.'
+            )
+
+        return_days = day_count_convention.day_counts(
+            self.capitalization_start_ordinal, self.return_ordinals
+        )
+
+        if any(r_day <= 0 for r_day in return_days):
             raise ValueError('Grace period can not exceed loan start.')
 
-        self.amortization_schedule = self.amortization_schedule_cls(
+        self.schedule_cache = schedule_cache
+        self.amortization_weights = amortization_weights
+
+        if schedule_cache is None or amortization_weights is not None:
+            self.amortization_schedule = self.build_schedule(
+                principal,
+                self.daily_interest_rate,
+                return_days,
+                self.calculate_discount_factors(return_days),
+            )
+        else:
+            self.amortization_schedule = schedule_cache.schedule(
+                self.amortization_schedule_cls,
+                principal,
+                self.daily_interest_rate,
+                return_days,
+            )
+
+    def calculate_discount_factors(self, return_days, start_ordinal=None):
+        """Discount factors of the given days since the capitalization start.
+
+        Subclasses with other accrual rules than a constant daily interest
+        rate override this method to provide the discount factors of the
+        schedule, grossups and prepayments, hence the days can also be
+        counted since another date, given by its ordinal.
+
+        Parameters
+        ----------
+        return_days : list, required
+            Numbers of days since the start date.
+        start_ordinal : int, optional
+            Ordinal of the date from which the days are counted. It does not
+            affect loans with a constant daily interest rate. (default None,
+            i.e., the capitalization start date)
+        """
+        return calculate_discount_factors(
+            self.daily_interest_rate, return_days
+        )
+
+    def build_schedule(
+        self,
+        principal,
+        daily_interest_rate,
+        return_days,
+        discount_factors=None,
+    ):
+        """Build a schedule of the loan's type for the given parameters.
+
+        The amortization weights of custom amortization schedules are passed
+        along with the usual schedule parameters.
+        """
+
+        if self.amortization_weights is None:
+            return self.amortization_schedule_cls(
+                principal, daily_interest_rate, return_days, discount_factors
+            )
+
+        return self.amortization_schedule_cls(
+            principal,
+            daily_interest_rate,
+            return_days,
+            discount_factors,
+            self.amortization_weights,
+        )
+
+    def with_principal(self, principal):
+        """Build a loan with the same terms and the given principal.
+
+        This is how grossups build the grossed up loan, hence subclasses
+        with further terms override it to carry them along.
+        """
+
+        return Loan(
             principal,
-            self.daily_interest_rate,
-            [
-                (r_date - self.capitalization_start_date).days
-                for r_date in return_dates
-            ]
+            self.annual_interest_rate,
+            self.start_date,
+            self.return_dates,
+            self.year_size,
+            self.grace_period,
+            self.amortization_schedule_type,
+            self.schedule_cache,
+            self.day_count_convention,
+            self.amortization_weights,
         )
 
     @property
@@ -94,7 +232,7 @@ class Loan(object):
 
         def f_(principal, daily_interest_rate, return_days):
 
-            return self.amortization_schedule_cls(
+            return self.build_schedule(
                 principal, daily_interest_rate, return_days
             ).amortizations
 
@@ -133,3 +271,109 @@ class Loan(object):
     @property
     def total_paid(self):
         return self.amortization_schedule.total_paid  # pragma: no cover
+
+    def iter_rows(self, reference_date=None):
+        """Iterate over the loan's schedule, one instalment at a time.
+
+        Rows are streamed from `BaseSchedule.iter_rows`, hence very long
+        schedules are traversed in constant memory.
+
+        Parameters
+        ----------
+        reference_date : date, optional
+            Date object with the date to consider as reference when
+            calculating the number of days of each row. (default None, i.e.,
+            the loan's start date)
+
+        Yields
+        ------
+        tuple
+            The return date, the number of days since the reference date, the
+            balance after the payment, the amortization, the interest and the
+            due payment of each instalment.
+        """
+
+        reference_ordinal = to_ordinal(
+            self.start_date if reference_date is None else reference_date
+        )
+
+        for r_date, r_ordinal, row in zip(
+            self.return_dates,
+            self.return_ordinals,
+            self.amortization_schedule.iter_rows(),
+        ):
+            yield (r_date, r_ordinal - reference_ordinal) + tuple(row[1:])
+
+    def prepay(
+        self,
+        prepayment_date,
+        amount,
+        reamortization_type=ReamortizationType.keep_term.value,
+    ):
+        """Prepay part of the loan and re-amortize its remaining balance.
+
+        Parameters
+        ----------
+        prepayment_date : date, required
+            Date of the prepayment.
+        amount : float, required
+            Prepaid amount.
+        reamortization_type : str, optional
+            Either keep the term (lower instalments) or keep the PMT (shorter
+            term). (default ReamortizationType.keep_term.value)
+
+        Returns
+        -------
+        Prepayment
+            The prepayment, keeping the instalments due up to the prepayment
+            date and a schedule for the remaining balance.
+        """
+
+        return Prepayment(self, prepayment_date, amount, reamortization_type)
+
+    def to_numpy(self):
+        """View the amortization schedule as a NumPy array.
+
+        The array has a row for the start date followed by a row for each
+        return date, and a column for each entry of `SCHEDULE_COLUMNS`
+        (balance, amortizations, interest payments and due payments). It is
+        a view over the buffer returned by
+        `amortization_schedule.to_array()`, hence no data is copied.
+
+        This method requires NumPy, which is an optional dependency.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array with shape :math:`(k+1, 4)`.
+        """
+
+        import numpy as np
+
+        return np.frombuffer(
+            self.amortization_schedule.to_array()
+        ).reshape(len(SCHEDULE_COLUMNS), -1).T
+
+    def to_frame(self):
+        """View the amortization schedule as a pandas DataFrame.
+
+        The frame is indexed by the start date followed by the return dates,
+        has a column for each entry of `SCHEDULE_COLUMNS` and is built over
+        the array returned by `to_numpy` without copying it.
+
+        This method requires pandas, which is an optional dependency.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Frame with :math:`k+1` rows and 4 columns.
+        """
+
+        import pandas as pd
+
+        return pd.DataFrame(
+            self.to_numpy(),
+            index=[self.start_date] + list(self.return_dates),
+            columns=list(SCHEDULE_COLUMNS),
+            copy=False,
+        )
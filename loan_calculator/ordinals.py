@@ -0,0 +1,78 @@
+"""Conversion of dates to integer day ordinals.
+
+Day counts are evaluated as differences of proleptic Gregorian ordinals (as
+in `date.toordinal`), so that dates can be given as `date` objects, as
+precomputed integer ordinals or as `numpy.datetime64` values. Integer day
+offsets are a particular case of ordinals: if the start date is given as `0`,
+return dates given as offsets since the start are handled as ordinals.
+"""
+
+from datetime import date
+from numbers import Integral
+
+
+# ordinal of numpy.datetime64's epoch, date(1970, 1, 1)
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def to_ordinal(value):
+    """Convert a date, an integer ordinal or a `numpy.datetime64` to ordinal.
+
+    Parameters
+    ----------
+    value : date, int or numpy.datetime64, required
+        Value to be converted. Integers are considered ordinals already.
+
+    Returns
+    -------
+    int
+        The proleptic Gregorian ordinal of the given value.
+    """
+
+    if isinstance(value, Integral):
+        return int(value)
+
+    if isinstance(value, date):
+        return value.toordinal()
+
+    # numpy.datetime64 counts days since the epoch when cast to days
+    return int(value.astype('datetime64[D]').astype('int64')) + EPOCH_ORDINAL
+
+
+def to_ordinals(values):
+    """Convert a sequence of dates, ordinals or `numpy.datetime64` values.
+
+    NumPy arrays of integers or of `numpy.datetime64` are converted in a
+    single vectorized pass, without any `date` object being created.
+
+    Parameters
+    ----------
+    values : list or numpy.ndarray, required
+        Values to be converted.
+
+    Returns
+    -------
+    list
+        List with the ordinal of each value.
+    """
+
+    kind = getattr(getattr(values, 'dtype', None), 'kind', None)
+
+    if kind == 'M':
+        return (
+            values.astype('datetime64[D]').astype('int64') + EPOCH_ORDINAL
+        ).tolist()
+
+    if kind in ('i', 'u'):
+        return values.tolist()
+
+    return [to_ordinal(value) for value in values]
+
+
+def to_date(value):
+    """Convert a date, an integer ordinal or a `numpy.datetime64` to date."""
+
+    if isinstance(value, date):
+        return value
+
+    return date.fromordinal(to_ordinal(value))
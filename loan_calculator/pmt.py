@@ -1,6 +1,9 @@
+from loan_calculator.discount import calculate_discount_factors
 
 
-def constant_return_pmt(principal, daily_interest_rate, return_days):
+def constant_return_pmt(
+    principal, daily_interest_rate, return_days, discount_factors=None
+):
     """Calculate the PMT (payment value) for the given parameters.
 
     If :math:`s` is the principal, :math:`d` is the daily interest rate and
@@ -24,14 +27,22 @@ def constant_return_pmt(principal, daily_interest_rate, return_days):
     return_days : list, required
         List of integers representing the numbers of days since the start
         reference date.
+    discount_factors : list, optional
+        Precomputed discount factors :math:`1/(1+d)^{n_j}` for the given
+        return days, as returned by `discount.calculate_discount_factors`.
+        They are evaluated if not given. (default None)
 
     Returns
     -------
     The required payment value for the given parameters.
     """
 
+    if discount_factors is None:
+        discount_factors = calculate_discount_factors(
+            daily_interest_rate, return_days
+        )
+
     # variables are renamed in order to make the math more explicit
     p = principal
-    d = daily_interest_rate
 
-    return p / sum(1.0 / (1 + d) ** n for n in return_days)
+    return p / sum(discount_factors)
@@ -0,0 +1,274 @@
+from bisect import bisect_right
+from enum import Enum
+from math import ceil
+
+from loan_calculator.ordinals import to_ordinal
+from loan_calculator.schedule import (
+    ProgressivePriceSchedule,
+    RegressivePriceSchedule,
+    ConstantAmortizationSchedule,
+)
+from loan_calculator.term import TermSolver
+
+
+class ReamortizationType(Enum):
+
+    keep_term = 'keep-term'
+    keep_pmt = 'keep-pmt'
+
+
+def price_keep_pmt_term(schedule, principal, return_days, discount_factors):
+    """Least number of instalments whose PMT does not exceed the schedule's.
+
+    Since :math:`\\mathrm{PMT}(s,d,(n_1,\\ldots,n_m)) = s/S_m`, where
+    :math:`S_m` is the sum of the first :math:`m` discount factors, this is
+    the least :math:`m` such that :math:`S_m\\geq s/P`, :math:`P` being the
+    PMT of the given schedule, as found by `term.TermSolver`.
+    """
+
+    term = TermSolver(
+        principal,
+        schedule.daily_interest_rate,
+        return_days,
+        discount_factors,
+    ).minimal_term(schedule.pmt)
+
+    return len(discount_factors) if term is None else term
+
+
+def constant_keep_pmt_term(schedule, principal, return_days, discount_factors):
+    """Least number of instalments keeping the schedule's amortization.
+
+    In a constant amortization schedule the instalments vary, so the
+    amortization :math:`s/k` is kept instead and the remaining principal is
+    amortized over :math:`\\lceil s^\\prime k/s\\rceil` instalments.
+    """
+
+    amortization = schedule.principal / len(schedule.return_days)
+
+    return max(
+        1,
+        min(
+            # tolerance absorbs rounding of exact multiples
+            int(ceil(principal / amortization - 1e-9)),
+            len(discount_factors)
+        )
+    )
+
+
+class Prepayment(object):
+    """Partial prepayment of a loan and re-amortization of its balance.
+
+    The instalments due up to the prepayment date are kept untouched. The
+    balance after the last of them is capitalized until the prepayment date,
+    reduced by the prepaid amount and re-amortized over the remaining return
+    dates with the loan's amortization schedule type, so that only the tail
+    of the schedule is evaluated again. The loan's return dates are assumed
+    to be increasing.
+
+    The re-amortization either
+
+    *   keeps the term, i.e., all the remaining return dates are kept and the
+        instalments are reduced, or
+    *   keeps the PMT, i.e., the remaining balance is amortized over the
+        least number of remaining return dates for which the instalments do
+        not exceed the current PMT. For constant amortization schedules, the
+        constant amortization is kept instead.
+
+    Parameters
+    ----------
+    loan : Loan, required
+        Loan being prepaid.
+    prepayment_date : date, required
+        Date of the prepayment, which can also be given as an integer
+        ordinal or as a `numpy.datetime64` (see `ordinals`).
+    amount : float, required
+        Prepaid amount.
+    reamortization_type : str, optional
+        A discriminator string indicating how the remaining balance is
+        re-amortized. (default ReamortizationType.keep_term.value)
+
+    Raises
+    ------
+    ValueError
+        If there are no instalments due after the prepayment date, if the
+        amount is not positive or settles the whole outstanding balance or if
+        the PMT is to be kept for a custom amortization schedule.
+    """
+
+    def __init__(
+        self,
+        loan,
+        prepayment_date,
+        amount,
+        reamortization_type=ReamortizationType.keep_term.value,
+    ):
+        """Initialize prepayment."""
+
+        self.loan = loan
+        self.prepayment_date = prepayment_date
+        self.amount = amount
+        self.reamortization_type = ReamortizationType(reamortization_type)
+
+        schedule = loan.amortization_schedule
+
+        prepayment_ordinal = to_ordinal(prepayment_date)
+
+        self.num_paid_instalments = bisect_right(
+            loan.return_ordinals, prepayment_ordinal
+        )
+
+        if self.num_paid_instalments == len(loan.return_dates):
+            raise ValueError('There are no instalments after the prepayment.')
+
+        last_paid_day = (
+            schedule.return_days[self.num_paid_instalments - 1]
+            if self.num_paid_instalments else 0
+        )
+        prepayment_day = loan.day_count_convention.day_count(
+            loan.capitalization_start_ordinal, prepayment_ordinal
+        )
+
+        self.prepayment_ordinal = prepayment_ordinal
+        self.outstanding_balance = self.accrue(
+            schedule.balance[self.num_paid_instalments],
+            max(prepayment_day - last_paid_day, 0),
+        )
+
+        if not 0 < amount < self.outstanding_balance:
+            raise ValueError(
+                'Prepayment amount must be positive and less than the '
+                'outstanding balance.'
+            )
+
+        remaining_principal = self.outstanding_balance - amount
+
+        remaining_return_dates = list(
+            loan.return_dates[self.num_paid_instalments:]
+        )
+        # interest does not accrue during the grace period
+        remaining_start_ordinal = max(
+            prepayment_ordinal, loan.capitalization_start_ordinal
+        )
+        remaining_return_days = loan.day_count_convention.day_counts(
+            remaining_start_ordinal,
+            loan.return_ordinals[self.num_paid_instalments:],
+        )
+        discount_factors = loan.calculate_discount_factors(
+            remaining_return_days, remaining_start_ordinal
+        )
+
+        num_instalments = len(remaining_return_days)
+
+        if self.reamortization_type is ReamortizationType.keep_pmt:
+
+            keep_pmt_term = {
+                ProgressivePriceSchedule: price_keep_pmt_term,
+                RegressivePriceSchedule: price_keep_pmt_term,
+                ConstantAmortizationSchedule: constant_keep_pmt_term,
+            }.get(loan.amortization_schedule_cls)
+
+            if keep_pmt_term is None:
+                raise ValueError(
+                    'Amortization schedule does not support keeping the PMT.'
+                )
+
+            num_instalments = keep_pmt_term(
+                schedule,
+                remaining_principal,
+                remaining_return_days,
+                discount_factors,
+            )
+
+        self.remaining_return_dates = remaining_return_dates[:num_instalments]
+
+        remaining_return_days = remaining_return_days[:num_instalments]
+        discount_factors = discount_factors[:num_instalments]
+
+        self.remaining_schedule = self.build_remaining_schedule(
+            remaining_principal, remaining_return_days, discount_factors
+        )
+
+    def accrue(self, balance, days):
+        """Accrue the balance after the last paid instalment for some days.
+
+        The balance is divided by the loan's discount factor of the days
+        since the last paid return date (or the capitalization start date),
+        so that it accrues with the loan's own accrual rule.
+        """
+
+        loan = self.loan
+
+        last_paid_ordinal = (
+            loan.return_ordinals[self.num_paid_instalments - 1]
+            if self.num_paid_instalments
+            else loan.capitalization_start_ordinal
+        )
+
+        return balance / loan.calculate_discount_factors(
+            [days], last_paid_ordinal
+        )[0]
+
+    def build_remaining_schedule(
+        self, principal, return_days, discount_factors
+    ):
+        """Build the schedule re-amortizing the remaining principal.
+
+        The return days are counted since the prepayment date, or since the
+        end of the loan's grace period if the prepayment is made during it,
+        so that no interest accrues over the grace period. Subclasses
+        override this method to build schedules of other kinds.
+        """
+
+        loan = self.loan
+
+        if loan.amortization_weights is None:
+            return loan.amortization_schedule_cls(
+                principal,
+                loan.daily_interest_rate,
+                return_days,
+                discount_factors,
+            )
+
+        # the remaining weights are normalized to add up to one again
+        remaining_weights = loan.amortization_weights[
+            self.num_paid_instalments:
+        ]
+        total_weight = sum(remaining_weights)
+
+        return loan.amortization_schedule_cls(
+            principal,
+            loan.daily_interest_rate,
+            return_days,
+            discount_factors,
+            [w / total_weight for w in remaining_weights],
+        )
+
+    @property
+    def paid_return_dates(self):
+        return list(self.loan.return_dates[:self.num_paid_instalments])
+
+    @property
+    def return_dates(self):
+        return self.paid_return_dates + self.remaining_return_dates
+
+    @property
+    def due_payments(self):
+        return (
+            self.loan.due_payments[:self.num_paid_instalments] +
+            self.remaining_schedule.due_payments
+        )
+
+    @property
+    def interest_payments(self):
+        return (
+            self.loan.interest_payments[:self.num_paid_instalments] +
+            self.remaining_schedule.interest_payments
+        )
+
+    @property
+    def amortizations(self):
+        return (
+            self.loan.amortizations[:self.num_paid_instalments] +
+            self.remaining_schedule.amortizations
+        )
@@ -1,15 +1,34 @@
 from loan_calculator.grossup import GrossupType, GROSSUP_TYPE_CLASS_MAP
+from loan_calculator.irr import IrrStatus
 
 
 class Projection(object):
     """Project loan grossup for given projection dates.
 
     The grossup of a loan is dependent of a reference data, usually interpreted
-    as the associated taxable event date
+    as the associated taxable event date. Projection dates can be given as
+    dates, integer ordinals or a `numpy.datetime64` array (see `ordinals`).
+
+    The projected IRRs are solved in increasing order of the projection
+    dates, since close reference dates yield nearly the same returns and
+    hence nearly the same IRRs. Each IRR is then seeded with the linear
+    extrapolation of the two previously converged IRRs (or with the previous
+    one, for the second date), while the first one is seeded with the loan's
+    daily interest rate. The iterations spent by each solution are exposed
+    by `projected_irr_iterations`, and the evaluations of the net present
+    value (including those spent searching brackets around the initial
+    points) by `projected_irr_evaluations`. IRRs found in the given
+    `irr_cache` (by default, the process-wide `irr.IRR_CACHE`) are reported
+    with no iterations nor evaluations.
     """
 
     def __init__(
-        self, loan, projection_dates, grossup_type=GrossupType.iof, *args
+        self,
+        loan,
+        projection_dates,
+        grossup_type=GrossupType.iof,
+        *args,
+        irr_cache=None
     ):
 
         self.loan = loan
@@ -23,6 +42,63 @@ class Projection(object):
             for reference_date in projection_dates
         ]
 
+        self.irr_cache = irr_cache
+        self._irr_results = None
+
+    def _extrapolate(self, solved, reference_ordinal):
+        """Initial IRR approximation from the (ordinal, IRR) pairs solved."""
+
+        if not solved:
+            return self.loan.daily_interest_rate
+
+        ordinal, irr = solved[-1]
+
+        if len(solved) == 1 or solved[-2][0] == ordinal:
+            return irr
+
+        previous_ordinal, previous_irr = solved[-2]
+
+        extrapolated = irr + (irr - previous_irr) * (
+            float(reference_ordinal - ordinal) / (ordinal - previous_ordinal)
+        )
+
+        return extrapolated if extrapolated > -1 else irr
+
+    @property
+    def irr_results(self):
+        """IRRs with convergence diagnostics, in the projection dates order.
+
+        Returns
+        -------
+        list
+            List of `irr.IrrResult`, one for each projection date.
+        """
+
+        if self._irr_results is None:
+
+            order = sorted(
+                range(len(self.projections)),
+                key=lambda i: self.projections[i].reference_ordinal,
+            )
+
+            results = [None] * len(order)
+            solved = []
+
+            for i in order:
+                projection = self.projections[i]
+                results[i] = projection.solve_irr(
+                    self._extrapolate(solved, projection.reference_ordinal),
+                    self.irr_cache,
+                )
+                if results[i].status == IrrStatus.converged:
+                    solved.append(
+                        (projection.reference_ordinal, results[i].root)
+                    )
+
+            self._irr_results = results
+
+        return self._irr_results
+
     @property
     def projected_principals(self):
         for projection in self.projections:
@@ -30,5 +106,15 @@ class Projection(object):
 
     @property
     def projected_irrs(self):
-        for projection in self.projections:
-            yield projection.irr
+        for result in self.irr_results:
+            yield result.root
+
+    @property
+    def projected_irr_iterations(self):
+        for result in self.irr_results:
+            yield result.iterations
+
+    @property
+    def projected_irr_evaluations(self):
+        for result in self.irr_results:
+            yield result.evaluations
@@ -0,0 +1,204 @@
+"""Quote several amortization schedules for the same loan parameters.
+
+A quote evaluates, for each of the requested amortization schedule types,
+the schedule of the loan, its IOF grossup and the IRR over the net
+principal. All of them share the same intermediates: the daily interest
+rate, the return ordinals and day counts and the discount factors are
+evaluated once for the whole quote, and each grossed up schedule is scaled
+from the base schedule instead of being calculated again.
+"""
+
+from collections import namedtuple
+
+from loan_calculator.day_count import ActualDayCount
+from loan_calculator.discount import calculate_discount_factors
+from loan_calculator.grossup.functions import (
+    br_iof_unit_amortization_grossup
+)
+from loan_calculator.grossup.iof import IOF_GROSSUP_FUNCTION_MAP
+from loan_calculator.interest_rate import (
+    convert_to_daily_interest_rate, InterestRateType, YearSizeType
+)
+from loan_calculator.irr import approximate_irr
+from loan_calculator.ordinals import to_ordinal, to_ordinals
+from loan_calculator.schedule import SCHEDULE_TYPE_CLASS_MAP
+from loan_calculator.schedule.base import AmortizationScheduleType
+
+
+# schedule types quoted by default
+QUOTE_SCHEDULE_TYPES = (
+    AmortizationScheduleType.progressive_price_schedule,
+    AmortizationScheduleType.regressive_price_schedule,
+    AmortizationScheduleType.constant_amortization_schedule,
+)
+
+
+ScheduleQuote = namedtuple(
+    'ScheduleQuote',
+    ['schedule', 'grossed_up_principal', 'grossed_up_schedule', 'irr'],
+)
+
+
+class Quote(object):
+    """Quote of a loan with several amortization schedules at once.
+
+    For each schedule type, the quote holds a `ScheduleQuote` with
+
+    *   the amortization schedule of the (net) principal,
+    *   the principal grossed up by the IOF tax and the service fee, as in
+        `IofGrossup`,
+    *   the amortization schedule of the grossed up principal, and
+    *   the IRR of the grossed up schedule's due payments over the net
+        principal, as in `BaseGrossup.irr`.
+
+    The results are the same as those of a `Loan` and an `IofGrossup` for
+    each schedule type, while the rate conversion, day counts and discount
+    factors are evaluated only once.
+
+    Parameters
+    ----------
+    principal : float, required
+        The loan's net principal.
+    annual_interest_rate : float, required
+        The loan's annual interest rate.
+    start_date : date, required
+        The loan's reference date.
+    return_dates : list, required
+        List of date objects with the expected return dates.
+    reference_date : date, optional
+        Reference date of the grossup, usually the date of the taxable
+        event. (default None, i.e., the start date)
+    year_size : int, optional
+        (default 365)
+    grace_period : int, optional
+        (default 0)
+    daily_iof_aliquot : float, optional
+        (default 0.000082)
+    complementary_iof_aliquot : float, optional
+        (default 0.0038)
+    service_fee_aliquot : float, optional
+        (default 0.0)
+    schedule_types : iterable, optional
+        Amortization schedule types to be quoted.
+        (default QUOTE_SCHEDULE_TYPES)
+    day_count_convention : DayCountConvention, optional
+        (default None, i.e., actual calendar days)
+    """
+
+    def __init__(
+        self,
+        principal,
+        annual_interest_rate,
+        start_date,
+        return_dates,
+        reference_date=None,
+        year_size=YearSizeType.commercial,
+        grace_period=0,
+        daily_iof_aliquot=0.000082,
+        complementary_iof_aliquot=0.0038,
+        service_fee_aliquot=0.0,
+        schedule_types=QUOTE_SCHEDULE_TYPES,
+        day_count_convention=None,
+    ):
+        """Initialize quote."""
+
+        if day_count_convention is None:
+            day_count_convention = ActualDayCount(year_size)
+
+        self.principal = principal
+        self.annual_interest_rate = annual_interest_rate
+        self.start_date = start_date
+        self.return_dates = return_dates
+        self.reference_date = (
+            start_date if reference_date is None else reference_date
+        )
+        self.day_count_convention = day_count_convention
+
+        self.daily_interest_rate = convert_to_daily_interest_rate(
+            annual_interest_rate,
+            InterestRateType.annual,
+            day_count_convention.year_size,
+        )
+
+        return_ordinals = to_ordinals(return_dates)
+        reference_ordinal = to_ordinal(self.reference_date)
+
+        capitalization_start_ordinal = to_ordinal(start_date) + grace_period
+
+        self.return_days = day_count_convention.day_counts(
+            capitalization_start_ordinal, return_ordinals
+        )
+
+        if any(r_day <= 0 for r_day in self.return_days):
+            raise ValueError('Grace period can not exceed loan start.')
+
+        reference_days = day_count_convention.day_counts(
+            reference_ordinal, return_ordinals
+        )
+        iof_days = [
+            r_ordinal - reference_ordinal for r_ordinal in return_ordinals
+        ]
+
+        d = self.daily_interest_rate
+
+        discount_factors = calculate_discount_factors(d, self.return_days)
+
+        if reference_days == self.return_days:
+            reference_discount_factors = discount_factors
+        else:
+            reference_discount_factors = calculate_discount_factors(
+                d, reference_days
+            )
+
+        self.quotes = {}
+
+        for schedule_type in schedule_types:
+
+            schedule_type = AmortizationScheduleType(schedule_type)
+            schedule_cls = SCHEDULE_TYPE_CLASS_MAP[schedule_type]
+
+            schedule = schedule_cls(
+                principal, d, self.return_days, discount_factors
+            )
+
+            grossup_function = IOF_GROSSUP_FUNCTION_MAP.get(schedule_cls)
+
+            if grossup_function is None:
+                grossed_up_principal = br_iof_unit_amortization_grossup(
+                    principal,
+                    schedule_cls(
+                        1.0, d, reference_days, reference_discount_factors
+                    ).amortizations,
+                    daily_iof_aliquot,
+                    complementary_iof_aliquot,
+                    iof_days,
+                    service_fee_aliquot,
+                )
+            else:
+                grossed_up_principal = grossup_function(
+                    principal,
+                    d,
+                    daily_iof_aliquot,
+                    complementary_iof_aliquot,
+                    iof_days,
+                    service_fee_aliquot,
+                    reference_discount_factors,
+                )
+
+            grossed_up_schedule = schedule.scaled(grossed_up_principal)
+
+            self.quotes[schedule_type] = ScheduleQuote(
+                schedule,
+                grossed_up_principal,
+                grossed_up_schedule,
+                approximate_irr(
+                    principal,
+                    grossed_up_schedule.due_payments,
+                    reference_days,
+                    d,
+                ),
+            )
+
+    def __getitem__(self, schedule_type):
+        """Quote of the given schedule type."""
+        return self.quotes[AmortizationScheduleType(schedule_type)]
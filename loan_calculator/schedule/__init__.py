@@ -1,17 +1,20 @@
 from .base import AmortizationScheduleType
 from .price import ProgressivePriceSchedule, RegressivePriceSchedule
 from .constant import ConstantAmortizationSchedule
+from .custom import CustomAmortizationSchedule
 
 
 SCHEDULE_TYPE_CLASS_MAP = {
     AmortizationScheduleType.constant_amortization_schedule: ConstantAmortizationSchedule,  # noqa
     AmortizationScheduleType.regressive_price_schedule: RegressivePriceSchedule,  # noqa
     AmortizationScheduleType.progressive_price_schedule: ProgressivePriceSchedule,  # noqa
+    AmortizationScheduleType.custom_amortization_schedule: CustomAmortizationSchedule,  # noqa
 }
 
 __all__ = [
     'ProgressivePriceSchedule',
     'RegressivePriceSchedule',
     'ConstantAmortizationSchedule',
+    'CustomAmortizationSchedule',
     'SCHEDULE_TYPE_CLASS_MAP',
 ]
@@ -1,11 +1,86 @@
+from array import array
+from collections.abc import Sequence
 from enum import Enum
 
+from loan_calculator.discount import calculate_discount_factors
+
 
 class AmortizationScheduleType(Enum):
 
     progressive_price_schedule = 'progressive-price-schedule'
     regressive_price_schedule = 'regressive-price-schedule'
     constant_amortization_schedule = 'constant-amortization-schedule'
+    custom_amortization_schedule = 'custom-amortization-schedule'
+
+
+# order of the columns in the buffer returned by BaseSchedule.to_array
+SCHEDULE_COLUMNS = (
+    'balance',
+    'amortizations',
+    'interest_payments',
+    'due_payments',
+)
+
+
+class ScheduleColumn(Sequence):
+    """Read-only view of a column stored in the buffer of a schedule.
+
+    It behaves as a list of floats, but its entries live in the buffer
+    returned by `BaseSchedule.to_array`, so that no second copy of the
+    column is kept. Slicing and concatenating return new lists, a column
+    compares equal to a list with the same entries, is represented as one
+    and is pickled as one. It is not a subclass of `list`, though, so it
+    must be converted with `tolist` before being serialized, e.g., to JSON.
+
+    Parameters
+    ----------
+    values: memoryview, required
+        Slice of the schedule buffer holding the column.
+    """
+
+    __slots__ = ('_values',)
+
+    __hash__ = None
+
+    def __init__(self, values):
+        """Initialize column."""
+
+        self._values = values
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._values[index].tolist()
+        return self._values[index]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __eq__(self, other):
+        if isinstance(other, ScheduleColumn):
+            other = other.tolist()
+        if not isinstance(other, list):
+            return NotImplemented
+        return self.tolist() == other
+
+    def __add__(self, other):
+        return self.tolist() + list(other)
+
+    def __radd__(self, other):
+        return list(other) + self.tolist()
+
+    def __repr__(self):
+        return repr(self.tolist())
+
+    def __reduce__(self):
+        # memoryviews cannot be pickled
+        return list, (self.tolist(),)
+
+    def tolist(self):
+        """Copy the column into a new list."""
+        return self._values.tolist()
 
 
 class BaseSchedule(object):
@@ -20,7 +95,16 @@ class BaseSchedule(object):
     *   `calculate_amortizations`
 
     These methods do not receive any parameters and should be able to return
-    based only on principal, daily_interest_rate and return_days.
+    based only on principal, daily_interest_rate and return_days. They are
+    called on the first access to the respective column (`balance`,
+    `due_payments`, `interest_payments` and `amortizations`) and their
+    results are stored in a single contiguous buffer, see `to_array`, and
+    exposed as `ScheduleColumn` views over it, so that callers interested in
+    a single column do not pay for the others and no column is kept twice.
+
+    The discount factors :math:`1/(1+d)^{n_j}` of the return days are
+    evaluated once and made available as `discount_factors`, so that
+    implementations do not need to exponentiate again.
 
     Parameters
     ----------
@@ -31,32 +115,62 @@ class BaseSchedule(object):
     return_days: list, required
         List of integers representing the number of days since the loan
         was granted until the payments' due dates.
+    discount_factors: list, optional
+        Precomputed discount factors for the given daily interest rate and
+        return days, as returned by `discount.calculate_discount_factors`.
+        They are evaluated if not given. (default None)
     """
 
     schedule_type = None
 
-    def __init__(self, principal, daily_interest_rate, return_days):
+    __slots__ = (
+        'principal',
+        'daily_interest_rate',
+        'return_days',
+        'discount_factors',
+        '_balance',
+        '_due_payments',
+        '_interest_payments',
+        '_amortizations',
+        '_total_paid',
+        '_total_amortization',
+        '_total_interest',
+        '_buffer',
+        '_unit',
+    )
+
+    def __init__(
+        self,
+        principal,
+        daily_interest_rate,
+        return_days,
+        discount_factors=None,
+    ):
         """Initialize schedule."""
 
         self.principal = principal
         self.daily_interest_rate = daily_interest_rate
         self.return_days = return_days
 
-        self.balance = getattr(
-            self, 'calculate_balance', (len(return_days) + 1) * [0]
-        )()
+        if discount_factors is None:
+            discount_factors = calculate_discount_factors(
+                daily_interest_rate, return_days
+            )
+        self.discount_factors = discount_factors
+
+        self._balance = None
+        self._due_payments = None
+        self._interest_payments = None
+        self._amortizations = None
 
-        self.due_payments = getattr(
-            self, 'calculate_due_payments', len(return_days) * [0]
-        )()
+        self._total_paid = None
+        self._total_amortization = None
+        self._total_interest = None
 
-        self.interest_payments = getattr(
-            self, 'calculate_interest', len(return_days) * [0]
-        )()
+        self._buffer = None
 
-        self.amortizations = getattr(
-            self, 'calculate_amortizations', len(return_days) * [0]
-        )()
+        # schedule this one is a multiple of, see BaseSchedule.scaled
+        self._unit = None
 
     def calculate_due_payments(self):
         raise NotImplementedError  # pragma: nocover
@@ -70,14 +184,168 @@ class BaseSchedule(object):
     def calculate_amortizations(self):
         raise NotImplementedError  # pragma: nocover
 
+    @property
+    def balance(self):
+        """Balance after each payment, evaluated on first access."""
+        if self._balance is None:
+            self._balance = self._store(
+                'balance',
+                self.calculate_balance() if self._unit is None
+                else self._scale(self._unit.balance)
+            )
+        return self._balance
+
+    @property
+    def due_payments(self):
+        """Due payments, evaluated on first access."""
+        if self._due_payments is None:
+            self._due_payments = self._store(
+                'due_payments',
+                self.calculate_due_payments() if self._unit is None
+                else self._scale(self._unit.due_payments)
+            )
+        return self._due_payments
+
+    @property
+    def interest_payments(self):
+        """Interest in each payment, evaluated on first access."""
+        if self._interest_payments is None:
+            self._interest_payments = self._store(
+                'interest_payments',
+                self.calculate_interest() if self._unit is None
+                else self._scale(self._unit.interest_payments)
+            )
+        return self._interest_payments
+
+    @property
+    def amortizations(self):
+        """Amortization due to each payment, evaluated on first access."""
+        if self._amortizations is None:
+            self._amortizations = self._store(
+                'amortizations',
+                self.calculate_amortizations() if self._unit is None
+                else self._scale(self._unit.amortizations)
+            )
+        return self._amortizations
+
+    def scaled(self, principal):
+        """Build the schedule of another principal by scaling this one.
+
+        For a fixed daily interest rate and return days, every column of an
+        amortization schedule is linear in the principal. The returned
+        schedule shares the return days and discount factors with this one
+        and its columns are evaluated, on first access, by scaling the
+        columns of this schedule instead of being calculated again.
+
+        Parameters
+        ----------
+        principal: float, required
+            Principal of the scaled schedule.
+
+        Returns
+        -------
+        BaseSchedule
+            Instance of the same class as this schedule.
+        """
+
+        schedule = self.__class__.__new__(self.__class__)
+
+        BaseSchedule.__init__(
+            schedule,
+            principal,
+            self.daily_interest_rate,
+            self.return_days,
+            self.discount_factors,
+        )
+        schedule._unit = self
+
+        return schedule
+
+    def _scale(self, column):
+        factor = float(self.principal) / self._unit.principal
+        return [factor * x for x in column]
+
+    def iter_rows(self):
+        """Iterate over the schedule, one instalment at a time.
+
+        Implementations should override this method with a generator which
+        evaluates each row from closed formulas, so that long schedules can be
+        traversed in constant memory. This default implementation zips the
+        (cached) columns.
+
+        Yields
+        ------
+        tuple
+            The return day, the balance after the payment, the amortization,
+            the interest and the due payment of each instalment.
+        """
+
+        return zip(
+            self.return_days,
+            self.balance[1:],
+            self.amortizations,
+            self.interest_payments,
+            self.due_payments,
+        )
+
+    def _store(self, column, values):
+        """Write a column into the buffer and return a view over it."""
+
+        size = len(self.return_days) + 1
+
+        if self._buffer is None:
+            self._buffer = (
+                array('d', [float('nan')]) * (len(SCHEDULE_COLUMNS) * size)
+            )
+
+        position = SCHEDULE_COLUMNS.index(column)
+        start = position * size + (0 if column == 'balance' else 1)
+
+        view = memoryview(self._buffer)[start:(position + 1) * size]
+        view[:] = array('d', values)
+
+        return ScheduleColumn(view)
+
+    def to_array(self):
+        """Return the contiguous buffer holding the schedule columns.
+
+        The buffer is an `array('d')` with the columns in the order given by
+        `SCHEDULE_COLUMNS`, each one with :math:`k+1` entries: the balance
+        :math:`b_0,\\ldots,b_k` and the amortizations, interest and due
+        payments preceded by a `nan` entry for the start date. It takes 8
+        bytes per entry and implements the buffer protocol, so it can be
+        viewed without copies, e.g., through `numpy.frombuffer`.
+
+        The buffer is the storage of the columns themselves: columns which
+        were not accessed yet are evaluated into it and the same object is
+        returned on every call, hence it is never resized and must not be
+        modified.
+
+        Returns
+        -------
+        array
+            Buffer with :math:`4(k+1)` floats.
+        """
+
+        for column in SCHEDULE_COLUMNS:
+            getattr(self, column)
+
+        return self._buffer
+
     @property
     def total_paid(self):
-        return sum(getattr(self, 'due_payments', 0.0))
+        if self._total_paid is None:
+            self._total_paid = sum(self.due_payments)
+        return self._total_paid
 
     @property
     def total_amortization(self):
-        return sum(getattr(self, 'amortizations', 0.0))
+        if self._total_amortization is None:
+            self._total_amortization = sum(self.amortizations)
+        return self._total_amortization
 
     @property
     def total_interest(self):
-        return sum(getattr(self, 'interest_payments', 0.0))
+        if self._total_interest is None:
+            self._total_interest = sum(self.interest_payments)
+        return self._total_interest
@@ -0,0 +1,236 @@
+from bisect import bisect_left
+
+from loan_calculator.discount import POWER_TABLE_CACHE
+from loan_calculator.schedule import SCHEDULE_TYPE_CLASS_MAP
+from loan_calculator.schedule.base import AmortizationScheduleType
+
+
+class ScheduleBuilder(object):
+    """Mutable amortization schedule for incremental return day updates.
+
+    The builder keeps the return days sorted in increasing order, together
+    with their discount factors :math:`v_j=1/(1+d)^{n_j}` and the partial sums
+
+    .. math::
+
+        S_i := \\sum_{j=1}^i v_j,\\ \\mathrm{for\\ all}\\ i,1\\leq i\\leq k.
+
+    Inserting, removing or shifting the :math:`i`-th return day costs a
+    single exponentiation and :math:`O(k-i)` updates, since only the discount
+    factors and partial sums after position :math:`i` are affected. The PMT
+    denominator :math:`S_k` and any balance
+
+    .. math::
+
+        b_i = s(1+d)^{n_i}(1 - \\frac{S_i}{S_k})
+
+    are then available in constant time.
+
+    The schedule columns, on the other hand, are not maintained
+    incrementally: any update changes :math:`S_k`, hence the PMT and every
+    balance, amortization and interest payment (for constant amortization
+    schedules, the amortization :math:`s/k` changes as well), so no column
+    can be updated in less than :math:`O(k)`. They are evaluated by the
+    schedule returned by `build`, in :math:`O(k)` and without any further
+    exponentiation, since it reuses the maintained discount factors.
+
+    Parameters
+    ----------
+    principal: float, required
+        Loan's principal.
+    daily_interest_rate: float, required
+        Loan's daily interest rate.
+    return_days: list, required
+        List of increasing integers representing the number of days since
+        the loan was granted until the payments' due dates.
+    amortization_schedule_type : str, optional
+        A discriminator string indicating the amortization schedule to be
+        adopted, as in `Loan`, except for custom amortization schedules,
+        whose balances depend on amortization weights instead of discount
+        factors.
+        (default AmortizationScheduleType.progressive_price_schedule.value).
+
+    Raises
+    ------
+    ValueError
+        If the return days are not increasing or the amortization schedule
+        is a custom one.
+    """
+
+    def __init__(
+        self,
+        principal,
+        daily_interest_rate,
+        return_days,
+        amortization_schedule_type=(
+            AmortizationScheduleType.progressive_price_schedule.value
+        )
+    ):
+        """Initialize schedule builder."""
+
+        self.principal = principal
+        self.daily_interest_rate = daily_interest_rate
+
+        self.amortization_schedule_type = (
+            AmortizationScheduleType(amortization_schedule_type)
+        )
+
+        if (
+            self.amortization_schedule_type is
+            AmortizationScheduleType.custom_amortization_schedule
+        ):
+            raise ValueError(
+                'Custom amortization schedules are not supported.'
+            )
+
+        self.amortization_schedule_cls = SCHEDULE_TYPE_CLASS_MAP[
+            self.amortization_schedule_type
+        ]
+
+        if any(n >= m for n, m in zip(return_days, return_days[1:])):
+            raise ValueError('Return days must be increasing.')
+
+        self.return_days = list(return_days)
+        self.discount_factors = [
+            self._discount_factor(n) for n in self.return_days
+        ]
+        self.partial_sums = []
+        self._update_partial_sums(0)
+
+    def _discount_factor(self, return_day):
+        return POWER_TABLE_CACHE.discount_factor(
+            self.daily_interest_rate, return_day
+        )
+
+    def _update_partial_sums(self, position):
+        """Accumulate the partial sums again from the given position on."""
+
+        partial_sum = self.partial_sums[position - 1] if position else 0.0
+
+        del self.partial_sums[position:]
+
+        for v in self.discount_factors[position:]:
+            partial_sum += v
+            self.partial_sums.append(partial_sum)
+
+    def _position(self, return_day):
+
+        position = bisect_left(self.return_days, return_day)
+
+        if (
+            position == len(self.return_days) or
+            self.return_days[position] != return_day
+        ):
+            raise ValueError('Return day is not scheduled.')
+
+        return position
+
+    def insert_return_day(self, return_day):
+        """Insert a return day and return its position in the schedule."""
+
+        position = bisect_left(self.return_days, return_day)
+
+        if (
+            position < len(self.return_days) and
+            self.return_days[position] == return_day
+        ):
+            raise ValueError('Return day is already scheduled.')
+
+        self.return_days.insert(position, return_day)
+        self.discount_factors.insert(
+            position, self._discount_factor(return_day)
+        )
+        self._update_partial_sums(position)
+
+        return position
+
+    def remove_return_day(self, return_day):
+        """Remove a return day and return the position it used to have."""
+
+        position = self._position(return_day)
+
+        del self.return_days[position]
+        del self.discount_factors[position]
+        self._update_partial_sums(position)
+
+        return position
+
+    def shift_return_day(self, return_day, new_return_day):
+        """Move a return day to a new day and return its new position."""
+
+        position = self._position(return_day)
+
+        if new_return_day != return_day:
+            self.remove_return_day(return_day)
+            try:
+                position = self.insert_return_day(new_return_day)
+            except ValueError:
+                self.insert_return_day(return_day)
+                raise
+
+        return position
+
+    @property
+    def transport(self):
+        """PMT denominator, i.e., the sum of all discount factors.
+
+        Raises
+        ------
+        ValueError
+            If there are no return days.
+        """
+
+        if not self.partial_sums:
+            raise ValueError('There are no return days scheduled.')
+
+        return self.partial_sums[-1]
+
+    @property
+    def pmt(self):
+        """PMT for the current return days.
+
+        Raises
+        ------
+        ValueError
+            If there are no return days.
+        """
+        return self.principal / self.transport
+
+    def balance_at(self, position):
+        """Balance after the payment at the given position (0 to k)."""
+
+        if position == 0:
+            return self.principal
+
+        k = len(self.return_days)
+
+        if (
+            self.amortization_schedule_type is
+            AmortizationScheduleType.constant_amortization_schedule
+        ):
+            return self.principal * (1 - float(position) / k)
+
+        return (
+            self.principal / self.discount_factors[position - 1] *
+            (1 - self.partial_sums[position - 1] / self.transport)
+        )
+
+    def build(self):
+        """Build the amortization schedule for the current return days.
+
+        A new schedule is built on each call, whose columns are evaluated in
+        :math:`O(k)` on first access.
+
+        Returns
+        -------
+        BaseSchedule
+            Instance of the schedule class associated with the builder's
+            amortization schedule type.
+        """
+
+        return self.amortization_schedule_cls(
+            self.principal,
+            self.daily_interest_rate,
+            list(self.return_days),
+            list(self.discount_factors),
+        )
@@ -0,0 +1,118 @@
+from collections import namedtuple, OrderedDict
+from threading import Lock
+
+
+CacheInfo = namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize']
+)
+
+
+class UnitScheduleCache(object):
+    """Bounded LRU cache of unit principal amortization schedules.
+
+    Every amortization schedule is linear in the principal for a fixed
+    schedule type, daily interest rate and return days. This cache keeps the
+    schedules with unit principal for the most recently used of these
+    configurations, so that the schedule for any principal is obtained
+    through `BaseSchedule.scaled` instead of being calculated from scratch.
+
+    The cache is safe to be shared among threads.
+
+    Parameters
+    ----------
+    maxsize: int, optional
+        Maximum number of unit schedules kept. When it is exceeded, the least
+        recently used schedule is evicted. (default 256)
+    """
+
+    def __init__(self, maxsize=256):
+        """Initialize cache."""
+
+        self.maxsize = maxsize
+
+        self._schedules = OrderedDict()
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def unit_schedule(self, schedule_cls, daily_interest_rate, return_days):
+        """Get the unit principal schedule for the given parameters.
+
+        The schedule is built and cached on a miss.
+
+        Parameters
+        ----------
+        schedule_cls: type, required
+            Amortization schedule class, e.g., `ProgressivePriceSchedule`.
+        daily_interest_rate: float, required
+            Loan's daily interest rate.
+        return_days: list, required
+            List of integers representing the number of days since the loan
+            was granted until the payments' due dates.
+
+        Returns
+        -------
+        BaseSchedule
+            Schedule with unit principal.
+        """
+
+        key = (schedule_cls, daily_interest_rate, tuple(return_days))
+
+        with self._lock:
+
+            schedule = self._schedules.get(key)
+
+            if schedule is not None:
+                self.hits += 1
+                self._schedules.move_to_end(key)
+                return schedule
+
+            self.misses += 1
+
+        schedule = schedule_cls(1.0, daily_interest_rate, list(return_days))
+
+        with self._lock:
+
+            self._schedules[key] = schedule
+
+            while len(self._schedules) > self.maxsize:
+                self._schedules.popitem(last=False)
+                self.evictions += 1
+
+        return schedule
+
+    def schedule(
+        self, schedule_cls, principal, daily_interest_rate, return_days
+    ):
+        """Get the schedule for the given parameters from a unit schedule.
+
+        Returns
+        -------
+        BaseSchedule
+            Instance of `schedule_cls` scaled from the cached unit schedule.
+        """
+
+        return self.unit_schedule(
+            schedule_cls, daily_interest_rate, return_days
+        ).scaled(principal)
+
+    def cache_info(self):
+        """Report the cache statistics, as in `functools.lru_cache`."""
+
+        with self._lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.maxsize,
+                len(self._schedules),
+            )
+
+    def clear(self):
+        """Evict all schedules and reset the statistics."""
+
+        with self._lock:
+            self._schedules.clear()
+            self.hits = self.misses = self.evictions = 0
@@ -26,6 +26,8 @@ class ConstantAmortizationSchedule(BaseSchedule):
 
     schedule_type = AmortizationScheduleType.constant_amortization_schedule
 
+    __slots__ = ()
+
     def calculate_balance(self):
         """Calculate the balance after each payment.
 
@@ -77,14 +79,12 @@ class ConstantAmortizationSchedule(BaseSchedule):
         daily interest rate and :math:`n_1,\\ldots,n_k` are the return days.
         """
 
-        # rename variable to make the math more explicit
-        d = self.daily_interest_rate
-
+        # (1+d)^(n_i-n_{i-1}) is the ratio of consecutive discount factors
         return [
-            b * ((1 + d) ** (n - m) - 1)
-            for b, n, m in zip(self.balance[:-1],
-                               self.return_days,
-                               [0] + self.return_days[:-1])
+            b * (u / v - 1)
+            for b, v, u in zip(self.balance[:-1],
+                               self.discount_factors,
+                               [1.0] + self.discount_factors[:-1])
         ]
 
     def calculate_due_payments(self):
@@ -107,13 +107,38 @@ class ConstantAmortizationSchedule(BaseSchedule):
 
         # variables are renamed to make the math more explicit
         p = self.principal
-        d = self.daily_interest_rate
         k = len(self.return_days)
 
         return [
-            b * ((1 + d) ** (n - m) - 1) + p / k
-            for b, n, m in zip(
+            b * (u / v - 1) + p / k
+            for b, v, u in zip(
                 self.balance[:-1],
-                self.return_days, [0] + self.return_days[:-1]
+                self.discount_factors, [1.0] + self.discount_factors[:-1]
             )
         ]
+
+    def iter_rows(self):
+        """Iterate over the schedule, one instalment at a time.
+
+        Each row is evaluated from the closed formulas for :math:`b_i`,
+        :math:`A_i`, :math:`J_i` and :math:`P_i`, carrying only the previous
+        balance and discount factor, hence no column is materialized.
+        """
+
+        # variables are renamed to make the math more explicit
+        p = self.principal
+        k = len(self.return_days)
+        a = p / k
+
+        previous_balance, u = p, 1.0
+
+        for i, (n, v) in enumerate(
+            zip(self.return_days, self.discount_factors), 1
+        ):
+
+            balance = p * (1 - float(i) / k)
+            interest = previous_balance * (u / v - 1)
+
+            yield n, balance, a, interest, interest + a
+
+            previous_balance, u = balance, v
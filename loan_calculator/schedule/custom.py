@@ -0,0 +1,189 @@
+from loan_calculator.schedule.base import (
+    BaseSchedule, AmortizationScheduleType
+)
+
+
+# tolerance on the sum of the amortization weights
+AMORTIZATION_WEIGHTS_TOLERANCE = 1e-9
+
+
+def bullet_weights(num_instalments):
+    """Amortization weights of a bullet loan, all due at the end."""
+    return [0.0] * (num_instalments - 1) + [1.0]
+
+
+def balloon_weights(num_instalments, balloon):
+    """Amortization weights of a loan with a balloon payment.
+
+    A fraction `balloon` of the principal is amortized by the last payment,
+    while the remaining principal is equally amortized by all payments.
+    """
+
+    weights = [(1.0 - balloon) / num_instalments] * num_instalments
+    weights[-1] += balloon
+
+    return weights
+
+
+def amortization_weights(principal, amortizations):
+    """Amortization weights of the given amortization vector."""
+    return [float(a) / principal for a in amortizations]
+
+
+class CustomAmortizationSchedule(BaseSchedule):
+    """Implement amortization schedule with arbitrary amortizations.
+
+    The amortizations are given by weights :math:`w_1,\\ldots,w_k` adding up
+    to one, so that :math:`A_i=sw_i`, :math:`s` being the principal. Bullet
+    loans, balloon payments and arbitrary amortization vectors are built
+    with `bullet_weights`, `balloon_weights` and `amortization_weights`. The
+    interest accrued since the previous payment is paid with each
+    amortization, hence
+
+    - :math:`A_i = sw_i`.
+    - :math:`b_i = b_{i-1} - A_i`.
+    - :math:`J_i = b_{i-1}((1+d)^{n_i-n_{i-1}}-1)`.
+    - :math:`P_i = A_i + J_i`.
+
+    Every column is evaluated in a single pass over the return days.
+
+    Parameters
+    ----------
+    principal: float, required
+        Loan's principal.
+    daily_interest_rate: float, required
+        Loan's daily interest rate.
+    return_days: list, required
+        List of integers representing the number of days since the loan
+        was granted until the payments' due dates.
+    discount_factors: list, optional
+        Precomputed discount factors. (default None)
+    amortization_weights: list, optional
+        Fraction of the principal amortized by each payment.
+        (default None, i.e., a bullet loan)
+
+    Raises
+    ------
+    ValueError
+        If the number of weights differs from the number of return days or
+        if they do not add up to one.
+    """
+
+    schedule_type = AmortizationScheduleType.custom_amortization_schedule
+
+    __slots__ = ('amortization_weights',)
+
+    def __init__(
+        self,
+        principal,
+        daily_interest_rate,
+        return_days,
+        discount_factors=None,
+        amortization_weights=None,
+    ):
+        """Initialize custom amortization schedule."""
+
+        if amortization_weights is None:
+            amortization_weights = bullet_weights(len(return_days))
+
+        if len(amortization_weights) != len(return_days):
+            raise ValueError(
+                'There must be an amortization weight for each return day.'
+            )
+
+        if abs(sum(amortization_weights) - 1) > AMORTIZATION_WEIGHTS_TOLERANCE:
+            raise ValueError('Amortization weights must add up to one.')
+
+        self.amortization_weights = amortization_weights
+
+        super(CustomAmortizationSchedule, self).__init__(
+            principal,
+            daily_interest_rate,
+            return_days,
+            discount_factors,
+        )
+
+    def calculate_balance(self):
+        """Calculate the balance after each payment.
+
+        The balance is given by
+
+        .. math::
+
+            b_i := s(1 - \\sum_{j=1}^i w_j),
+            \\ \\mathrm{for\\ all}\\ i,0\\leq i\\leq k.
+        """
+
+        # variables are renamed to make the math more explicit
+        p = self.principal
+
+        balance = [p]
+        for a in self.amortizations:
+            balance.append(balance[-1] - a)
+
+        # the last balance is exactly zero, up to the weights tolerance
+        balance[-1] = 0.0
+
+        return balance
+
+    def calculate_amortizations(self):
+        """Calculate the amortizations, given by :math:`A_i=sw_i`."""
+        return [self.principal * w for w in self.amortization_weights]
+
+    def calculate_interest(self):
+        """Calculate the interest in each payment.
+
+        The interest is calculated over the last balance and is given by
+
+        .. math::
+
+            J_i := b_{i-1}((1+d)^{n_i-n_{i-1}}-1)
+            \\ \\mathrm{for\\ all}\\ i,1\\leq i\\leq k.
+        """
+
+        return [
+            b * (u / v - 1)
+            for b, v, u in zip(self.balance[:-1],
+                               self.discount_factors,
+                               [1.0] + self.discount_factors[:-1])
+        ]
+
+    def calculate_due_payments(self):
+        """Calculate the due payments, given by :math:`P_i=A_i+J_i`."""
+        return [
+            a + j for a, j in zip(self.amortizations, self.interest_payments)
+        ]
+
+    def scaled(self, principal):
+        """Build the schedule of another principal, keeping the weights."""
+        schedule = super(CustomAmortizationSchedule, self).scaled(principal)
+        schedule.amortization_weights = self.amortization_weights
+        return schedule
+
+    def iter_rows(self):
+        """Iterate over the schedule, one instalment at a time.
+
+        Each row carries only the previous balance and discount factor, hence
+        no column is materialized.
+        """
+
+        # variables are renamed to make the math more explicit
+        p = self.principal
+        k = len(self.return_days)
+
+        previous_balance, u = p, 1.0
+
+        for i, (n, v, w) in enumerate(
+            zip(self.return_days,
+                self.discount_factors,
+                self.amortization_weights),
+            1
+        ):
+
+            a = p * w
+            balance = previous_balance - a if i < k else 0.0
+            interest = previous_balance * (u / v - 1)
+
+            yield n, balance, a, interest, interest + a
+
+            previous_balance, u = balance, v
@@ -0,0 +1,139 @@
+from loan_calculator.schedule.base import (
+    BaseSchedule, AmortizationScheduleType
+)
+from loan_calculator.schedule.constant import ConstantAmortizationSchedule
+from loan_calculator.schedule.price import (
+    ProgressivePriceSchedule, RegressivePriceSchedule
+)
+
+
+class BaseIndexedSchedule(BaseSchedule):
+    """Base class for inflation indexed amortization schedules.
+
+    An indexed schedule is a schedule in real terms, whose columns are then
+    multiplied by the index ratio of each return date, i.e., by the ratio
+    :math:`\\theta_i=I(t_i)/I(t_0)` of the price index at the :math:`i`-th
+    return date and at the start date. If :math:`b_i,A_i,J_i,P_i` are the
+    balance, amortization, interest and due payment of the real schedule,
+    then the indexed schedule is given by
+
+    .. math::
+
+        (\\theta_i b_i, \\theta_i A_i, \\theta_i J_i, \\theta_i P_i),
+        \\ \\mathrm{for\\ all}\\ i,1\\leq i\\leq k.
+
+    Subclasses define the real schedule through `real_schedule_cls`.
+
+    Parameters
+    ----------
+    principal: float, required
+        Loan's principal.
+    daily_interest_rate: float, required
+        Loan's daily real interest rate.
+    return_days: list, required
+        List of integers representing the number of days since the loan
+        was granted until the payments' due dates.
+    index_ratios: list, required
+        Index ratio of each return date, as returned by
+        `inflation.PriceIndexSeries.index_ratios`.
+    discount_factors: list, optional
+        Precomputed discount factors. (default None)
+    """
+
+    real_schedule_cls = None
+
+    __slots__ = ('index_ratios', 'real_schedule')
+
+    def __init__(
+        self,
+        principal,
+        daily_interest_rate,
+        return_days,
+        index_ratios,
+        discount_factors=None,
+    ):
+        """Initialize indexed schedule."""
+
+        if len(index_ratios) != len(return_days):
+            raise ValueError(
+                'There must be an index ratio for each return day.'
+            )
+
+        self.index_ratios = index_ratios
+        self.real_schedule = self.real_schedule_cls(
+            principal, daily_interest_rate, return_days, discount_factors
+        )
+
+        super(BaseIndexedSchedule, self).__init__(
+            principal,
+            daily_interest_rate,
+            return_days,
+            self.real_schedule.discount_factors,
+        )
+
+    def _indexed(self, column):
+        return [x * ratio for x, ratio in zip(column, self.index_ratios)]
+
+    def calculate_balance(self):
+        return [self.principal] + self._indexed(self.real_schedule.balance[1:])
+
+    def calculate_amortizations(self):
+        return self._indexed(self.real_schedule.amortizations)
+
+    def calculate_interest(self):
+        return self._indexed(self.real_schedule.interest_payments)
+
+    def calculate_due_payments(self):
+        return self._indexed(self.real_schedule.due_payments)
+
+    def scaled(self, principal):
+        """Build the schedule of another principal, scaling the real one."""
+        schedule = super(BaseIndexedSchedule, self).scaled(principal)
+        schedule.index_ratios = self.index_ratios
+        schedule.real_schedule = self.real_schedule.scaled(principal)
+        return schedule
+
+    def iter_rows(self):
+        """Iterate over the schedule, one instalment at a time.
+
+        Rows are streamed from the real schedule and indexed on the fly.
+        """
+
+        for (n, b, a, j, p), ratio in zip(
+            self.real_schedule.iter_rows(), self.index_ratios
+        ):
+            yield n, b * ratio, a * ratio, j * ratio, p * ratio
+
+
+class IndexedProgressivePriceSchedule(BaseIndexedSchedule):
+    """Progressive Price schedule in real terms, indexed by inflation."""
+
+    schedule_type = AmortizationScheduleType.progressive_price_schedule
+    real_schedule_cls = ProgressivePriceSchedule
+
+    __slots__ = ()
+
+
+class IndexedRegressivePriceSchedule(BaseIndexedSchedule):
+    """Regressive Price schedule in real terms, indexed by inflation."""
+
+    schedule_type = AmortizationScheduleType.regressive_price_schedule
+    real_schedule_cls = RegressivePriceSchedule
+
+    __slots__ = ()
+
+
+class IndexedConstantAmortizationSchedule(BaseIndexedSchedule):
+    """Constant amortization schedule in real terms, indexed by inflation."""
+
+    schedule_type = AmortizationScheduleType.constant_amortization_schedule
+    real_schedule_cls = ConstantAmortizationSchedule
+
+    __slots__ = ()
+
+
+INDEXED_SCHEDULE_CLASS_MAP = {
+    ProgressivePriceSchedule: IndexedProgressivePriceSchedule,
+    RegressivePriceSchedule: IndexedRegressivePriceSchedule,
+    ConstantAmortizationSchedule: IndexedConstantAmortizationSchedule,
+}
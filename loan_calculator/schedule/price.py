@@ -1,9 +1,19 @@
+from bisect import bisect_right
+from itertools import islice
+
+from loan_calculator.discount import calculate_discount_factors
 from loan_calculator.pmt import constant_return_pmt
 from loan_calculator.schedule.base import (
     BaseSchedule, AmortizationScheduleType
 )
 
 
+def _increasing(return_days):
+    return all(
+        n < m for n, m in zip(return_days, islice(return_days, 1, None))
+    )
+
+
 class BasePriceSchedule(BaseSchedule):
     """Base class for Price type amortization schedules.
 
@@ -13,18 +23,33 @@ class BasePriceSchedule(BaseSchedule):
     rule over the amortizations. Both are implemented as subclasses of this.
     """
 
-    def __init__(self, principal, daily_interest_rate, return_days):
+    __slots__ = ('pmt',)
+
+    def __init__(
+        self,
+        principal,
+        daily_interest_rate,
+        return_days,
+        discount_factors=None,
+    ):
+
+        if discount_factors is None:
+            discount_factors = calculate_discount_factors(
+                daily_interest_rate, return_days
+            )
 
         self.pmt = constant_return_pmt(
             principal,
             daily_interest_rate,
-            return_days
+            return_days,
+            discount_factors
         )
 
         super(BasePriceSchedule, self).__init__(
             principal,
             daily_interest_rate,
-            return_days
+            return_days,
+            discount_factors
         )
 
     def calculate_balance(self):
@@ -56,20 +81,42 @@ class BasePriceSchedule(BaseSchedule):
             \\right.,
 
         where :math:`P = \\mathrm{PMT}(s,d,(n_1,\\ldots,n_k))`.
+
+        When the return days are increasing, as they usually are, the
+        partial sums in the numerator are accumulated in a single
+        :math:`O(k)` pass. Otherwise the return days are sorted and each
+        balance point looks its partial sum up, in :math:`O(k\\log k)`, which
+        keeps the definition above (sum over :math:`n_j\\leq n_i`).
         """
 
         # variables are renamed to make the math more explicit
         p = self.principal
-        d = self.daily_interest_rate
         r_days = self.return_days
+        discounts = self.discount_factors
+
+        transport = sum(discounts)
+
+        if _increasing(r_days):
+
+            balance = [p]
+            partial_sum = 0.0
 
-        return [
-            (p *
-             ((1 + d) ** n) *
-             (1 -
-              sum(1 / (1 + d) ** m for m in r_days if m <= n) /
-              sum(1 / (1 + d) ** m for m in r_days)))
-            for n in [0] + r_days
+            for v in discounts:
+                partial_sum += v
+                balance.append((p / v) * (1 - partial_sum / transport))
+
+            return balance
+
+        # partial_sums[j] is the sum of the discounts of the j smallest days
+        sorted_days, sorted_discounts = zip(*sorted(zip(r_days, discounts)))
+        partial_sums = [0.0]
+        for discount in sorted_discounts:
+            partial_sums.append(partial_sums[-1] + discount)
+
+        return [p] + [
+            (p / v) *
+            (1 - partial_sums[bisect_right(sorted_days, n)] / transport)
+            for n, v in zip(r_days, discounts)
         ]
 
     def calculate_due_payments(self):
@@ -80,6 +127,52 @@ class BasePriceSchedule(BaseSchedule):
 
         return [self.pmt for _ in self.return_days]
 
+    def scaled(self, principal):
+        """Build the schedule of another principal, scaling the PMT too."""
+        schedule = super(BasePriceSchedule, self).scaled(principal)
+        schedule.pmt = self.pmt * principal / self.principal
+        return schedule
+
+    @property
+    def total_paid(self):
+        """Total paid, given in closed form by :math:`kP`."""
+        return len(self.return_days) * self.pmt
+
+    def iter_rows(self):
+        """Iterate over the schedule, one instalment at a time.
+
+        The balance is evaluated from its closed formula with a running
+        partial sum of the discount factors, while the amortization and
+        interest are given by `amortization_at` and `interest_at`, hence no
+        column is materialized. If the return days are not increasing, the
+        partial sums can not be accumulated in order and the columns are
+        zipped instead.
+        """
+
+        r_days = self.return_days
+
+        if not _increasing(r_days):
+            for row in super(BasePriceSchedule, self).iter_rows():
+                yield row
+            return
+
+        # variables are renamed to make the math more explicit
+        p = self.principal
+        transport = sum(self.discount_factors)
+        partial_sum = 0.0
+
+        for i, (n, v) in enumerate(zip(r_days, self.discount_factors)):
+
+            partial_sum += v
+
+            yield (
+                n,
+                (p / v) * (1 - partial_sum / transport),
+                self.amortization_at(i),
+                self.interest_at(i),
+                self.pmt,
+            )
+
 
 class ProgressivePriceSchedule(BasePriceSchedule):
     """Implement progressive Price amortization schedule.
@@ -110,6 +203,8 @@ class ProgressivePriceSchedule(BasePriceSchedule):
 
     schedule_type = AmortizationScheduleType.progressive_price_schedule
 
+    __slots__ = ()
+
     def calculate_interest(self):
         """Calculate interest in each payment.
 
@@ -124,10 +219,7 @@ class ProgressivePriceSchedule(BasePriceSchedule):
         and :math:`n_1,\\ldots,n_k` are the return days.
         """
 
-        return [
-            self.pmt * (1.0 - 1.0 / (1 + self.daily_interest_rate) ** n)
-            for n in self.return_days[::-1]
-        ]
+        return [self.pmt * (1.0 - v) for v in self.discount_factors[::-1]]
 
     def calculate_amortizations(self):
         """Calculate the principal amortization due to each payment.
@@ -143,10 +235,15 @@ class ProgressivePriceSchedule(BasePriceSchedule):
         are the return days and :math:`P=\\mathrm{PMT}(s,d,(n_1,\\ldots,n_k))`.
         """
 
-        return [
-            self.pmt / (1 + self.daily_interest_rate) ** n
-            for n in self.return_days[::-1]
-        ]
+        return [self.pmt * v for v in self.discount_factors[::-1]]
+
+    def amortization_at(self, i):
+        """Amortization due to the (i+1)-th payment, i.e., :math:`A_{i+1}`."""
+        return self.pmt * self.discount_factors[-1 - i]
+
+    def interest_at(self, i):
+        """Interest in the (i+1)-th payment, i.e., :math:`J_{i+1}`."""
+        return self.pmt * (1.0 - self.discount_factors[-1 - i])
 
 
 class RegressivePriceSchedule(BasePriceSchedule):
@@ -178,6 +275,8 @@ class RegressivePriceSchedule(BasePriceSchedule):
 
     schedule_type = AmortizationScheduleType.regressive_price_schedule
 
+    __slots__ = ()
+
     def calculate_amortizations(self):
         """Calculate the amortization due to each payment.
 
@@ -194,10 +293,7 @@ class RegressivePriceSchedule(BasePriceSchedule):
         :math:`P = \\mathrm{PMT}(s,d,(n_1,\\ldots,n_k))`
         """
 
-        return [
-            self.pmt / (1 + self.daily_interest_rate) ** n
-            for n in self.return_days
-        ]
+        return [self.pmt * v for v in self.discount_factors]
 
     def calculate_interest(self):
         """Calculate the interest in each payment.
@@ -215,7 +311,12 @@ class RegressivePriceSchedule(BasePriceSchedule):
         :math:`P = \\mathrm{PMT}(s,d,(n_1,\\ldots,n_k))`
         """
 
-        return [
-            self.pmt * (1 - 1.0 / (1 + self.daily_interest_rate) ** n)
-            for n in self.return_days
-        ]
+        return [self.pmt * (1 - v) for v in self.discount_factors]
+
+    def amortization_at(self, i):
+        """Amortization due to the (i+1)-th payment, i.e., :math:`A_{i+1}`."""
+        return self.pmt * self.discount_factors[i]
+
+    def interest_at(self, i):
+        """Interest in the (i+1)-th payment, i.e., :math:`J_{i+1}`."""
+        return self.pmt * (1 - self.discount_factors[i])
@@ -0,0 +1,144 @@
+from bisect import bisect_left, bisect_right
+
+from loan_calculator.discount import calculate_discount_factors
+
+
+class TermSolver(object):
+    """Find the number of instalments for which the PMT fits a budget.
+
+    If :math:`n_1<\\cdots<n_K` are the candidate return days, the PMT of the
+    first :math:`m` instalments is
+
+    .. math::
+
+        \\mathrm{PMT}_m = \\frac{s}{S_m},\\ \\mathrm{where}
+        \\ S_m := \\sum_{j=1}^m\\frac{1}{(1+d)^{n_j}},
+
+    which decreases with :math:`m`. The partial sums :math:`S_m` are
+    accumulated once, in :math:`O(K)`, and each query is then a binary search
+    over them, in :math:`O(\\log K)`.
+
+    If IOF aliquots are given, the PMT is the one of the grossed up principal
+    (see `grossup.functions.br_iof_progressive_price_grossup`), given by
+
+    .. math::
+
+        \\mathrm{PMT}_m = \\frac{s}{\\sum_{j=1}^m
+        \\frac{1 - I^{**} - g - \\min(n_j I^*, 0.015)}{(1+d)^{n_j}}},
+
+    which also decreases with :math:`m`, so that the same search applies.
+
+    Parameters
+    ----------
+    principal : float, required
+        The (net) principal.
+    daily_interest_rate : float, required
+        The daily rate at which the principal grows over time.
+    return_days : list, required
+        Increasing list of integers with the candidate return days.
+    discount_factors : list, optional
+        Precomputed discount factors of the return days. (default None)
+    daily_iof_aliquot : float, optional
+        Reduced IOF tax aliquot, for the grossup aware PMT. (default None,
+        i.e., the PMT of the principal is considered)
+    complementary_iof_aliquot : float, optional
+        Complementary IOF tax aliquot. (default 0.0038)
+    service_fee_aliquot : float, optional
+        Service fee aliquot. (default 0.0)
+    iof_days : list, optional
+        Days used as IOF calculation basis. (default None, i.e., the return
+        days)
+
+    Raises
+    ------
+    ValueError
+        If the return days are not increasing or if the taxes and fees
+        consume the whole principal.
+    """
+
+    def __init__(
+        self,
+        principal,
+        daily_interest_rate,
+        return_days,
+        discount_factors=None,
+        daily_iof_aliquot=None,
+        complementary_iof_aliquot=0.0038,
+        service_fee_aliquot=0.0,
+        iof_days=None,
+    ):
+        """Initialize term solver."""
+
+        if any(n >= m for n, m in zip(return_days, return_days[1:])):
+            raise ValueError('Return days must be increasing.')
+
+        if discount_factors is None:
+            discount_factors = calculate_discount_factors(
+                daily_interest_rate, return_days
+            )
+
+        self.principal = principal
+        self.daily_interest_rate = daily_interest_rate
+        self.return_days = return_days
+
+        if daily_iof_aliquot is None:
+            weights = [1.0] * len(return_days)
+        else:
+            if complementary_iof_aliquot + service_fee_aliquot + 0.015 >= 1:
+                raise ValueError('Taxes and fees exceed the principal.')
+
+            weights = [
+                1 - complementary_iof_aliquot - service_fee_aliquot -
+                min(n * daily_iof_aliquot, 0.015)
+                for n in (return_days if iof_days is None else iof_days)
+            ]
+
+        # partial_sums[m - 1] is the sum of the first m discount factors and
+        # denominators[m - 1] is the denominator of the m instalments PMT
+        self.partial_sums = []
+        self.denominators = []
+
+        partial_sum = denominator = 0.0
+
+        for v, w in zip(discount_factors, weights):
+            partial_sum += v
+            denominator += v * w
+            self.partial_sums.append(partial_sum)
+            self.denominators.append(denominator)
+
+    def pmt(self, num_instalments):
+        """PMT of the first given number of instalments."""
+        return self.principal / self.denominators[num_instalments - 1]
+
+    def grossed_up_principal(self, num_instalments):
+        """Principal whose PMT over the given instalments is `pmt`."""
+        return (
+            self.pmt(num_instalments) *
+            self.partial_sums[num_instalments - 1]
+        )
+
+    def minimal_term(self, max_pmt):
+        """Least number of instalments whose PMT does not exceed `max_pmt`.
+
+        Returns
+        -------
+        int
+            The number of instalments, or None if no term fits.
+        """
+
+        m = bisect_left(self.denominators, self.principal / max_pmt) + 1
+
+        return m if m <= len(self.denominators) else None
+
+    def maximal_term(self, min_pmt):
+        """Greatest number of instalments whose PMT is at least `min_pmt`.
+
+        Returns
+        -------
+        int
+            The number of instalments, or None if no term fits.
+        """
+
+        m = bisect_right(self.denominators, self.principal / min_pmt)
+
+        return m if m > 0 else None
@@ -1,5 +1,7 @@
 from decimal import Decimal, ROUND_HALF_UP
 
+from loan_calculator.ordinals import to_date
+
 
 def display_summary(loan, reference_date=None):
     """Display a legible summary of a loan.
@@ -13,20 +15,8 @@ def display_summary(loan, reference_date=None):
         the values of the column `day` in the function's output. (default None)
     """
 
-    reference_date = reference_date or loan.start_date
-
-    dates = [reference_date] + loan.return_dates
-
-    lines = list(
-        zip(
-            dates,
-            map(lambda d: (d - reference_date).days,
-                dates),
-            loan.balance,
-            [''] + loan.amortizations,
-            [''] + loan.interest_payments,
-            [''] + loan.due_payments,
-        )
+    reference_date = to_date(
+        loan.start_date if reference_date is None else reference_date
     )
 
     separator = ('+------------+----------+--------------'
@@ -38,7 +28,7 @@ def display_summary(loan, reference_date=None):
     trailing_line = (
         '| {:>8} | {:>8d} | {:>12.2f} |              '
         '|              |              |'
-        .format(*[lines[0][0].isoformat()] + list(lines[0][1:3]))
+        .format(reference_date.isoformat(), 0, loan.principal)
     )
 
     body_line = ('| {:>8} | {:>8d} | {:>12.2f} '
@@ -47,38 +37,31 @@ def display_summary(loan, reference_date=None):
     footer_line = (
         '|            |          |              '
         '| {:>12.2f} | {:>12.2f} | {:>12.2f} |'
-        .format(
-            loan.total_amortization,
-            loan.total_interest,
-            loan.total_paid
-        )
     )
 
-    summary = '\n'.join(
-        [
-            separator,
-            header,
-            separator,
-            trailing_line,
-        ] + [
+    for line in [separator, header, separator, trailing_line]:
+        print(line)
+
+    # rows are streamed and totalized on the fly, so that long schedules are
+    # printed in constant memory
+    totals = [0.0, 0.0, 0.0]
+
+    for row in loan.iter_rows(reference_date):
+        totals = [t + x for t, x in zip(totals, row[3:])]
+        print(
             body_line.format(
-                line[0].isoformat(),
-                line[1],
+                to_date(row[0]).isoformat(),
+                row[1],
                 *list(
                     map(
                         lambda n: Decimal(n).quantize(
                             Decimal('0.01'),
                             rounding=ROUND_HALF_UP
                         ),
-                        line[2:])
+                        row[2:])
                 )
             )
-            for line in lines[1:]
-        ] + [
-            separator,
-            footer_line,
-            separator,
-        ]
-    )
+        )
 
-    print(summary)
+    for line in [separator, footer_line.format(*totals), separator]:
+        print(line)
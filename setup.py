@@ -18,6 +18,11 @@ setup_requirements = ['pytest-runner', ]
 
 test_requirements = ['pytest>=3', ]
 
+extras_requirements = {
+    'numpy': ['numpy'],
+    'pandas': ['pandas'],
+}
+
 setup(
     author="Mateus Yano",
     author_email='yano.mateus@gmail.com',
@@ -37,6 +42,7 @@ setup(
     ],
     description="Loan Calculator",
     install_requires=[],
+    extras_require=extras_requirements,
     license="MIT license",
     long_description=readme + '\n\n' + history + '\n\n' + license_,
     include_package_data=True,
@@ -3,7 +3,8 @@ import pytest
 from loan_calculator.grossup.functions import (
     br_iof_regressive_price_grossup,
     br_iof_progressive_price_grossup,
-    br_iof_constant_amortization_grossup
+    br_iof_constant_amortization_grossup,
+    br_iof_unit_amortization_grossup,
 )
 
 
@@ -38,3 +39,14 @@ def test_br_constant_amortization_grossup_basic_evaluation():
                                                0.49)
 
     assert gup == pytest.approx(2.0, rel=0.01)
+
+
+def test_br_unit_amortization_grossup_basic_evaluation():
+    gup = br_iof_unit_amortization_grossup(1.0,
+                                           [0.5, 0.5],
+                                           0.01,
+                                           0.1,
+                                           [1, 2],
+                                           0.0)
+
+    assert gup == pytest.approx(1.0 / 0.8875)
@@ -1,6 +1,11 @@
+from datetime import date
+
 import pytest
 
 from loan_calculator.grossup.iof import IofGrossup
+from loan_calculator import irr
+from loan_calculator.irr import IRR_CACHE, IrrCache
+from loan_calculator.loan import Loan
 
 
 def test_trivial_iof_grossup(loan):
@@ -15,3 +20,57 @@ def test_trivial_iof_grossup(loan):
 
     assert iof_grossup.grossed_up_principal == pytest.approx(loan.principal, rel=0.01)  # noqa
     assert iof_grossup.irr == pytest.approx(iof_grossup.base_loan.daily_interest_rate, rel=0.01)  # noqa
+
+
+def test_iof_grossup_of_custom_amortization_schedule():
+
+    weights = [0.1, 0.2, 0.7]
+    return_dates = [date(2020, 2, 1), date(2020, 3, 1), date(2020, 4, 1)]
+
+    loan = Loan(
+        1000.0,
+        0.2,
+        date(2020, 1, 1),
+        return_dates,
+        amortization_schedule_type='custom-amortization-schedule',
+        amortization_weights=weights,
+    )
+
+    iof_grossup = IofGrossup(loan, date(2020, 1, 1))
+    grossed_up_loan = iof_grossup.grossed_up_loan
+
+    assert grossed_up_loan.amortization_weights == weights
+
+    # the net principal is recovered after the taxes over the grossed up one
+    iof = grossed_up_loan.principal * 0.0038 + sum(
+        a * min(n * 0.000082, 0.015)
+        for a, n in zip(grossed_up_loan.amortizations, [31, 60, 91])
+    )
+
+    assert grossed_up_loan.principal - iof == pytest.approx(loan.principal)
+
+
+def test_iof_grossup_irr_is_memoized_and_shared(loan):
+
+    IRR_CACHE.clear()
+
+    iof_grossup = IofGrossup(loan, loan.start_date)
+    irr = iof_grossup.irr
+
+    assert iof_grossup.irr == irr
+    assert IRR_CACHE.cache_info().misses == 1
+    assert IRR_CACHE.cache_info().hits == 0
+
+    # the same cash flows of another grossup are looked up in the cache
+    assert IofGrossup(loan, loan.start_date).irr == irr
+    assert IRR_CACHE.cache_info().hits == 1
+
+
+def test_iof_grossup_irr_cache_is_resolved_when_solving(loan, monkeypatch):
+
+    irr_cache = IrrCache()
+    monkeypatch.setattr(irr, 'IRR_CACHE', irr_cache)
+
+    IofGrossup(loan, loan.start_date).irr
+
+    assert irr_cache.cache_info().misses == 1
@@ -0,0 +1,137 @@
+import json
+import pickle
+
+import pytest
+
+from loan_calculator.schedule import SCHEDULE_TYPE_CLASS_MAP
+from loan_calculator.schedule.constant import ConstantAmortizationSchedule
+from loan_calculator.schedule.price import ProgressivePriceSchedule
+
+
+def test_schedule_columns_are_evaluated_on_first_access():
+
+    schedule = ConstantAmortizationSchedule(800.0, 0.8, [1, 2, 3, 4, 5])
+
+    assert schedule._balance is None
+    assert schedule._due_payments is None
+
+    amortizations = schedule.amortizations
+
+    assert schedule._balance is None
+    assert schedule._interest_payments is None
+    assert schedule.amortizations is amortizations
+
+
+def test_schedule_totals_are_memoized():
+
+    schedule = ConstantAmortizationSchedule(800.0, 0.8, [1, 2, 3, 4, 5])
+
+    assert schedule.total_interest == pytest.approx(1920.0)
+    assert schedule._total_interest == pytest.approx(1920.0)
+
+
+def test_schedule_has_no_instance_dict():
+
+    schedule = ProgressivePriceSchedule(100.0, 0.01, [30, 60])
+
+    assert not hasattr(schedule, '__dict__')
+
+    with pytest.raises(AttributeError):
+        schedule.foo = 'bar'
+
+
+def test_schedule_to_array_packs_columns():
+
+    schedule = ConstantAmortizationSchedule(800.0, 0.8, [1, 2, 3, 4, 5])
+
+    buffer = schedule.to_array()
+
+    assert buffer.typecode == 'd'
+    assert len(buffer) == 4 * 6
+    assert list(buffer[:6]) == pytest.approx(schedule.balance)
+    assert list(buffer[7:12]) == pytest.approx(schedule.amortizations)
+    assert list(buffer[13:18]) == pytest.approx(schedule.interest_payments)
+    assert list(buffer[19:]) == pytest.approx(schedule.due_payments)
+    assert schedule.to_array() is buffer
+
+
+def test_schedule_columns_are_stored_in_the_buffer():
+
+    schedule = ProgressivePriceSchedule(100.0, 0.01, [30, 60])
+
+    amortizations = schedule.amortizations
+    buffer = schedule.to_array()
+
+    assert schedule.amortizations is amortizations
+    assert list(buffer[4:6]) == amortizations
+    assert amortizations._values.obj is buffer
+
+
+def test_schedule_columns_behave_as_lists():
+
+    schedule = ConstantAmortizationSchedule(800.0, 0.8, [1, 2, 3])
+
+    amortizations = schedule.amortizations
+
+    assert amortizations == [800.0 / 3] * 3
+    assert [800.0 / 3] * 3 == amortizations
+    assert amortizations != [1.0]
+    assert len(amortizations) == 3
+    assert amortizations[-1] == pytest.approx(800.0 / 3)
+    assert amortizations[1:] == [800.0 / 3] * 2
+    assert amortizations[:1] + amortizations == [800.0 / 3] * 4
+    assert [0.0] + amortizations == [0.0] + [800.0 / 3] * 3
+    assert sum(amortizations) == pytest.approx(800.0)
+    assert repr(amortizations) == repr([800.0 / 3] * 3)
+
+
+def test_schedule_columns_are_pickled_as_lists():
+
+    schedule = ProgressivePriceSchedule(100.0, 0.01, [30, 60])
+    balance = schedule.balance
+
+    unpickled = pickle.loads(pickle.dumps(balance))
+
+    assert type(unpickled) is list
+    assert unpickled == balance
+    assert json.loads(json.dumps(balance.tolist())) == balance
+
+    schedule = pickle.loads(pickle.dumps(schedule))
+
+    assert schedule.balance == balance
+    assert list(schedule.to_array()[:3]) == balance
+
+
+@pytest.mark.parametrize('schedule_cls', list(SCHEDULE_TYPE_CLASS_MAP.values()))  # noqa
+def test_iter_rows_streams_the_schedule_columns(schedule_cls):
+
+    return_days = [30, 61, 92, 120, 151]
+    schedule = schedule_cls(1000.0, 0.002, return_days)
+
+    rows = list(schedule.iter_rows())
+
+    assert schedule._balance is None
+    assert schedule._amortizations is None
+
+    expected = schedule_cls(1000.0, 0.002, return_days)
+
+    assert [row[0] for row in rows] == return_days
+    assert [row[1] for row in rows] == pytest.approx(expected.balance[1:], abs=1e-9)  # noqa
+    assert [row[2] for row in rows] == pytest.approx(expected.amortizations)  # noqa
+    assert [row[3] for row in rows] == pytest.approx(expected.interest_payments)  # noqa
+    assert [row[4] for row in rows] == pytest.approx(expected.due_payments)
+
+
+def test_iter_rows_with_unsorted_return_days():
+
+    schedule = ProgressivePriceSchedule(1000.0, 0.002, [30, 92, 61])
+
+    assert list(schedule.iter_rows()) == list(
+        zip(
+            schedule.return_days,
+            schedule.balance[1:],
+            schedule.amortizations,
+            schedule.interest_payments,
+            schedule.due_payments,
+        )
+    )
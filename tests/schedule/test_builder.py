@@ -0,0 +1,77 @@
+import pytest
+
+from loan_calculator.schedule.builder import ScheduleBuilder
+from loan_calculator.schedule.constant import ConstantAmortizationSchedule
+from loan_calculator.schedule.price import ProgressivePriceSchedule
+
+
+def test_builder_updates_match_schedule_built_from_scratch():
+
+    builder = ScheduleBuilder(1000.0, 0.001, [30, 60, 90, 120])
+
+    assert builder.insert_return_day(45) == 1
+    assert builder.remove_return_day(90) == 3
+    assert builder.shift_return_day(120, 150) == 3
+
+    assert builder.return_days == [30, 45, 60, 150]
+
+    expected = ProgressivePriceSchedule(1000.0, 0.001, [30, 45, 60, 150])
+    schedule = builder.build()
+
+    assert builder.pmt == pytest.approx(expected.pmt)
+    assert [builder.balance_at(i) for i in range(5)] == pytest.approx(expected.balance)  # noqa
+    assert schedule.balance == pytest.approx(expected.balance)
+    assert schedule.amortizations == pytest.approx(expected.amortizations)
+    assert schedule.interest_payments == pytest.approx(expected.interest_payments)  # noqa
+
+
+def test_builder_for_constant_amortization_schedule():
+
+    builder = ScheduleBuilder(
+        800.0, 0.8, [1, 2, 4, 5], 'constant-amortization-schedule'
+    )
+    builder.insert_return_day(3)
+
+    expected = ConstantAmortizationSchedule(800.0, 0.8, [1, 2, 3, 4, 5])
+
+    assert [builder.balance_at(i) for i in range(6)] == pytest.approx(expected.balance)  # noqa
+    assert builder.build().due_payments == pytest.approx(expected.due_payments)  # noqa
+
+
+def test_builder_rejects_invalid_updates():
+
+    builder = ScheduleBuilder(1000.0, 0.001, [30, 60])
+
+    with pytest.raises(ValueError):
+        builder.insert_return_day(30)
+
+    with pytest.raises(ValueError):
+        builder.remove_return_day(45)
+
+    with pytest.raises(ValueError):
+        builder.shift_return_day(30, 60)
+
+    assert builder.return_days == [30, 60]
+
+    with pytest.raises(ValueError):
+        ScheduleBuilder(1000.0, 0.001, [60, 30])
+
+    with pytest.raises(ValueError):
+        ScheduleBuilder(
+            100.0, 0.001, [30, 60, 90], 'custom-amortization-schedule'
+        )
+
+
+def test_builder_without_return_days():
+
+    builder = ScheduleBuilder(1000.0, 0.001, [])
+
+    with pytest.raises(ValueError):
+        builder.transport
+
+    with pytest.raises(ValueError):
+        builder.pmt
+
+    builder.insert_return_day(30)
+
+    assert builder.pmt == pytest.approx(1000.0 * 1.001 ** 30)
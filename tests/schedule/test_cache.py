@@ -0,0 +1,65 @@
+from datetime import date
+
+import pytest
+
+from loan_calculator.grossup.iof import IofGrossup
+from loan_calculator.loan import Loan
+from loan_calculator.schedule import SCHEDULE_TYPE_CLASS_MAP
+from loan_calculator.schedule.cache import UnitScheduleCache
+from loan_calculator.schedule.price import ProgressivePriceSchedule
+
+
+@pytest.mark.parametrize('schedule_cls', list(SCHEDULE_TYPE_CLASS_MAP.values()))  # noqa
+def test_cached_schedule_matches_schedule_built_from_scratch(schedule_cls):
+
+    cache = UnitScheduleCache()
+
+    schedule = cache.schedule(schedule_cls, 1234.5, 0.001, [30, 60, 90])
+    expected = schedule_cls(1234.5, 0.001, [30, 60, 90])
+
+    assert isinstance(schedule, schedule_cls)
+    assert schedule.principal == 1234.5
+    assert schedule.balance == pytest.approx(expected.balance, abs=1e-9)
+    assert schedule.amortizations == pytest.approx(expected.amortizations)
+    assert schedule.interest_payments == pytest.approx(expected.interest_payments)  # noqa
+    assert schedule.due_payments == pytest.approx(expected.due_payments)
+    assert schedule.total_paid == pytest.approx(expected.total_paid)
+
+
+def test_cache_statistics_and_eviction():
+
+    cache = UnitScheduleCache(maxsize=2)
+
+    cache.schedule(ProgressivePriceSchedule, 100.0, 0.001, [30, 60])
+    cache.schedule(ProgressivePriceSchedule, 200.0, 0.001, [30, 60])
+    cache.schedule(ProgressivePriceSchedule, 100.0, 0.002, [30, 60])
+    cache.schedule(ProgressivePriceSchedule, 100.0, 0.003, [30, 60])
+
+    assert cache.cache_info() == (1, 3, 1, 2, 2)
+
+    # the least recently used configuration was evicted
+    cache.schedule(ProgressivePriceSchedule, 100.0, 0.001, [30, 60])
+
+    assert cache.cache_info().misses == 4
+
+    cache.clear()
+
+    assert cache.cache_info() == (0, 0, 0, 2, 0)
+
+
+def test_loan_and_grossup_share_the_schedule_cache():
+
+    cache = UnitScheduleCache()
+
+    loan = Loan(
+        1000.0,
+        0.5,
+        date(2020, 1, 1),
+        [date(2020, 2, 1), date(2020, 3, 1)],
+        schedule_cache=cache,
+    )
+    grossup = IofGrossup(loan, date(2020, 1, 1))
+
+    assert loan.amortization_schedule.pmt == pytest.approx(ProgressivePriceSchedule(1000.0, loan.daily_interest_rate, [31, 60]).pmt)  # noqa
+    assert grossup.grossed_up_loan.schedule_cache is cache
+    assert cache.cache_info().hits == 1
@@ -0,0 +1,97 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+import pytest
+
+from loan_calculator.schedule import SCHEDULE_TYPE_CLASS_MAP
+from loan_calculator.schedule.cents import CentsSchedule, to_cents
+from loan_calculator.schedule.constant import ConstantAmortizationSchedule
+from loan_calculator.schedule.price import (
+    ProgressivePriceSchedule, RegressivePriceSchedule
+)
+
+
+def test_to_cents_rounds_half_up():
+
+    assert to_cents(10.125) == 1013
+    assert to_cents(10.124) == 1012
+    assert to_cents(-10.125) == -1013
+    assert to_cents(0.0) == 0
+
+    for value in (1270.4249, 37.3051, 8780.5, 0.01, 163.399):
+        assert to_cents(value) == int(
+            Decimal(value).quantize(Decimal('0.01'), ROUND_HALF_UP) * 100
+        )
+
+
+@pytest.mark.parametrize('schedule_cls', list(SCHEDULE_TYPE_CLASS_MAP.values()))  # noqa
+def test_cents_schedule_sums_back_to_principal(schedule_cls):
+
+    schedule = schedule_cls(
+        10000.01, 0.0013, [38, 68, 99, 128, 159, 191, 223]
+    )
+    cents = CentsSchedule(schedule)
+
+    assert all(isinstance(a, int) for a in cents.amortizations)
+    assert cents.total_amortization == 1000001
+    assert cents.balance[0] == 1000001
+    assert cents.balance[-1] == 0
+    assert cents.total_paid == cents.total_amortization + cents.total_interest  # noqa
+
+    for cents_value, value in zip(cents.interest_payments, schedule.interest_payments):  # noqa
+        assert cents_value == to_cents(value)
+
+    for cents_value, value in zip(cents.amortizations, schedule.amortizations):  # noqa
+        assert abs(cents_value - 100 * value) < len(schedule.return_days)
+
+
+def test_price_cents_schedule_keeps_the_due_payment():
+
+    schedule = ProgressivePriceSchedule(
+        10000.0, 0.0013, [38, 68, 99, 128, 159, 191, 223]
+    )
+    cents = CentsSchedule(schedule)
+
+    assert set(cents.due_payments[:-1]) == {to_cents(schedule.pmt)}
+    assert abs(cents.due_payments[-1] - to_cents(schedule.pmt)) <= 7
+
+
+@pytest.mark.parametrize('schedule_cls', [
+    ProgressivePriceSchedule, RegressivePriceSchedule
+])
+def test_price_cents_schedule_only_evaluates_the_interest(schedule_cls):
+
+    schedule = schedule_cls(10000.0, 0.0013, [38, 68, 99])
+    cents = CentsSchedule(schedule)
+
+    # no float column is stored in the schedule
+    assert schedule._buffer is None
+    assert cents.interest_payments == [to_cents(j) for j in schedule.interest_payments]  # noqa
+
+
+def test_constant_amortization_cents_schedule():
+
+    schedule = ConstantAmortizationSchedule(100.0, 0.01, [30, 60, 90])
+    cents = CentsSchedule(schedule)
+
+    assert cents.amortizations == [3333, 3333, 3334]
+    assert cents.balance == [10000, 6667, 3334, 0]
+    assert cents.interest_payments == [to_cents(j) for j in schedule.interest_payments]  # noqa
+
+
+def test_cents_schedule_without_instalments():
+
+    class EmptySchedule(object):
+        principal = 100.0
+        return_days = []
+
+        def calculate_interest(self):
+            return []
+
+        def calculate_amortizations(self):
+            return []
+
+    cents = CentsSchedule(EmptySchedule())
+
+    assert cents.balance == [10000]
+    assert cents.due_payments == cents.amortizations == []
+    assert cents.total_paid == 0
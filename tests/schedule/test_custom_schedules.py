@@ -0,0 +1,64 @@
+import pytest
+
+from loan_calculator.schedule.constant import ConstantAmortizationSchedule
+from loan_calculator.schedule.custom import (
+    CustomAmortizationSchedule,
+    amortization_weights,
+    balloon_weights,
+    bullet_weights,
+)
+
+
+return_days = [1, 2, 3, 4, 5]
+
+
+def test_bullet_schedule():
+
+    schedule = CustomAmortizationSchedule(800.0, 0.8, return_days)
+
+    assert schedule.amortizations == [0.0, 0.0, 0.0, 0.0, 800.0]
+    assert schedule.interest_payments == pytest.approx(5 * [640.0])
+    assert schedule.balance == [800.0, 800.0, 800.0, 800.0, 800.0, 0.0]
+    assert schedule.total_paid == pytest.approx(5 * 640.0 + 800.0)
+
+
+def test_evenly_weighted_schedule_is_constant_amortization_schedule():
+
+    schedule = CustomAmortizationSchedule(
+        800.0, 0.8, return_days, amortization_weights=5 * [0.2]
+    )
+    constant = ConstantAmortizationSchedule(800.0, 0.8, return_days)
+
+    assert schedule.balance == pytest.approx(constant.balance, abs=1e-9)
+    assert schedule.due_payments == pytest.approx(constant.due_payments)
+    for row, constant_row in zip(schedule.iter_rows(), constant.iter_rows()):
+        assert row == pytest.approx(constant_row, abs=1e-9)
+
+
+def test_balloon_and_amortization_vector_weights():
+
+    assert bullet_weights(3) == [0.0, 0.0, 1.0]
+    assert balloon_weights(4, 0.6) == pytest.approx([0.1, 0.1, 0.1, 0.7])
+    assert amortization_weights(800.0, [200, 600]) == [0.25, 0.75]
+
+    schedule = CustomAmortizationSchedule(
+        800.0, 0.01, [30, 60], amortization_weights=[0.25, 0.75]
+    )
+
+    assert schedule.amortizations == [200.0, 600.0]
+    for row, column_row in zip(schedule.iter_rows(), zip([30, 60], schedule.balance[1:], schedule.amortizations, schedule.interest_payments, schedule.due_payments)):  # noqa
+        assert row == pytest.approx(column_row)
+    assert schedule.scaled(1600.0).amortizations == pytest.approx([400.0, 1200.0])  # noqa
+
+
+def test_custom_schedule_validation():
+
+    with pytest.raises(ValueError):
+        CustomAmortizationSchedule(
+            800.0, 0.01, [30, 60], amortization_weights=[1.0]
+        )
+
+    with pytest.raises(ValueError):
+        CustomAmortizationSchedule(
+            800.0, 0.01, [30, 60], amortization_weights=[0.5, 0.6]
+        )
@@ -0,0 +1,44 @@
+import pytest
+
+from loan_calculator.schedule import (
+    ProgressivePriceSchedule,
+    RegressivePriceSchedule,
+    ConstantAmortizationSchedule,
+)
+from loan_calculator.schedule.indexed import INDEXED_SCHEDULE_CLASS_MAP
+
+
+return_days = [30, 60, 90]
+index_ratios = [1.01, 1.015, 1.03]
+
+
+@pytest.mark.parametrize('real_schedule_cls', [
+    ProgressivePriceSchedule,
+    RegressivePriceSchedule,
+    ConstantAmortizationSchedule,
+])
+def test_indexed_schedule_is_real_schedule_times_index_ratios(real_schedule_cls):  # noqa
+
+    real = real_schedule_cls(1000.0, 0.001, return_days)
+    indexed = INDEXED_SCHEDULE_CLASS_MAP[real_schedule_cls](
+        1000.0, 0.001, return_days, index_ratios
+    )
+
+    assert indexed.schedule_type is real.schedule_type
+    assert indexed.balance == pytest.approx([1000.0] + [b * r for b, r in zip(real.balance[1:], index_ratios)])  # noqa
+    assert indexed.due_payments == pytest.approx([p * r for p, r in zip(real.due_payments, index_ratios)])  # noqa
+    assert indexed.total_amortization == pytest.approx(sum(a * r for a, r in zip(real.amortizations, index_ratios)))  # noqa
+    assert list(indexed.iter_rows()) == pytest.approx(list(zip(return_days, indexed.balance[1:], indexed.amortizations, indexed.interest_payments, indexed.due_payments)))  # noqa
+
+    scaled = indexed.scaled(2000.0)
+
+    assert scaled.due_payments == pytest.approx([2 * p for p in indexed.due_payments])  # noqa
+    assert list(scaled.iter_rows())[-1][-1] == pytest.approx(scaled.due_payments[-1])  # noqa
+
+
+def test_indexed_schedule_requires_an_index_ratio_per_return_day():
+
+    with pytest.raises(ValueError):
+        INDEXED_SCHEDULE_CLASS_MAP[RegressivePriceSchedule](
+            1000.0, 0.001, return_days, index_ratios[:2]
+        )
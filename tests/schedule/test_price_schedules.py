@@ -83,3 +83,88 @@ def test_regressive_price_amortization_schedule():
     assert schedule.total_amortization == pytest.approx(principal, rel=0.01)
     assert schedule.total_interest == pytest.approx(1469.80, rel=0.01)
     assert schedule.total_paid == pytest.approx(10000.00, rel=0.01)
+
+
+def test_price_balance_matches_recursive_definition():
+    """Assert the balance satisfies b_i = b_{i-1}(1+d)^{n_i-n_{i-1}} - P."""
+    daily_interest_rate = 0.0005
+    return_days = list(range(1, 361))
+
+    schedule = ProgressivePriceSchedule(
+        1000.0, daily_interest_rate, return_days
+    )
+
+    expected_balances = [1000.0]
+    for n, m in zip(return_days, [0] + return_days[:-1]):
+        expected_balances.append(
+            expected_balances[-1] * (1 + daily_interest_rate) ** (n - m)
+            - schedule.pmt
+        )
+
+    assert schedule.balance == pytest.approx(expected_balances, abs=1e-6)
+
+
+def test_price_balance_scales_linearly():
+    """Regression check: balance evaluation must be O(k), not O(k log k).
+
+    Discount factor reads and return day comparisons made while the balance
+    is evaluated are counted. Their number must grow by the same amount
+    whenever the number of instalments grows by the same amount, which
+    neither a quadratic nor a sort based implementation does.
+    """
+
+    operations = [0]
+
+    class CountingList(list):
+
+        def __iter__(self):
+            for x in super(CountingList, self).__iter__():
+                operations[0] += 1
+                yield x
+
+        def __getitem__(self, index):
+            item = super(CountingList, self).__getitem__(index)
+            operations[0] += len(item) if isinstance(index, slice) else 1
+            return item
+
+    class CountingDay(int):
+
+        def __lt__(self, other):
+            operations[0] += 1
+            return int(self) < other
+
+        def __le__(self, other):
+            operations[0] += 1
+            return int(self) <= other
+
+        def __gt__(self, other):
+            operations[0] += 1
+            return int(self) > other
+
+        def __ge__(self, other):
+            operations[0] += 1
+            return int(self) >= other
+
+    def count(num_instalments):
+        return_days = CountingList(
+            CountingDay(n) for n in range(1, num_instalments + 1)
+        )
+        schedule = RegressivePriceSchedule(
+            1000.0,
+            0.001,
+            return_days,
+            CountingList(1.001 ** -n for n in range(1, num_instalments + 1)),
+        )
+        operations[0] = 0
+        schedule.calculate_balance()
+        return operations[0]
+
+    assert count(1600) - count(800) == 2 * (count(800) - count(400))
+
+
+def test_price_balance_with_unsorted_return_days():
+
+    schedule = ProgressivePriceSchedule(1000.0, 0.002, [30, 92, 61])
+    expected = ProgressivePriceSchedule(1000.0, 0.002, [30, 61, 92])
+
+    assert schedule.balance == pytest.approx([expected.balance[i] for i in (0, 1, 3, 2)])  # noqa
@@ -0,0 +1,102 @@
+import pytest
+
+from loan_calculator.schedule import SCHEDULE_TYPE_CLASS_MAP
+from loan_calculator.schedule.base import AmortizationScheduleType
+
+np = pytest.importorskip('numpy')
+
+from loan_calculator.batch import (  # noqa
+    BatchSchedule, BATCH_RELATIVE_TOLERANCE
+)
+
+
+principals = [8530.20, 1000.0, 800.0, 5000.0]
+daily_interest_rates = [0.0009857789690617125, 0.001, 0.8, 0.0005]
+return_days = [
+    [30, 60, 90, 120, 150, 180, 210, 240, 270, 300],
+    [10, 45],
+    [1, 2, 3, 4, 5],
+    [31, 59, 90, 120, 151, 181],
+]
+schedule_types = [
+    AmortizationScheduleType.progressive_price_schedule,
+    AmortizationScheduleType.regressive_price_schedule,
+    AmortizationScheduleType.constant_amortization_schedule,
+    'regressive-price-schedule',
+]
+
+
+def test_batch_schedule_matches_scalar_schedules():
+
+    batch = BatchSchedule(
+        principals, daily_interest_rates, return_days, schedule_types
+    )
+
+    for i, schedule_type in enumerate(schedule_types):
+
+        schedule = SCHEDULE_TYPE_CLASS_MAP[
+            AmortizationScheduleType(schedule_type)
+        ](principals[i], daily_interest_rates[i], return_days[i])
+
+        k = len(return_days[i])
+
+        for column in ('amortizations', 'interest_payments', 'due_payments'):
+            assert list(getattr(batch, column)[i, :k]) == pytest.approx(getattr(schedule, column), rel=BATCH_RELATIVE_TOLERANCE)  # noqa
+            assert not np.any(getattr(batch, column)[i, k:])
+
+        assert list(batch.balance[i, :k + 1]) == pytest.approx(schedule.balance, rel=BATCH_RELATIVE_TOLERANCE, abs=1e-9)  # noqa
+        assert batch.total_paid[i] == pytest.approx(schedule.total_paid, rel=BATCH_RELATIVE_TOLERANCE)  # noqa
+
+
+def test_batch_schedule_with_padded_return_days():
+
+    padded = np.zeros((4, 10), dtype=int)
+    for i, r_days in enumerate(return_days):
+        padded[i, :len(r_days)] = r_days
+
+    ragged = BatchSchedule(
+        principals, daily_interest_rates, return_days, [0, 1, 2, 1]
+    )
+    batch = BatchSchedule(
+        principals,
+        daily_interest_rates,
+        padded,
+        [0, 1, 2, 1],
+        num_instalments=[len(r_days) for r_days in return_days],
+    )
+
+    assert len(batch) == 4
+    assert np.allclose(batch.balance, ragged.balance)
+    assert np.allclose(batch.due_payments, ragged.due_payments)
+
+
+def test_batch_schedule_rejects_decreasing_return_days():
+
+    with pytest.raises(ValueError):
+        BatchSchedule([100.0], [0.01], [[2, 1]], [0])
+
+
+def test_batch_schedule_rejects_unknown_schedule_type():
+
+    with pytest.raises(ValueError):
+        BatchSchedule([100.0], [0.01], [[1, 2]], [7])
+
+
+def test_batch_schedule_rejects_boolean_schedule_type():
+
+    with pytest.raises(ValueError):
+        BatchSchedule([100.0], [0.01], [[1, 2]], [True])
+
+
+def test_batch_schedule_rejects_too_many_instalments():
+
+    with pytest.raises(ValueError):
+        BatchSchedule([100.0], [0.01], [[1, 2]], [0], num_instalments=[3])
+
+
+def test_batch_schedule_rejects_unsupported_schedule_type():
+
+    with pytest.raises(ValueError):
+        BatchSchedule(
+            [100.0], [0.01], [[1, 2]], ['custom-amortization-schedule']
+        )
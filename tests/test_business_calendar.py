@@ -0,0 +1,84 @@
+from datetime import date
+
+import pytest
+
+from loan_calculator.business_calendar import BusinessCalendar
+
+
+# 2020-04-10 was a friday (Good Friday) and 2020-04-21 a tuesday
+calendar = BusinessCalendar(
+    holidays=[date(2020, 4, 10), date(2020, 4, 21), date(2020, 5, 1)],
+    start_date=date(2019, 1, 1),
+    end_date=date(2021, 12, 31),
+)
+
+
+def test_is_business_day():
+
+    assert calendar.is_business_day(date(2020, 4, 9))
+    assert not calendar.is_business_day(date(2020, 4, 10))
+    assert not calendar.is_business_day(date(2020, 4, 11))
+    assert not calendar.is_business_day(date(2020, 4, 12).toordinal())
+
+
+def test_roll():
+
+    friday = date(2020, 4, 10)
+
+    assert calendar.roll(friday) == date(2020, 4, 13).toordinal()
+    assert calendar.roll(friday, 'preceding') == date(2020, 4, 9).toordinal()
+    assert calendar.roll(date(2020, 4, 9)) == date(2020, 4, 9).toordinal()
+
+    # 2020-02-29 was a saturday, following business day is in march
+    assert calendar.roll(date(2020, 2, 29), 'modified-following') == date(2020, 2, 28).toordinal()  # noqa
+    assert calendar.next_business_day(date(2020, 4, 9)) == date(2020, 4, 13).toordinal()  # noqa
+
+
+def test_business_days_between():
+
+    assert calendar.business_days_between(date(2020, 4, 6), date(2020, 4, 13)) == 4  # noqa
+    assert calendar.business_days_between(date(2020, 1, 1), date(2021, 1, 1)) == 262 - 3  # noqa
+
+
+def test_out_of_range():
+
+    with pytest.raises(ValueError):
+        calendar.is_business_day(date(2022, 1, 1))
+
+
+def test_return_dates():
+
+    assert calendar.return_dates(date(2020, 1, 31), 4) == [
+        date(2020, 2, 28), date(2020, 3, 31), date(2020, 4, 30),
+        date(2020, 5, 29),
+    ]
+    assert calendar.return_dates(date(2020, 3, 27), 2, 'biweekly') == [
+        date(2020, 4, 13), date(2020, 4, 24),
+    ]
+
+
+def test_generate_return_ordinals_matches_return_dates():
+
+    np = pytest.importorskip('numpy')
+
+    start_dates = [
+        date(2020, 1, 31), date(2020, 3, 27), date(2019, 12, 10),
+        date(2020, 2, 29),
+    ]
+
+    for frequency in ('monthly', 'biweekly'):
+        for convention in ('following', 'modified-following', 'preceding'):
+
+            ordinals = calendar.generate_return_ordinals(
+                np.array(start_dates, dtype='datetime64[D]'),
+                12,
+                frequency,
+                convention
+            )
+
+            for start_date, row in zip(start_dates, ordinals):
+                assert [date.fromordinal(o) for o in row] == calendar.return_dates(start_date, 12, frequency, convention)  # noqa
+
+    offsets = calendar.generate_return_ordinals(start_dates, 1, offsets=True)
+
+    assert offsets[:, 0].tolist() == [28, 31, 31, 30]
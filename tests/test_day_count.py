@@ -0,0 +1,87 @@
+from datetime import date
+
+import pytest
+
+from loan_calculator.business_calendar import BusinessCalendar
+from loan_calculator.day_count import (
+    ActualDayCount, Thirty360DayCount, BusinessDayCount
+)
+from loan_calculator.grossup.iof import IofGrossup
+from loan_calculator.interest_rate import YearSizeType
+from loan_calculator.loan import Loan
+
+
+calendar = BusinessCalendar(
+    holidays=[date(2020, 4, 10), date(2020, 4, 21), date(2020, 5, 1)],
+    start_date=date(2019, 1, 1),
+    end_date=date(2021, 12, 31),
+)
+
+return_dates = [date(2020, 2, 1), date(2020, 3, 1), date(2020, 3, 31)]
+
+
+def test_actual_day_count():
+
+    convention = ActualDayCount(YearSizeType.banker)
+
+    assert convention.year_size == 360
+    assert convention.day_count(date(2020, 1, 1), date(2020, 3, 1)) == 60
+    assert convention.day_counts(date(2020, 1, 1), return_dates) == [31, 60, 90]  # noqa
+
+
+def test_thirty_360_day_count():
+
+    convention = Thirty360DayCount()
+
+    assert convention.year_size == 360
+    assert convention.day_counts(date(2020, 1, 1), return_dates) == [30, 60, 90]  # noqa
+    assert convention.day_count(date(2020, 1, 31), date(2020, 3, 31)) == 60
+    assert convention.day_count(date(2020, 1, 15), date(2020, 3, 31)) == 76
+    assert convention.day_count(date(2019, 12, 31), date(2020, 2, 29)) == 59
+
+
+def test_business_day_count():
+
+    convention = BusinessDayCount(calendar)
+
+    assert convention.year_size == 252
+    assert convention.day_count(date(2020, 4, 6), date(2020, 4, 13)) == 4
+    assert convention.day_counts(date(2020, 1, 1), return_dates) == [23, 43, 64]  # noqa
+
+
+def test_loan_with_business_day_count():
+
+    annual_interest_rate = 0.12
+    convention = BusinessDayCount(calendar)
+
+    loan = Loan(
+        1000.0,
+        annual_interest_rate,
+        date(2020, 1, 1),
+        return_dates,
+        day_count_convention=convention,
+    )
+
+    assert loan.year_size == 252
+    assert loan.return_days == [23, 43, 64]
+    assert (1 + loan.daily_interest_rate) ** 252 == pytest.approx(1 + annual_interest_rate)  # noqa
+
+    iof_grossup = IofGrossup(
+        loan,
+        loan.start_date,
+        daily_iof_aliquot=0.0,
+        complementary_iof_aliquot=0.0,
+        service_fee_aliquot=0.0,
+    )
+
+    assert iof_grossup.grossed_up_loan.day_count_convention is convention
+    assert iof_grossup.grossed_up_principal == pytest.approx(loan.principal)
+    assert iof_grossup.irr == pytest.approx(loan.daily_interest_rate)
+
+
+def test_loan_default_day_count_is_actual():
+
+    loan = Loan(1000.0, 0.12, date(2020, 1, 1), return_dates, year_size=360)
+
+    assert loan.day_count_convention.year_size == 360
+    assert loan.return_days == [31, 60, 90]
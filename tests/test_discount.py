@@ -0,0 +1,132 @@
+import pytest
+
+from loan_calculator.discount import (
+    calculate_discount_factors, PowerTableCache, POWER_TABLE_BLOCK
+)
+from loan_calculator.grossup.functions import br_iof_progressive_price_grossup
+from loan_calculator.pmt import constant_return_pmt
+from loan_calculator.schedule.price import RegressivePriceSchedule
+
+
+def test_calculate_discount_factors():
+
+    assert calculate_discount_factors(1.0, [0, 1, 2]) == pytest.approx([1.0, 0.5, 0.25])  # noqa
+
+
+def test_discount_factors_are_shared_with_schedule_pmt_and_grossup():
+
+    return_days = [30, 60, 90]
+    discount_factors = calculate_discount_factors(0.001, return_days)
+
+    schedule = RegressivePriceSchedule(
+        100.0, 0.001, return_days, discount_factors
+    )
+
+    assert schedule.discount_factors is discount_factors
+    assert schedule.pmt == pytest.approx(constant_return_pmt(100.0, 0.001, return_days))  # noqa
+    assert br_iof_progressive_price_grossup(100.0, 0.001, 0.000082, 0.0038, return_days, 0.0, discount_factors) == pytest.approx(br_iof_progressive_price_grossup(100.0, 0.001, 0.000082, 0.0038, return_days, 0.0))  # noqa
+
+
+def test_power_table_cache():
+
+    cache = PowerTableCache(maxsize=2, max_horizon=100)
+
+    assert cache.discount_factors(1.0, [0, 1, 2]) == [1.0, 0.5, 0.25]
+    # the table of a rate is only built on its second lookup
+    assert cache.cache_info().currsize == 0
+    assert cache.discount_factors(1.0, [3, 200]) == pytest.approx([0.125, 2.0 ** -200])  # noqa
+    assert cache.discount_factors(1.0, [2]) == [0.25]
+    assert cache.discount_factor(0.001, 30) == 1.0 / 1.001 ** 30
+
+    info = cache.cache_info()
+
+    assert (info.hits, info.misses, info.currsize) == (1, 3, 1)
+    assert info.nbytes == cache.memory_usage() == 8 * 101
+
+    cache.discount_factors(0.001, [1])
+    cache.discount_factors(0.002, [1])
+    cache.discount_factors(0.002, [1])
+
+    assert cache.cache_info().evictions == 1
+    assert cache.cache_info().currsize == 2
+
+    cache.resize(maxsize=1, max_horizon=10)
+
+    assert cache.cache_info().currsize == 1
+    assert cache.memory_usage() == 8 * 2
+
+    cache.evict(0.002)
+    cache.evict(0.002)
+
+    assert cache.cache_info().currsize == 0
+    assert cache.cache_info().evictions == 3
+
+    cache.clear()
+
+    assert cache.cache_info() == (0, 0, 0, 1, 0, 0)
+
+
+def test_power_table_cache_matches_exponentiation():
+
+    cache = PowerTableCache()
+    d = 0.0009857789690617125
+    return_days = [30, 60, 91, -1, 10.5]
+    expected = [1.0 / (1 + d) ** n for n in return_days]
+
+    assert cache.discount_factors(d, return_days) == expected
+    assert cache.discount_factors(d, return_days) == expected
+
+    return_days = list(range(0, 36601, 7))
+
+    cache.discount_factors(d, return_days)
+
+    assert cache.discount_factors(d, return_days) == pytest.approx([1.0 / (1 + d) ** n for n in return_days], rel=1e-13, abs=0.0)  # noqa
+
+
+def test_power_table_cache_resize_does_not_truncate_shared_tables():
+
+    cache = PowerTableCache()
+    cache.discount_factors(0.001, [3000])
+    cache.discount_factors(0.001, [3000])
+
+    # a table held by a concurrent lookup keeps its length
+    table = cache._tables[0.001]
+    cache.resize(max_horizon=1000)
+
+    assert len(table) == 3001
+    assert len(cache._tables[0.001]) == 1001
+    assert cache.discount_factors(0.001, [1000, 3000]) == pytest.approx([1.0 / 1.001 ** 1000, 1.0 / 1.001 ** 3000], rel=1e-13)  # noqa
+
+
+class CountingBase(float):
+
+    powers = 0
+
+    def __pow__(self, other):
+        CountingBase.powers += 1
+        return float(self) ** other
+
+
+class CountingRate(float):
+
+    def __radd__(self, other):
+        return CountingBase(other + float(self))
+
+
+def test_power_table_cache_spares_exponentiations():
+
+    cache = PowerTableCache()
+    rate = CountingRate(0.0009857789690617125)
+    return_days = [30 * (j + 1) for j in range(360)]
+
+    def powers(lookups):
+        CountingBase.powers = 0
+        for _ in range(lookups):
+            cache.discount_factors(rate, return_days)
+        return CountingBase.powers
+
+    # the first lookup exponentiates, the second one builds the table by
+    # repeated multiplication and the further ones just index it
+    assert powers(1) == 360
+    assert powers(1) == 10801 // POWER_TABLE_BLOCK + 1
+    assert powers(200) == 0
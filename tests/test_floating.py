@@ -0,0 +1,159 @@
+from datetime import date
+
+import pytest
+
+from loan_calculator.floating import DailyRateSeries, FloatingRateLoan
+from loan_calculator.grossup.iof import IofGrossup
+from loan_calculator.loan import Loan
+
+
+start_date = date(2020, 1, 1)
+return_dates = [date(2020, 1, 11), date(2020, 1, 21), date(2020, 1, 31)]
+
+
+def test_daily_rate_series_accrual_factors():
+
+    series = DailyRateSeries(start_date, [0.01, 0.02], projected_rate=0.1)
+
+    assert len(series) == 2
+    assert series.accrual_factor(0) == 1.0
+    assert series.accrual_factor(2) == pytest.approx(1.01 * 1.02)
+    assert series.accrual_factor(4) == pytest.approx(1.01 * 1.02 * 1.1 ** 2)
+    assert series.discount_factors(1, [1, 3]) == pytest.approx([1 / 1.02, 1 / (1.02 * 1.1 ** 2)])  # noqa
+
+    with pytest.raises(ValueError):
+        series.accrual_factor(-1)
+
+
+def test_daily_rate_series_extension_keeps_prefix():
+
+    series = DailyRateSeries(start_date, [0.01], percentage=2.0)
+    prefix = list(series.accrual_factors)
+
+    series.extend([0.005, 0.005])
+
+    assert list(series.accrual_factors[:2]) == prefix
+    assert series.accrual_factor(3) == pytest.approx(1.02 * 1.01 * 1.01)
+
+
+@pytest.mark.parametrize('schedule_type', [
+    'progressive-price-schedule',
+    'regressive-price-schedule',
+    'constant-amortization-schedule',
+])
+def test_constant_series_matches_fixed_rate_loan(schedule_type):
+
+    daily_rate = 0.001
+    series = DailyRateSeries(date(2019, 12, 1), [daily_rate] * 100)
+
+    floating_loan = FloatingRateLoan(
+        1000.0,
+        series,
+        0.0,
+        start_date,
+        return_dates,
+        amortization_schedule_type=schedule_type,
+    )
+    fixed_loan = Loan(
+        1000.0,
+        (1 + daily_rate) ** 365 - 1,
+        start_date,
+        return_dates,
+        amortization_schedule_type=schedule_type,
+    )
+
+    assert floating_loan.series_start_day == 31
+    assert floating_loan.balance == pytest.approx(fixed_loan.balance)
+    assert floating_loan.due_payments == pytest.approx(fixed_loan.due_payments)  # noqa
+    assert floating_loan.interest_payments == pytest.approx(fixed_loan.interest_payments)  # noqa
+
+
+def test_floating_rate_loan_balance_recursion_and_reprojection():
+
+    series = DailyRateSeries(start_date, [0.001] * 15, projected_rate=0.002)
+
+    loan = FloatingRateLoan(
+        1000.0,
+        series,
+        0.1,
+        start_date,
+        return_dates,
+        amortization_schedule_type='regressive-price-schedule',
+    )
+
+    d = loan.daily_interest_rate
+
+    def accrual(n, m):
+        return series.accrual_factor(m) / series.accrual_factor(n) * (1 + d) ** (m - n)  # noqa
+
+    balance, previous_day = 1000.0, 0
+    for n, payment, b in zip(loan.return_days, loan.due_payments, loan.balance[1:]):  # noqa
+        balance = balance * accrual(previous_day, n) - payment
+        previous_day = n
+        assert b == pytest.approx(balance, abs=1e-9)
+
+    assert balance == pytest.approx(0.0, abs=1e-9)
+
+    pmt = loan.amortization_schedule.pmt
+
+    series.extend([0.003] * 15)
+    loan.reproject()
+
+    assert loan.amortization_schedule.pmt > pmt
+    assert loan.balance[-1] == pytest.approx(0.0, abs=1e-9)
+
+
+def test_floating_rate_loan_grossup():
+
+    series = DailyRateSeries(start_date, [0.001] * 40)
+    loan = FloatingRateLoan(
+        100.0,
+        series,
+        0.1,
+        start_date,
+        return_dates,
+        amortization_schedule_type='regressive-price-schedule',
+    )
+
+    grossed_up_loan = IofGrossup(loan, start_date).grossed_up_loan
+
+    assert isinstance(grossed_up_loan, FloatingRateLoan)
+    assert grossed_up_loan.rate_series is series
+
+    # the net principal is recovered after the taxes over the grossed up one
+    iof = grossed_up_loan.principal * 0.0038 + sum(
+        a * min(n * 0.000082, 0.015)
+        for a, n in zip(grossed_up_loan.amortizations, [10, 20, 30])
+    )
+
+    assert grossed_up_loan.principal - iof == pytest.approx(loan.principal)
+
+
+def test_floating_rate_loan_prepayment():
+
+    series = DailyRateSeries(start_date, [0.001] * 15, projected_rate=0.002)
+    loan = FloatingRateLoan(
+        1000.0,
+        series,
+        0.1,
+        start_date,
+        return_dates,
+        amortization_schedule_type='regressive-price-schedule',
+    )
+    d = loan.daily_interest_rate
+
+    prepayment = loan.prepay(date(2020, 1, 15), 100.0)
+
+    # accrued with the series from the first return date (day 10) on
+    assert prepayment.outstanding_balance == pytest.approx(
+        loan.balance[1] * series.accrual_factor(14) /
+        series.accrual_factor(10) * (1 + d) ** 4
+    )
+
+    remaining = prepayment.remaining_schedule
+
+    assert remaining.discount_factors == pytest.approx([
+        series.accrual_factor(14) / series.accrual_factor(n) / (1 + d) ** (n - 14)  # noqa
+        for n in (20, 30)
+    ])
+    assert remaining.balance[-1] == pytest.approx(0.0, abs=1e-9)
@@ -0,0 +1,129 @@
+from datetime import date
+
+import pytest
+
+from loan_calculator.grossup.iof import IofGrossup
+from loan_calculator.inflation import PriceIndexSeries, IndexedLoan
+from loan_calculator.loan import Loan
+
+
+index_numbers = [100.0, 101.0, 102.01, 103.0301]
+
+
+def test_price_index_series_pro_rata_die():
+
+    series = PriceIndexSeries(date(2020, 1, 15), index_numbers)
+
+    assert series.index_at(date(2020, 2, 1)) == 101.0
+    assert series.index_at(date(2020, 1, 16)) == pytest.approx(100.0 * 1.01 ** (15 / 31))  # noqa
+    assert series.index_ratio(date(2020, 1, 1), date(2020, 3, 1)) == pytest.approx(1.0201)  # noqa
+
+    with pytest.raises(ValueError):
+        series.index_at(date(2020, 4, 2))
+
+    with pytest.raises(ValueError):
+        series.index_at(date(2019, 12, 31))
+
+
+def test_price_index_series_projection_and_extension():
+
+    series = PriceIndexSeries(
+        date(2020, 1, 1), index_numbers, projected_rate=0.02
+    )
+
+    assert series.index_at(date(2020, 5, 1)) == pytest.approx(103.0301 * 1.02)
+
+    series.extend([105.0])
+
+    assert series.index_at(date(2020, 5, 1)) == 105.0
+    assert series.index_at(date(2020, 6, 1)) == pytest.approx(105.0 * 1.02)
+
+
+def test_index_ratios_are_cached_by_date():
+
+    series = PriceIndexSeries(date(2020, 1, 1), index_numbers)
+    return_dates = [date(2020, 2, 10), date(2020, 3, 10)]
+
+    for _ in range(100):
+        series.index_ratios(date(2020, 1, 10), return_dates)
+
+    assert (series.misses, series.hits) == (2, 198)
+
+
+def test_indexed_loan():
+
+    series = PriceIndexSeries(date(2020, 1, 1), index_numbers)
+    return_dates = [date(2020, 2, 1), date(2020, 3, 1), date(2020, 4, 1)]
+
+    real_loan = Loan(1000.0, 0.05, date(2020, 1, 1), return_dates)
+    indexed_loan = IndexedLoan(
+        1000.0, 0.05, series, date(2020, 1, 1), return_dates
+    )
+
+    assert indexed_loan.index_ratios == pytest.approx([1.01, 1.0201, 1.030301])  # noqa
+    assert indexed_loan.due_payments == pytest.approx([p * r for p, r in zip(real_loan.due_payments, indexed_loan.index_ratios)])  # noqa
+    assert indexed_loan.balance[-1] == pytest.approx(0.0, abs=1e-9)
+
+
+def test_indexed_loan_grossup():
+
+    series = PriceIndexSeries(date(2020, 1, 1), index_numbers)
+    return_dates = [date(2020, 2, 1), date(2020, 3, 1), date(2020, 4, 1)]
+
+    indexed_loan = IndexedLoan(
+        1000.0, 0.05, series, date(2020, 1, 1), return_dates
+    )
+
+    iof_grossup = IofGrossup(indexed_loan, date(2020, 1, 1))
+    grossed_up_loan = iof_grossup.grossed_up_loan
+
+    assert isinstance(grossed_up_loan, IndexedLoan)
+    assert grossed_up_loan.index_ratios == indexed_loan.index_ratios
+
+    # the grossed up instalments are indexed as well
+    scale = grossed_up_loan.principal / indexed_loan.principal
+    assert grossed_up_loan.due_payments == pytest.approx([scale * p for p in indexed_loan.due_payments])  # noqa
+
+    # the net principal is recovered after the taxes over the indexed
+    # amortizations of the grossed up one
+    iof = grossed_up_loan.principal * 0.0038 + sum(
+        a * min(n * 0.000082, 0.015)
+        for a, n in zip(grossed_up_loan.amortizations, [31, 60, 91])
+    )
+
+    assert grossed_up_loan.principal - iof == pytest.approx(indexed_loan.principal)  # noqa
+
+
+def test_indexed_loan_prepayment():
+
+    series = PriceIndexSeries(date(2020, 1, 1), index_numbers)
+    return_dates = [date(2020, 2, 1), date(2020, 3, 1), date(2020, 4, 1)]
+
+    indexed_loan = IndexedLoan(
+        1000.0, 0.05, series, date(2020, 1, 1), return_dates
+    )
+
+    with pytest.raises(ValueError):
+        indexed_loan.prepay(date(2020, 2, 15), 300.0, 'keep-pmt')
+
+    prepayment = indexed_loan.prepay(date(2020, 2, 15), 300.0)
+
+    # the balance is accrued and indexed until the prepayment date
+    assert prepayment.outstanding_balance == pytest.approx(
+        indexed_loan.balance[1] *
+        (1 + indexed_loan.daily_interest_rate) ** 14 *
+        series.index_ratio(date(2020, 2, 1), date(2020, 2, 15))
+    )
+
+    # the remaining instalments are the real ones, indexed from the
+    # prepayment date
+    remaining_ratios = series.index_ratios(date(2020, 2, 15), return_dates[1:])  # noqa
+    real_payments = [
+        p / r for p, r in
+        zip(prepayment.remaining_schedule.due_payments, remaining_ratios)
+    ]
+
+    assert prepayment.due_payments[0] == indexed_loan.due_payments[0]
+    assert real_payments[0] == pytest.approx(real_payments[1])
+    assert real_payments[0] < indexed_loan.amortization_schedule.real_schedule.due_payments[1]  # noqa
+    assert prepayment.remaining_schedule.balance[-1] == pytest.approx(0.0, abs=1e-9)  # noqa
@@ -1,7 +1,11 @@
+from math import log
+
 import pytest
 
 from loan_calculator.interest_rate import (
-    InterestRateType, convert_to_daily_interest_rate
+    InterestRateType,
+    convert_to_daily_interest_rate,
+    convert_to_daily_interest_rates,
 )
 from loan_calculator import YearSizeType
 
@@ -48,3 +52,61 @@ def test_convert_quarterly_interest_rate():
         )
         == pytest.approx(1.0)
     )
+
+
+def test_convert_continuous_interest_rate():
+    assert (
+        convert_to_daily_interest_rate(
+            YearSizeType.commercial.value * log(2),
+            InterestRateType.continuous,
+            YearSizeType.commercial
+        )
+        == pytest.approx(1.0)
+    )
+
+
+def test_convert_nominal_interest_rate():
+    assert (
+        convert_to_daily_interest_rate(
+            0.12,
+            InterestRateType.nominal,
+            YearSizeType.banker,
+            compounding_periods=12,
+        )
+        == pytest.approx(1.01 ** (12 / 360) - 1)
+    )
+
+
+def test_convert_business_annual_interest_rate():
+    assert (
+        convert_to_daily_interest_rate(
+            2 ** YearSizeType.business.value - 1,
+            'business-annual',
+        )
+        == pytest.approx(1.0)
+    )
+
+
+def test_convert_unknown_interest_rate_type():
+    with pytest.raises(TypeError):
+        convert_to_daily_interest_rate(0.1, 'weekly')
+
+
+def test_convert_interest_rates_column():
+
+    aliquots = [0.1, 0.2, 0.1]
+    expected = [
+        convert_to_daily_interest_rate(a, InterestRateType.annual)
+        for a in aliquots
+    ]
+
+    assert convert_to_daily_interest_rates(aliquots, InterestRateType.annual) == expected  # noqa
+
+    np = pytest.importorskip('numpy')
+
+    converted = convert_to_daily_interest_rates(
+        np.array(aliquots), InterestRateType.annual
+    )
+
+    assert list(converted) == pytest.approx(expected)
+    assert list(convert_to_daily_interest_rates(np.array([log(2)]), 'continuous', 1)) == pytest.approx([1.0])  # noqa
@@ -1,8 +1,242 @@
 import pytest
 
-from loan_calculator.irr import approximate_irr
+from loan_calculator.irr import (
+    approximate_irr,
+    batch_approximate_irr,
+    bracket_irr,
+    IrrCache,
+    IrrStatus,
+    newton_raphson_solver,
+    safeguarded_newton_solver,
+    solve_irr,
+    return_polynomial_factory,
+    return_polynomial_derivative_factory,
+    return_polynomial_value_and_derivative_factory,
+)
 
 
 def test_approximate_irr():
 
     assert approximate_irr(1.0, [1.0, 1.0], [1, 2], 0.5) == pytest.approx(0.618033988749895)  # noqa
+
+
+def test_batch_approximate_irr_matches_approximate_irr():
+
+    pytest.importorskip('numpy')
+
+    net_principals = [1.0, 1000.0, 950.0]
+    returns = [[1.0, 1.0], [400.0, 400.0, 400.0], [100.0] * 12]
+    return_days = [[1, 2], [30, 60, 90], [30 * i for i in range(1, 13)]]
+    initial_points = [0.5, 0.001, 0.001]
+
+    result = batch_approximate_irr(
+        net_principals, returns, return_days, initial_points
+    )
+
+    for i in range(3):
+        assert result.irrs[i] == pytest.approx(approximate_irr(net_principals[i], returns[i], return_days[i], initial_points[i]))  # noqa
+
+    assert list(result.statuses) == 3 * [IrrStatus.converged]
+    assert all(1 <= it < 100 for it in result.iterations)
+
+
+def test_batch_approximate_irr_statuses():
+
+    np = pytest.importorskip('numpy')
+
+    result = batch_approximate_irr(
+        np.array([1.0, 1.0]),
+        np.array([[1.0, 1.0], [0.0, 0.0]]),
+        np.array([[1, 2], [1, 2]]),
+        np.array([0.5, 0.5]),
+        max_iterations=2,
+    )
+
+    assert list(result.statuses) == [IrrStatus.max_iterations, IrrStatus.failed]  # noqa
+    assert list(result.iterations) == [2, 1]
+
+
+def test_fused_return_polynomial_evaluation():
+
+    returns = [400.0, 400.0, 400.0]
+    return_days = [30, 60, 90]
+
+    f = return_polynomial_factory(1000.0, returns, return_days)
+    f_prime = return_polynomial_derivative_factory(1000.0, returns, return_days)  # noqa
+    fused = return_polynomial_value_and_derivative_factory(
+        1000.0, returns, return_days
+    )
+
+    for c in (0.0, 0.001, 0.01):
+        value, derivative = fused(c)
+        assert value * (1 + c) ** 90 == pytest.approx(f(c))
+        assert derivative * (1 + c) ** 90 == pytest.approx(f_prime(c))
+
+    # numerical derivative of the polynomial
+    h = 1e-7
+    assert f_prime(0.001) == pytest.approx((f(0.001 + h) - f(0.001 - h)) / (2 * h), rel=1e-5)  # noqa
+
+
+def test_approximate_irr_for_long_horizons():
+
+    # a polynomial evaluation would overflow (1 + c) ** 360000
+    returns = [1.0] * 360
+    return_days = [1000 * i for i in range(1, 361)]
+
+    irr = approximate_irr(100.0, returns, return_days, 0.00001)
+    value, _ = return_polynomial_value_and_derivative_factory(
+        100.0, returns, return_days
+    )(irr)
+
+    assert value == pytest.approx(0.0, abs=1e-9)
+    assert newton_raphson_solver(
+        return_polynomial_value_and_derivative_factory(
+            100.0, returns, return_days
+        ),
+        None,
+        0.00001,
+    ) == pytest.approx(irr)
+
+
+def test_solve_irr_from_far_initial_points():
+
+    returns = [400.0, 400.0, 400.0]
+    return_days = [30, 60, 90]
+    irr = approximate_irr(1000.0, returns, return_days, 0.001)
+
+    # a plain Newton-Raphson search diverges from these initial points
+    for initial_point in (0.5, 10.0, -0.9):
+        result = solve_irr(1000.0, returns, return_days, initial_point)
+        assert result.status == IrrStatus.converged
+        assert result.root == pytest.approx(irr)
+        assert result.residual == pytest.approx(0.0, abs=1e-9)
+        assert 1 <= result.iterations < 100
+
+
+def test_solve_irr_with_negative_irr():
+
+    result = solve_irr(1000.0, [300.0, 300.0, 300.0], [30, 60, 90], 0.001)
+
+    assert result.status == IrrStatus.converged
+    assert result.root < 0
+    assert 1000.0 == pytest.approx(sum(300.0 / (1 + result.root) ** n for n in (30, 60, 90)))  # noqa
+
+
+def test_solve_irr_without_root():
+
+    result = solve_irr(1.0, [0.0, 0.0], [1, 2], 0.5)
+
+    assert result.status == IrrStatus.failed
+    assert result.root == 0.5
+    assert result.iterations == 0
+
+
+def test_bracket_irr():
+
+    fused = return_polynomial_value_and_derivative_factory(
+        1000.0, [400.0, 400.0, 400.0], [30, 60, 90]
+    )
+
+    lower_bound, upper_bound, values = bracket_irr(fused, 0.0001)
+
+    assert fused(lower_bound)[0] <= 0 <= fused(upper_bound)[0]
+    assert values[lower_bound] == fused(lower_bound)
+    assert values[upper_bound] == fused(upper_bound)
+
+    # a bracket around a good initial point costs two evaluations
+    irr = approximate_irr(1000.0, [400.0, 400.0, 400.0], [30, 60, 90], 0.001)
+    lower_bound, upper_bound, values = bracket_irr(fused, irr * (1 - 1e-6))
+
+    assert lower_bound == irr * (1 - 1e-6)
+    assert len(values) == 2
+
+
+def test_safeguarded_newton_solver_with_vanishing_derivative():
+
+    # the derivative of x ** 3 - 2 x + 2 vanishes at sqrt(2 / 3), while
+    # plain Newton-Raphson iterations cycle between 0 and 1
+    def target_function(x):
+        return x ** 3 - 2 * x + 2, 3 * x ** 2 - 2
+
+    for initial_point in ((2.0 / 3) ** 0.5, 0.0):
+        result = safeguarded_newton_solver(
+            target_function, -3.0, 1.0, initial_point
+        )
+        assert result.status == IrrStatus.converged
+        assert result.root == pytest.approx(-1.7692923542386314)
+
+    result = safeguarded_newton_solver(target_function, 0.0, 1.0)
+
+    assert result.status == IrrStatus.failed
+
+
+def test_irr_cache():
+
+    cache = IrrCache(maxsize=2)
+
+    result = cache.solve_irr(1000.0, [400.0] * 3, [30, 60, 90], 0.001)
+
+    assert result == solve_irr(1000.0, [400.0] * 3, [30, 60, 90], 0.001)
+    # the fingerprint does not depend on the initial point nor on the types,
+    # and nothing is solved on a hit
+    assert cache.solve_irr(1000, (400.0, 400, 400.0), (30, 60, 90), 0.5) == result._replace(iterations=0, evaluations=0)  # noqa
+    assert cache.cache_info() == (1, 1, 0, 2, 1)
+    assert cache.hit_rate == 0.5
+
+    cache.solve_irr(1000.0, [400.0] * 3, [30, 60, 90], 0.001, 0.000001)
+    cache.solve_irr(1000.0, [400.0] * 3, [31, 60, 90], 0.001)
+
+    assert cache.cache_info() == (1, 3, 1, 2, 2)
+
+    # solutions which did not converge are not cached
+    cache.solve_irr(1.0, [0.0, 0.0], [1, 2], 0.5)
+
+    assert cache.cache_info() == (1, 4, 1, 2, 2)
+
+    cache.clear()
+
+    assert cache.cache_info() == (0, 0, 0, 2, 0)
+    assert cache.hit_rate == 0.0
+
+
+def test_least_positive_irr_with_negative_returns():
+
+    # the roots are 0.1 and 0.2
+    returns = [230.0, -132.0]
+
+    result = solve_irr(100.0, returns, [1, 2], 0.05)
+
+    assert result.status == IrrStatus.converged
+    assert result.root == pytest.approx(0.1)
+    assert approximate_irr(100.0, returns, [1, 2], 0.05) == pytest.approx(0.1)  # noqa
+    # the least positive root is found regardless of the initial point
+    assert approximate_irr(100.0, returns, [1, 2], 0.5) == pytest.approx(0.1)  # noqa
+
+
+def test_approximate_irr_falls_back_to_newton_raphson():
+
+    # 0.1 is a double root, at which the sign of the NPV does not change,
+    # while Newton-Raphson iterations still approach it
+    returns = [220.0, -121.0]
+    fused = return_polynomial_value_and_derivative_factory(100.0, returns, [1, 2])  # noqa
+
+    assert solve_irr(100.0, returns, [1, 2], 0.001).status == IrrStatus.failed  # noqa
+    assert approximate_irr(100.0, returns, [1, 2], 0.001) == newton_raphson_solver(fused, None, 0.001)  # noqa
+    assert approximate_irr(100.0, returns, [1, 2], 0.001) == pytest.approx(0.1, rel=1e-6)  # noqa
+
+
+def test_irr_cache_fingerprints():
+
+    fingerprint = IrrCache.fingerprint(1000.0, [400.0] * 360, range(30, 10830, 30), 1e-10)  # noqa
+
+    assert len(fingerprint) == 8 * (3 + 2 * 360)
+    # returns and return days are not mistaken for each other
+    assert IrrCache.fingerprint(1.0, [1.0, 2.0], [3], 0.1) != IrrCache.fingerprint(1.0, [1.0], [2.0, 3], 0.1)  # noqa
+
+    # a cache with no room always solves the IRR
+    cache = IrrCache(maxsize=0)
+
+    for _ in range(2):
+        assert cache.solve_irr(1000.0, [400.0] * 3, [30, 60, 90], 0.001).iterations > 0  # noqa
+
+    assert cache.cache_info() == (0, 2, 2, 0, 0)
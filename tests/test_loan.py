@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from datetime import date
@@ -42,3 +44,53 @@ def test_proper_interest_rate_conversion_on_loan_initialization():
     assert Loan(*args_, year_size=YearSizeType.banker).daily_interest_rate == pytest.approx(0.0011269264719548922)  # noqa
     # (1 + 0.5) ** (1 / 365) - 1 ~ 0.0011114805470662237
     assert Loan(*args_, year_size=YearSizeType.commercial).daily_interest_rate == pytest.approx(0.0011114805470662237)  # noqa
+
+
+def test_loan_to_numpy_is_a_view_over_the_schedule_buffer():
+
+    np = pytest.importorskip('numpy')
+
+    loan = Loan(*args_)
+    array_ = loan.to_numpy()
+
+    assert array_.shape == (5, 4)
+    assert list(array_[:, 0]) == pytest.approx(loan.balance)
+    assert list(array_[1:, 3]) == pytest.approx(loan.due_payments)
+    assert np.shares_memory(
+        array_, np.frombuffer(loan.amortization_schedule.to_array())
+    )
+
+
+def test_loan_to_frame():
+
+    pytest.importorskip('pandas')
+
+    loan = Loan(*args_)
+    frame = loan.to_frame()
+
+    assert list(frame.index) == [args_[2]] + args_[3]
+    assert list(frame['amortizations'][1:]) == pytest.approx(loan.amortizations)  # noqa
+
+
+def test_loan_iter_rows():
+
+    loan = Loan(*args_, grace_period=0)
+    rows = list(loan.iter_rows(date(2019, 12, 31)))
+
+    assert [row[0] for row in rows] == args_[3]
+    assert [row[1] for row in rows] == [2, 3, 4, 5]
+    assert [row[5] for row in rows] == pytest.approx(loan.due_payments)
+
+
+def test_loan_is_pickled_after_its_columns_are_read():
+
+    loan = Loan(*args_)
+    due_payments = loan.due_payments
+
+    assert pickle.loads(pickle.dumps(loan)).due_payments == due_payments
+
+
+def test_loan_rejects_amortization_weights_of_other_schedules():
+
+    with pytest.raises(ValueError):
+        Loan(*args_, amortization_weights=[0.25, 0.25, 0.25, 0.25])
@@ -0,0 +1,80 @@
+from datetime import date
+
+import pytest
+
+from loan_calculator.grossup.iof import IofGrossup
+from loan_calculator.loan import Loan
+from loan_calculator.ordinals import to_date, to_ordinal, to_ordinals
+from loan_calculator.projection import Projection
+
+
+start_date = date(2020, 1, 1)
+return_dates = [date(2020, 2, 1), date(2020, 3, 1), date(2020, 4, 1)]
+
+
+def test_to_ordinal():
+
+    assert to_ordinal(date(2020, 1, 1)) == 737425
+    assert to_ordinal(737425) == 737425
+    assert to_date(737425) == date(2020, 1, 1)
+    assert to_ordinals(return_dates) == [d.toordinal() for d in return_dates]
+
+
+def test_datetime64_to_ordinals():
+
+    np = pytest.importorskip('numpy')
+
+    assert to_ordinal(np.datetime64('2020-01-01')) == 737425
+    assert to_ordinals(np.array(return_dates, dtype='datetime64[D]')) == [
+        d.toordinal() for d in return_dates
+    ]
+    assert to_ordinals(np.array([1, 2])) == [1, 2]
+
+
+def test_loan_from_ordinals_and_day_offsets():
+
+    loan = Loan(1000.0, 0.5, start_date, return_dates, grace_period=3)
+
+    from_ordinals = Loan(
+        1000.0,
+        0.5,
+        start_date.toordinal(),
+        [d.toordinal() for d in return_dates],
+        grace_period=3,
+    )
+    from_offsets = Loan(
+        1000.0, 0.5, 0, [(d - start_date).days for d in return_dates],
+        grace_period=3,
+    )
+
+    assert from_ordinals.return_days == loan.return_days
+    assert from_offsets.return_days == loan.return_days
+    assert from_offsets.due_payments == pytest.approx(loan.due_payments)
+
+    with pytest.raises(ValueError):
+        Loan(1000.0, 0.5, 0, [31, 60], grace_period=31)
+
+
+def test_grossup_and_projection_with_datetime64():
+
+    np = pytest.importorskip('numpy')
+
+    loan = Loan(1000.0, 0.5, start_date, return_dates)
+    loan64 = Loan(
+        1000.0,
+        0.5,
+        np.datetime64(start_date),
+        np.array(return_dates, dtype='datetime64[D]'),
+    )
+
+    grossup = IofGrossup(loan, date(2020, 1, 10))
+    grossup64 = IofGrossup(loan64, np.datetime64('2020-01-10'))
+
+    assert grossup64.grossed_up_principal == pytest.approx(grossup.grossed_up_principal)  # noqa
+    assert grossup64.irr == pytest.approx(grossup.irr)
+
+    projection = Projection(
+        loan64, np.array(['2020-01-05', '2020-01-10'], dtype='datetime64[D]')
+    )
+
+    assert list(projection.projected_irrs)[1] == pytest.approx(grossup.irr)
@@ -0,0 +1,119 @@
+from datetime import date
+
+import pytest
+
+from loan_calculator.loan import Loan
+from loan_calculator.prepayment import ReamortizationType
+from loan_calculator.schedule.base import AmortizationScheduleType
+
+
+return_dates = [
+    date(2020, 2, 1), date(2020, 3, 1), date(2020, 4, 1),
+    date(2020, 5, 1), date(2020, 6, 1), date(2020, 7, 1),
+]
+
+
+def build_loan(amortization_schedule_type):
+    return Loan(
+        6000.0,
+        0.3,
+        date(2020, 1, 1),
+        return_dates,
+        amortization_schedule_type=amortization_schedule_type
+    )
+
+
+@pytest.mark.parametrize(
+    'amortization_schedule_type', list(AmortizationScheduleType)
+)
+def test_prepayment_keeping_term(amortization_schedule_type):
+
+    loan = build_loan(amortization_schedule_type)
+    prepayment = loan.prepay(date(2020, 3, 15), 1000.0)
+
+    assert prepayment.num_paid_instalments == 2
+    assert prepayment.due_payments[:2] == loan.due_payments[:2]
+    assert prepayment.return_dates == return_dates
+
+    # the remaining balance is paid off by the remaining instalments
+    assert prepayment.remaining_schedule.total_amortization == pytest.approx(prepayment.outstanding_balance - 1000.0)  # noqa
+    assert prepayment.remaining_schedule.balance[-1] == pytest.approx(0.0, abs=1e-9)  # noqa
+    assert max(prepayment.due_payments[2:]) < max(loan.due_payments[2:])
+
+
+def test_prepayment_outstanding_balance_is_capitalized():
+
+    loan = build_loan(AmortizationScheduleType.regressive_price_schedule)
+    prepayment = loan.prepay(date(2020, 3, 15), 1000.0)
+
+    assert prepayment.outstanding_balance == pytest.approx(
+        loan.balance[2] * (1 + loan.daily_interest_rate) ** 14
+    )
+
+
+def test_prepayment_during_grace_period():
+
+    loan = Loan(
+        1000.0, 0.3, date(2020, 1, 1), return_dates, grace_period=30
+    )
+    prepayment = loan.prepay(date(2020, 1, 10), 100.0)
+
+    assert prepayment.outstanding_balance == pytest.approx(1000.0)
+    assert prepayment.remaining_schedule.return_days == loan.return_days
+    assert prepayment.remaining_schedule.total_interest == pytest.approx(0.9 * loan.total_interest)  # noqa
+
+
+def test_price_prepayment_keeping_pmt():
+
+    loan = build_loan(AmortizationScheduleType.progressive_price_schedule)
+    prepayment = loan.prepay(
+        date(2020, 3, 15), 2000.0, ReamortizationType.keep_pmt.value
+    )
+
+    remaining = prepayment.remaining_schedule
+
+    assert len(remaining.return_days) == 3
+    assert remaining.pmt <= loan.amortization_schedule.pmt
+    assert prepayment.return_dates == return_dates[:5]
+
+
+def test_constant_amortization_prepayment_keeping_pmt():
+
+    loan = build_loan(AmortizationScheduleType.constant_amortization_schedule)
+    prepayment = loan.prepay(date(2020, 3, 1), 1000.0, 'keep-pmt')
+
+    assert len(prepayment.remaining_schedule.return_days) == 3
+    assert prepayment.remaining_schedule.amortizations == pytest.approx(3 * [1000.0])  # noqa
+
+
+def test_prepayment_validation():
+
+    loan = build_loan(AmortizationScheduleType.progressive_price_schedule)
+
+    with pytest.raises(ValueError):
+        loan.prepay(date(2020, 3, 15), 0.0)
+
+    with pytest.raises(ValueError):
+        loan.prepay(date(2020, 3, 15), 6000.0)
+
+    with pytest.raises(ValueError):
+        loan.prepay(date(2020, 7, 1), 10.0)
+
+
+def test_custom_amortization_prepayment():
+
+    loan = Loan(
+        6000.0,
+        0.3,
+        date(2020, 1, 1),
+        return_dates,
+        amortization_schedule_type='custom-amortization-schedule',
+        amortization_weights=[0.1, 0.1, 0.1, 0.1, 0.1, 0.5],
+    )
+    prepayment = loan.prepay(date(2020, 3, 1), 1200.0)
+
+    assert prepayment.remaining_schedule.amortization_weights == pytest.approx([1.0 / 8] * 3 + [5.0 / 8])  # noqa
+    assert prepayment.remaining_schedule.total_amortization == pytest.approx(prepayment.outstanding_balance - 1200.0)  # noqa
+
+    with pytest.raises(ValueError):
+        loan.prepay(date(2020, 3, 1), 1200.0, 'keep-pmt')
@@ -1,5 +1,10 @@
+from datetime import date, timedelta
+
 import pytest
 
+from loan_calculator.grossup.iof import IofGrossup
+from loan_calculator.irr import IrrCache, IrrStatus
+from loan_calculator.loan import Loan
 from loan_calculator.projection import Projection
 
 
@@ -8,3 +13,58 @@ def test_exception_raising_on_unknown_grossup_type(loan):
     with pytest.raises(ValueError):
 
         Projection(loan, [loan.start_date], grossup_type='unknown')
+
+
+def test_warm_started_projected_irrs():
+
+    loan = Loan(
+        1000.0,
+        0.3,
+        date(2020, 1, 1),
+        [date(2020 + (m // 12), m % 12 + 1, 1) for m in range(2, 14)],
+    )
+    # unordered projection dates
+    projection_dates = [
+        date(2020, 1, 1) + timedelta(i) for i in range(59, -1, -1)
+    ]
+
+    # caches with no room, so that every IRR is solved
+    projection = Projection(
+        loan, projection_dates, irr_cache=IrrCache(maxsize=0)
+    )
+
+    cold_results = [
+        IofGrossup(loan, reference_date).solve_irr(
+            irr_cache=IrrCache(maxsize=0)
+        )
+        for reference_date in projection_dates
+    ]
+
+    assert list(projection.projected_irrs) == pytest.approx([r.root for r in cold_results])  # noqa
+    assert all(r.status == IrrStatus.converged for r in projection.irr_results)  # noqa
+    assert sum(projection.projected_irr_iterations) < sum(r.iterations for r in cold_results)  # noqa
+    # evaluations spent searching brackets are accounted for as well
+    assert sum(projection.projected_irr_evaluations) < sum(r.evaluations for r in cold_results)  # noqa
+    assert all(r.evaluations > r.iterations for r in projection.irr_results)  # noqa
+
+
+def test_cached_projected_irrs_report_no_iterations():
+
+    loan = Loan(
+        1000.0,
+        0.3,
+        date(2020, 1, 1),
+        [date(2020 + (m // 12), m % 12 + 1, 1) for m in range(2, 14)],
+    )
+    projection_dates = [date(2020, 1, 1) + timedelta(i) for i in range(10)]
+
+    irr_cache = IrrCache()
+
+    first = Projection(loan, projection_dates, irr_cache=irr_cache)
+    second = Projection(loan, projection_dates, irr_cache=irr_cache)
+
+    assert sum(first.projected_irr_iterations) > 0
+    assert list(second.projected_irrs) == list(first.projected_irrs)
+    assert sum(second.projected_irr_iterations) == 0
+    assert sum(second.projected_irr_evaluations) == 0
+    assert irr_cache.cache_info().hits == 10
@@ -0,0 +1,63 @@
+from datetime import date
+
+import pytest
+
+from loan_calculator.grossup.iof import IofGrossup
+from loan_calculator.loan import Loan
+from loan_calculator.quote import Quote, QUOTE_SCHEDULE_TYPES
+
+
+return_dates = [date(2020, 2, 1), date(2020, 3, 1), date(2020, 4, 1)]
+
+
+@pytest.mark.parametrize('reference_date', [
+    date(2020, 1, 1), date(2020, 1, 10)
+])
+def test_quote_matches_loans_and_grossups(reference_date):
+
+    quote = Quote(
+        1000.0,
+        0.3,
+        date(2020, 1, 1),
+        return_dates,
+        reference_date=reference_date,
+        service_fee_aliquot=0.01,
+    )
+
+    assert len(quote.quotes) == len(QUOTE_SCHEDULE_TYPES)
+
+    for schedule_type in QUOTE_SCHEDULE_TYPES:
+
+        loan = Loan(
+            1000.0,
+            0.3,
+            date(2020, 1, 1),
+            return_dates,
+            amortization_schedule_type=schedule_type,
+        )
+        iof_grossup = IofGrossup(
+            loan, reference_date, service_fee_aliquot=0.01
+        )
+
+        schedule_quote = quote[schedule_type.value]
+
+        assert schedule_quote.schedule.due_payments == pytest.approx(loan.due_payments)  # noqa
+        assert schedule_quote.grossed_up_principal == pytest.approx(iof_grossup.grossed_up_principal)  # noqa
+        assert schedule_quote.grossed_up_schedule.due_payments == pytest.approx(iof_grossup.grossed_up_loan.due_payments)  # noqa
+        assert schedule_quote.irr == pytest.approx(iof_grossup.irr)
+
+
+def test_quote_of_selected_schedule_types_and_validation():
+
+    quote = Quote(
+        1000.0,
+        0.3,
+        date(2020, 1, 1),
+        return_dates,
+        schedule_types=['constant-amortization-schedule'],
+    )
+
+    assert list(quote.quotes) == [quote['constant-amortization-schedule'].schedule.schedule_type]  # noqa
+
+    with pytest.raises(ValueError):
+        Quote(1000.0, 0.3, date(2020, 1, 1), return_dates, grace_period=31)
@@ -0,0 +1,66 @@
+import pytest
+
+from loan_calculator.grossup.functions import br_iof_progressive_price_grossup
+from loan_calculator.pmt import constant_return_pmt
+from loan_calculator.term import TermSolver
+
+
+return_days = [30 * i for i in range(1, 25)]
+
+
+def test_term_solver_pmt_matches_constant_return_pmt():
+
+    solver = TermSolver(1000.0, 0.001, return_days)
+
+    for m in range(1, len(return_days) + 1):
+        assert solver.pmt(m) == pytest.approx(constant_return_pmt(1000.0, 0.001, return_days[:m]))  # noqa
+
+
+def test_minimal_and_maximal_terms():
+
+    solver = TermSolver(1000.0, 0.001, return_days)
+
+    m = solver.minimal_term(100.0)
+
+    assert solver.pmt(m) <= 100.0 < solver.pmt(m - 1)
+
+    m = solver.maximal_term(100.0)
+
+    assert solver.pmt(m) >= 100.0 > solver.pmt(m + 1)
+
+    assert solver.minimal_term(1.0) is None
+    assert solver.maximal_term(2000.0) is None
+    assert solver.minimal_term(2000.0) == 1
+    assert solver.maximal_term(1.0) == len(return_days)
+
+
+def test_grossup_aware_term_solver():
+
+    solver = TermSolver(
+        1000.0,
+        0.001,
+        return_days,
+        daily_iof_aliquot=0.000082,
+        complementary_iof_aliquot=0.0038,
+        service_fee_aliquot=0.01,
+    )
+
+    for m in (1, 12, 24):
+        grossed_up_principal = br_iof_progressive_price_grossup(
+            1000.0, 0.001, 0.000082, 0.0038, return_days[:m], 0.01
+        )
+        assert solver.grossed_up_principal(m) == pytest.approx(grossed_up_principal)  # noqa
+        assert solver.pmt(m) == pytest.approx(constant_return_pmt(grossed_up_principal, 0.001, return_days[:m]))  # noqa
+
+    m = solver.minimal_term(100.0)
+
+    assert solver.pmt(m) <= 100.0 < solver.pmt(m - 1)
+
+
+def test_term_solver_validation():
+
+    with pytest.raises(ValueError):
+        TermSolver(1000.0, 0.001, [60, 30])
+
+    with pytest.raises(ValueError):
+        TermSolver(1000.0, 0.001, [30], daily_iof_aliquot=0.0001, service_fee_aliquot=0.99)  # noqa